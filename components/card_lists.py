@@ -0,0 +1,25 @@
+import streamlit as st
+from html import escape
+
+def render_card_html(card_template, card):
+    """Fill a precompiled string.Template with one card's values
+
+    Values are HTML-escaped, except keys ending in '_html', which carry markup
+    built by the caller (images, placeholders) and are inserted as is.
+    """
+    return card_template.substitute({
+        key: value if key.endswith('_html') else escape(str(value))
+        for key, value in card.items()
+    })
+
+def render_card_list(card_template, cards, stylesheet="", container_class=""):
+    """Render a whole list of cards as a single HTML element
+
+    The stylesheet is shared by every card and sent once, and all cards go to
+    the browser in one st.markdown call instead of several calls per card.
+    """
+    body = "".join(render_card_html(card_template, card) for card in cards)
+    style = f"<style>{stylesheet}</style>" if stylesheet else ""
+    if container_class:
+        body = f'<div class="{container_class}">{body}</div>'
+    st.markdown(style + body, unsafe_allow_html=True)
@@ -7,6 +7,79 @@ import numpy as np
 from PIL import Image
 import os
 from styles.css_styles import apply_heritage_chapter_background
+from utils.figure_cache import cached_figure
+from .html_templates import compile_panel, show_panel
+from .monument_index import enrich_unesco_visitors
+
+# Chapter banner with the UNESCO headline numbers
+CHAPTER_HERO = compile_panel("""
+<div style="background: linear-gradient(135deg, #8B4513, #D2691E, #CD853F); padding: 3rem; border-radius: 25px; margin: 2rem 0; text-align: center; box-shadow: 0 15px 35px rgba(139,69,19,0.3); position: relative; overflow: hidden;">
+    <div style="position: absolute; top: 0; left: 0; right: 0; bottom: 0; opacity: 0.3;"></div>
+    <div style="position: relative; z-index: 1;">
+        <h1 style="color: white; font-size: 3.5rem; margin-bottom: 1rem; text-shadow: 3px 3px 6px rgba(0,0,0,0.4); font-family: 'Georgia', serif; animation: fadeInUp 1s ease-out;">
+            🏛️ Chapter 1: The Heritage Heartbeat
+        </h1>
+        <p style="color: rgba(255,255,255,0.95); font-size: 1.4rem; margin: 1rem 0; line-height: 1.6; text-shadow: 1px 1px 3px rgba(0,0,0,0.3);">
+            Where Ancient Stones Tell Timeless Stories - India's UNESCO Legacy & Monument Magnificence
+        </p>
+        <div style="display: flex; justify-content: center; gap: 3rem; margin-top: 2rem; flex-wrap: wrap;">
+            <div style="text-align: center;">
+                <div style="font-size: 2.5rem; font-weight: bold; color: #FFD700;">$total_unesco_sites</div>
+                <div style="font-size: 1rem; color: rgba(255,255,255,0.9);">UNESCO Sites</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="font-size: 2.5rem; font-weight: bold; color: #98FB98;">$heritage_span+</div>
+                <div style="font-size: 1rem; color: rgba(255,255,255,0.9);">Years of Recognition</div>
+            </div>
+            <div style="text-align: center;">
+                <div style="font-size: 2.5rem; font-weight: bold; color: #FFE4B5;">5000+</div>
+                <div style="font-size: 1rem; color: rgba(255,255,255,0.9);">Years of Heritage</div>
+            </div>
+        </div>
+    </div>
+</div>
+""")
+
+# Stand-in for a UNESCO card image that is missing or fails to load
+SITE_IMAGE_PLACEHOLDER = compile_panel("""
+<div style="background: linear-gradient(135deg, #8B4513, #D2691E); color: white; padding: 4rem 2rem; text-align: center; height: 200px; display: flex; flex-direction: column; justify-content: center; align-items: center;">
+    <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🏛️</div>
+    <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">$site_name</div>
+</div>
+""")
+
+# Lower half of a UNESCO card: closes the image wrapper, then name, location, visitors and description
+SITE_CARD_BODY = compile_panel("""
+    </div>
+    <div style="padding: 1rem;">
+        <h2 style="color: #8B4513; font-family: 'Playfair Display', serif; font-size: 1.3rem;
+                   margin-bottom: 0.5rem; font-weight: bold; text-align: center;">
+            🏛️ $site_name
+        </h2>
+        <div style="margin-bottom: 0.8rem;">
+            <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.3rem;">
+                <span style="font-size: 1rem; width: 20px;">📍</span>
+                <span style="color: #D2691E; font-weight: bold; font-size: 0.9rem;">$location</span>
+            </div>
+        </div>
+        <div style="background: rgba(139,69,19,0.1); padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
+            <div style="display: flex; justify-content: space-between; text-align: center;">
+                <div>
+                    <div style="font-size: 1.2rem; font-weight: bold; color: #8B4513;">$domestic_visitors</div>
+                    <div style="font-size: 0.8rem; color: #666;">Domestic (M)</div>
+                </div>
+                <div>
+                    <div style="font-size: 1.2rem; font-weight: bold; color: #D2691E;">$foreign_visitors</div>
+                    <div style="font-size: 0.8rem; color: #666;">Foreign (L)</div>
+                </div>
+            </div>
+        </div>
+        <div style="color: #333; line-height: 1.6; font-family: 'Poppins', sans-serif; font-size: 0.85rem;">
+            $description...
+        </div>
+    </div>
+</div>
+""")
 
 def get_site_description(site):
     """Get site description handling different possible column names"""
@@ -17,6 +90,74 @@ def get_site_description(site):
             break
     return description
 
+@cached_figure
+def build_domestic_share_chart(top_monuments_domestic_df):
+    """Build the donut of domestic visits across the top eight monuments"""
+    fig = go.Figure(data=[go.Pie(
+        labels=top_monuments_domestic_df['MONUMENT_NAME'][:8],
+        values=top_monuments_domestic_df['DOMESTIC_TOTAL_VISITS_MILLIONS'][:8],
+        hole=0.5,
+        marker=dict(
+            colors=['#FF6B35', '#F7931E', '#FFD23F', '#06FFA5', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'],
+            line=dict(color='#FFFFFF', width=2)
+        ),
+        textinfo='label+percent',
+        textfont=dict(size=10, color='black'),
+        hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}M<br>Share: %{percent}<extra></extra>'
+    )])
+
+    fig.update_layout(
+        title=dict(
+            text="🇮🇳 Domestic Visitor Distribution",
+            font=dict(size=16, color='#8B4513', family="Georgia"),
+            x=0.5,
+            xanchor='center'
+        ),
+        font=dict(color='#333', size=10),
+        height=400,
+        showlegend=False,
+        plot_bgcolor='rgba(139,69,19,0.1)',
+        paper_bgcolor='rgba(139,69,19,0.1)',
+        annotations=[dict(text='Domestic<br>Visitors', x=0.5, y=0.5, font_size=14, showarrow=False, font_color='#8B4513')]
+    )
+
+    return fig
+
+@cached_figure
+def build_foreign_share_chart(top_monuments_foreign_df):
+    """Build the donut of foreign visits across the top eight monuments"""
+    foreign_col = 'FOREIGN_TOTAL_VISITS_LAKHS' if 'FOREIGN_TOTAL_VISITS_LAKHS' in top_monuments_foreign_df.columns else 'FOREIGN_TOTAL_VISITS_THOUSANDS'
+
+    fig = go.Figure(data=[go.Pie(
+        labels=top_monuments_foreign_df['MONUMENT_NAME'][:8],
+        values=top_monuments_foreign_df[foreign_col][:8],
+        hole=0.5,
+        marker=dict(
+            colors=['#E17055', '#FDCB6E', '#6C5CE7', '#A29BFE', '#FD79A8', '#E84393', '#00B894', '#00CEC9'],
+            line=dict(color='#FFFFFF', width=2)
+        ),
+        textinfo='label+percent',
+        textfont=dict(size=10, color='black'),
+        hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}L<br>Share: %{percent}<extra></extra>'
+    )])
+
+    fig.update_layout(
+        title=dict(
+            text="🌍 International Visitor Distribution",
+            font=dict(size=16, color='#D2691E', family="Georgia"),
+            x=0.5,
+            xanchor='center'
+        ),
+        font=dict(color='#333', size=10),
+        height=400,
+        showlegend=False,
+        plot_bgcolor='rgba(139,69,19,0.1)',
+        paper_bgcolor='rgba(139,69,19,0.1)',
+        annotations=[dict(text='International<br>Visitors', x=0.5, y=0.5, font_size=14, showarrow=False, font_color='#D2691E')]
+    )
+
+    return fig
+
 def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_foreign_df,
                            centrally_protected_domestic_df, centrally_protected_foreign_df):
     """Chapter 1: The Heritage Heartbeat - Interactive UNESCO Sites and Monument Tourism Story"""
@@ -48,33 +189,7 @@ def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_
         heritage_span = 41
         latest_site_year = 2024
 
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, #8B4513, #D2691E, #CD853F); padding: 3rem; border-radius: 25px; margin: 2rem 0; text-align: center; box-shadow: 0 15px 35px rgba(139,69,19,0.3); position: relative; overflow: hidden;">
-        <div style="position: absolute; top: 0; left: 0; right: 0; bottom: 0; opacity: 0.3;"></div>
-        <div style="position: relative; z-index: 1;">
-            <h1 style="color: white; font-size: 3.5rem; margin-bottom: 1rem; text-shadow: 3px 3px 6px rgba(0,0,0,0.4); font-family: 'Georgia', serif; animation: fadeInUp 1s ease-out;">
-                🏛️ Chapter 1: The Heritage Heartbeat
-            </h1>
-            <p style="color: rgba(255,255,255,0.95); font-size: 1.4rem; margin: 1rem 0; line-height: 1.6; text-shadow: 1px 1px 3px rgba(0,0,0,0.3);">
-                Where Ancient Stones Tell Timeless Stories - India's UNESCO Legacy & Monument Magnificence
-            </p>
-            <div style="display: flex; justify-content: center; gap: 3rem; margin-top: 2rem; flex-wrap: wrap;">
-                <div style="text-align: center;">
-                    <div style="font-size: 2.5rem; font-weight: bold; color: #FFD700;">{total_unesco_sites}</div>
-                    <div style="font-size: 1rem; color: rgba(255,255,255,0.9);">UNESCO Sites</div>
-                </div>
-                <div style="text-align: center;">
-                    <div style="font-size: 2.5rem; font-weight: bold; color: #98FB98;">{heritage_span}+</div>
-                    <div style="font-size: 1rem; color: rgba(255,255,255,0.9);">Years of Recognition</div>
-                </div>
-                <div style="text-align: center;">
-                    <div style="font-size: 2.5rem; font-weight: bold; color: #FFE4B5;">5000+</div>
-                    <div style="font-size: 1rem; color: rgba(255,255,255,0.9);">Years of Heritage</div>
-                </div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    show_panel(CHAPTER_HERO, total_unesco_sites=total_unesco_sites, heritage_span=heritage_span)
 
     # Interactive Story Introduction
     st.markdown("""
@@ -96,27 +211,10 @@ def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_
 
     # Interactive UNESCO Sites Showcase
     if not unesco_df.empty:
-        # Create UNESCO sites with visitor data integration
-        unesco_with_visitors = unesco_df.copy()
-
-        # Map UNESCO sites to monument visitor data
-        unesco_monument_mapping = {
-            'Taj Mahal': 'Taj Mahal',
-            'Agra Fort': 'Agra Fort',
-            'Fatehpur Sikri': 'Fatehpur Sikri',
-            'Red Fort Complex': 'Red Fort',
-            'Qutb Minar and its Monuments': 'Qutub Minar',
-            'Humayun\'s Tomb': 'Humayun Tomb',
-            'Sun Temple': 'Sun Temple Konark',
-            'Monuments at Mahabalipuram': 'Group of Monuments Mamallapuram',
-            'Ellora Caves': 'Ellora Caves',
-            'Ajanta Caves': 'Ajanta Caves'
-        }
-
         # Determine the correct column names for UNESCO sites
         site_column = None
         for col in ['SITE', 'Site', 'site', 'NAME', 'name', 'SITE_NAME', 'site_name']:
-            if col in unesco_with_visitors.columns:
+            if col in unesco_df.columns:
                 site_column = col
                 break
 
@@ -124,59 +222,11 @@ def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_
             st.warning("Could not find site name column in UNESCO data. Expected columns: SITE, Site, site, NAME, name, SITE_NAME, site_name")
             return
 
-        # Add visitor data to UNESCO sites
-        if not top_monuments_domestic_df.empty:
-            for unesco_site, monument_name in unesco_monument_mapping.items():
-                domestic_match = top_monuments_domestic_df[
-                    top_monuments_domestic_df['MONUMENT_NAME'] == monument_name
-                ]
-                if not domestic_match.empty:
-                    unesco_with_visitors.loc[
-                        unesco_with_visitors[site_column] == unesco_site, 'Domestic_Visitors_Millions'
-                    ] = domestic_match['DOMESTIC_TOTAL_VISITS_MILLIONS'].iloc[0]
-
-        if not top_monuments_foreign_df.empty:
-            for unesco_site, monument_name in unesco_monument_mapping.items():
-                foreign_match = top_monuments_foreign_df[
-                    top_monuments_foreign_df['MONUMENT_NAME'] == monument_name
-                ]
-                if not foreign_match.empty:
-                    unesco_with_visitors.loc[
-                        unesco_with_visitors[site_column] == unesco_site, 'Foreign_Visitors_Lakhs'
-                    ] = foreign_match['FOREIGN_TOTAL_VISITS_LAKHS'].iloc[0]
-
-        # Fill NaN values from centrally protected monuments data
-        if not centrally_protected_domestic_df.empty and not centrally_protected_foreign_df.empty:
-            for idx, site in unesco_with_visitors.iterrows():
-                site_name = site[site_column]
-
-                # Check if domestic visitors is NaN and try to get from centrally protected data
-                if pd.isna(site.get('Domestic_Visitors_Millions')):
-                    monument_name = unesco_monument_mapping.get(site_name)
-                    if monument_name:
-                        # Look for the monument in centrally protected data
-                        domestic_match = centrally_protected_domestic_df[
-                            centrally_protected_domestic_df['MONUMENT'].str.contains(monument_name, case=False, na=False)
-                        ]
-                        if not domestic_match.empty:
-                            # Use latest year data (2023-24) and convert to millions
-                            latest_visits = domestic_match['YEAR_2023_24'].iloc[0]
-                            if pd.notna(latest_visits):
-                                unesco_with_visitors.loc[idx, 'Domestic_Visitors_Millions'] = latest_visits / 1000000
-
-                # Check if foreign visitors is NaN and try to get from centrally protected data
-                if pd.isna(site.get('Foreign_Visitors_Lakhs')):
-                    monument_name = unesco_monument_mapping.get(site_name)
-                    if monument_name:
-                        # Look for the monument in centrally protected data
-                        foreign_match = centrally_protected_foreign_df[
-                            centrally_protected_foreign_df['MONUMENT'].str.contains(monument_name, case=False, na=False)
-                        ]
-                        if not foreign_match.empty:
-                            # Use latest year data (2023-24) and convert to lakhs
-                            latest_visits = foreign_match['YEAR_2023_24'].iloc[0]
-                            if pd.notna(latest_visits):
-                                unesco_with_visitors.loc[idx, 'Foreign_Visitors_Lakhs'] = latest_visits / 100000
+        # Add visitor data to UNESCO sites, filling gaps from the centrally protected monuments
+        unesco_with_visitors = enrich_unesco_visitors(
+            unesco_df, site_column, top_monuments_domestic_df, top_monuments_foreign_df,
+            centrally_protected_domestic_df, centrally_protected_foreign_df
+        )
 
         # Interactive UNESCO Site Cards
         st.markdown("""
@@ -234,69 +284,11 @@ def show_heritage_heartbeat(unesco_df, top_monuments_domestic_df, top_monuments_
 
         with col1:
             # Domestic Visitors - Donut Chart
-            fig_domestic = go.Figure(data=[go.Pie(
-                labels=top_monuments_domestic_df['MONUMENT_NAME'][:8],
-                values=top_monuments_domestic_df['DOMESTIC_TOTAL_VISITS_MILLIONS'][:8],
-                hole=0.5,
-                marker=dict(
-                    colors=['#FF6B35', '#F7931E', '#FFD23F', '#06FFA5', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7'],
-                    line=dict(color='#FFFFFF', width=2)
-                ),
-                textinfo='label+percent',
-                textfont=dict(size=10, color='black'),
-                hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}M<br>Share: %{percent}<extra></extra>'
-            )])
-
-            fig_domestic.update_layout(
-                title=dict(
-                    text="🇮🇳 Domestic Visitor Distribution",
-                    font=dict(size=16, color='#8B4513', family="Georgia"),
-                    x=0.5,
-                    xanchor='center'
-                ),
-                font=dict(color='#333', size=10),
-                height=400,
-                showlegend=False,
-                plot_bgcolor='rgba(139,69,19,0.1)',
-                paper_bgcolor='rgba(139,69,19,0.1)',
-                annotations=[dict(text='Domestic<br>Visitors', x=0.5, y=0.5, font_size=14, showarrow=False, font_color='#8B4513')]
-            )
-
-            st.plotly_chart(fig_domestic, use_container_width=True)
+            st.plotly_chart(build_domestic_share_chart(top_monuments_domestic_df), use_container_width=True)
 
         with col2:
             # Foreign Visitors - Sunburst Chart
-            foreign_col = 'FOREIGN_TOTAL_VISITS_LAKHS' if 'FOREIGN_TOTAL_VISITS_LAKHS' in top_monuments_foreign_df.columns else 'FOREIGN_TOTAL_VISITS_THOUSANDS'
-
-            fig_foreign = go.Figure(data=[go.Pie(
-                labels=top_monuments_foreign_df['MONUMENT_NAME'][:8],
-                values=top_monuments_foreign_df[foreign_col][:8],
-                hole=0.5,
-                marker=dict(
-                    colors=['#E17055', '#FDCB6E', '#6C5CE7', '#A29BFE', '#FD79A8', '#E84393', '#00B894', '#00CEC9'],
-                    line=dict(color='#FFFFFF', width=2)
-                ),
-                textinfo='label+percent',
-                textfont=dict(size=10, color='black'),
-                hovertemplate='<b>%{label}</b><br>Visitors: %{value:.1f}L<br>Share: %{percent}<extra></extra>'
-            )])
-
-            fig_foreign.update_layout(
-                title=dict(
-                    text="🌍 International Visitor Distribution",
-                    font=dict(size=16, color='#D2691E', family="Georgia"),
-                    x=0.5,
-                    xanchor='center'
-                ),
-                font=dict(color='#333', size=10),
-                height=400,
-                showlegend=False,
-                plot_bgcolor='rgba(139,69,19,0.1)',
-                paper_bgcolor='rgba(139,69,19,0.1)',
-                annotations=[dict(text='International<br>Visitors', x=0.5, y=0.5, font_size=14, showarrow=False, font_color='#D2691E')]
-            )
-
-            st.plotly_chart(fig_foreign, use_container_width=True)
+            st.plotly_chart(build_foreign_share_chart(top_monuments_foreign_df), use_container_width=True)
 
         # Add insights below the charts
         st.markdown("""
@@ -405,50 +397,13 @@ def display_unesco_heritage_card(site):
             st.image(image, use_container_width=True)
         else:
             # Fallback with gradient background
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #8B4513, #D2691E); color: white; padding: 4rem 2rem; text-align: center; height: 200px; display: flex; flex-direction: column; justify-content: center; align-items: center;">
-                <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🏛️</div>
-                <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{site_name}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(SITE_IMAGE_PLACEHOLDER, site_name=site_name)
     except Exception:
         # Exception fallback
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #8B4513, #D2691E); color: white; padding: 4rem 2rem; text-align: center; height: 200px; display: flex; flex-direction: column; justify-content: center; align-items: center;">
-            <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🏛️</div>
-            <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{site_name}</div>
-        </div>
-        """, unsafe_allow_html=True)
+        show_panel(SITE_IMAGE_PLACEHOLDER, site_name=site_name)
 
     # Card content in festival style
-    st.markdown(f"""
-        </div>
-        <div style="padding: 1rem;">
-            <h2 style="color: #8B4513; font-family: 'Playfair Display', serif; font-size: 1.3rem;
-                       margin-bottom: 0.5rem; font-weight: bold; text-align: center;">
-                🏛️ {site_name}
-            </h2>
-            <div style="margin-bottom: 0.8rem;">
-                <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.3rem;">
-                    <span style="font-size: 1rem; width: 20px;">📍</span>
-                    <span style="color: #D2691E; font-weight: bold; font-size: 0.9rem;">{location}</span>
-                </div>
-            </div>
-            <div style="background: rgba(139,69,19,0.1); padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
-                <div style="display: flex; justify-content: space-between; text-align: center;">
-                    <div>
-                        <div style="font-size: 1.2rem; font-weight: bold; color: #8B4513;">{domestic_visitors if domestic_visitors != 'N/A' else '—'}</div>
-                        <div style="font-size: 0.8rem; color: #666;">Domestic (M)</div>
-                    </div>
-                    <div>
-                        <div style="font-size: 1.2rem; font-weight: bold; color: #D2691E;">{foreign_visitors if foreign_visitors != 'N/A' else '—'}</div>
-                        <div style="font-size: 0.8rem; color: #666;">Foreign (L)</div>
-                    </div>
-                </div>
-            </div>
-            <div style="color: #333; line-height: 1.6; font-family: 'Poppins', sans-serif; font-size: 0.85rem;">
-                {get_site_description(site)[:120]}...
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    show_panel(SITE_CARD_BODY, site_name=site_name, location=location,
+               domestic_visitors=domestic_visitors if domestic_visitors != 'N/A' else '—',
+               foreign_visitors=foreign_visitors if foreign_visitors != 'N/A' else '—',
+               description=get_site_description(site)[:120])
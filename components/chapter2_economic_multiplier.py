@@ -5,6 +5,388 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from styles.css_styles import apply_economic_chapter_background
+from utils.figure_cache import cached_figure
+from .html_templates import BADGE_TILE, STAT_TILE, show_panel
+
+@cached_figure
+def build_gdp_share_chart(tourism_gdp_df):
+    """Build the direct vs total GDP contribution lines"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=tourism_gdp_df['YEAR'],
+        y=tourism_gdp_df['DIRECT_CONTRIBUTION_GDP_PERCENT'],
+        mode='lines+markers',
+        name='Direct Contribution',
+        line=dict(color='#2E8B57', width=4),
+        marker=dict(size=10, color='#2E8B57'),
+        hovertemplate='<b>Direct GDP:</b> %{y:.2f}%<br><b>Year:</b> %{x}<extra></extra>'
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=tourism_gdp_df['YEAR'],
+        y=tourism_gdp_df['TOTAL_CONTRIBUTION_GDP_PERCENT'],
+        mode='lines+markers',
+        name='Total Impact (with Multiplier)',
+        line=dict(color='#90EE90', width=4),
+        marker=dict(size=10, color='#90EE90'),
+        hovertemplate='<b>Total GDP:</b> %{y:.2f}%<br><b>Year:</b> %{x}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=dict(
+            text="📊 Tourism's GDP Contribution: Direct vs Total Impact",
+            font=dict(size=16, color='#2E8B57'),
+            x=0.5,
+            xanchor='center'
+        ),
+        xaxis=dict(
+            title=dict(text="Year", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        yaxis=dict(
+            title=dict(text="GDP Contribution (%)", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#333'),
+        height=400,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(color='black'))
+    )
+
+    return fig
+
+@cached_figure
+def build_direct_gdp_chart(tourism_gdp_df):
+    """Build the area chart of direct tourism GDP in crores"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=tourism_gdp_df['YEAR'],
+        y=tourism_gdp_df['TOURISM_DIRECT_GDP_CRORE'],
+        mode='lines+markers',
+        name='Direct GDP (₹ Crores)',
+        line=dict(color='#2E8B57', width=4),
+        marker=dict(size=12, color='#3CB371', line=dict(width=2, color='white')),
+        fill='tozeroy',
+        fillcolor='rgba(46,139,87,0.3)',
+        hovertemplate='<b>Direct GDP:</b> ₹%{y:,.0f} crores<br><b>Year:</b> %{x}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=dict(
+            text="💰 Tourism's Direct GDP Growth Journey",
+            font=dict(size=16, color='#2E8B57'),
+            x=0.5,
+            xanchor='center'
+        ),
+        xaxis=dict(
+            title=dict(text="Year", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        yaxis=dict(
+            title=dict(text="GDP Value (₹ Crores)", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#333'),
+        height=400,
+        showlegend=False
+    )
+
+    return fig
+
+@cached_figure
+def build_employment_breakdown_chart(tourism_employment_df):
+    """Build the direct and indirect employment areas"""
+    fig = go.Figure()
+
+    # Calculate indirect employment
+    indirect_employment = (tourism_employment_df['DIRECT_INDIRECT_EMPLOYMENT_MILLION'] -
+                         tourism_employment_df['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION'])
+
+    fig.add_trace(go.Scatter(
+        x=tourism_employment_df['YEAR'],
+        y=tourism_employment_df['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION'],
+        mode='lines+markers',
+        name='Direct Employment',
+        line=dict(color='#2E8B57', width=3),
+        marker=dict(size=10, color='#2E8B57'),
+        fill='tozeroy',
+        fillcolor='rgba(46,139,87,0.4)',
+        hovertemplate='<b>Direct:</b> %{y:.1f}M jobs<br><b>Year:</b> %{x}<extra></extra>'
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=tourism_employment_df['YEAR'],
+        y=indirect_employment,
+        mode='lines+markers',
+        name='Indirect Employment',
+        line=dict(color='#90EE90', width=3),
+        marker=dict(size=10, color='#90EE90'),
+        fill='tonexty',
+        fillcolor='rgba(144,238,144,0.4)',
+        hovertemplate='<b>Indirect:</b> %{y:.1f}M jobs<br><b>Year:</b> %{x}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=dict(
+            text="👥 Employment Breakdown: Direct vs Indirect",
+            font=dict(size=16, color='#2E8B57'),
+            x=0.5,
+            xanchor='center'
+        ),
+        xaxis=dict(
+            title=dict(text="Year", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        yaxis=dict(
+            title=dict(text="Employment (Millions)", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#333'),
+        height=400,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(color='black'))
+    )
+
+    return fig
+
+@cached_figure
+def build_employment_share_chart(tourism_employment_df):
+    """Build the donut of direct vs indirect jobs in the latest year"""
+    latest_emp_data = tourism_employment_df.iloc[-1]
+    direct_emp = latest_emp_data['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION']
+    total_emp = latest_emp_data['DIRECT_INDIRECT_EMPLOYMENT_MILLION']
+    indirect_emp = total_emp - direct_emp
+
+    fig = go.Figure(data=[go.Pie(
+        labels=['Direct Employment', 'Indirect Employment'],
+        values=[direct_emp, indirect_emp],
+        hole=0.6,
+        marker_colors=['#2E8B57', '#90EE90'],
+        textinfo='label+percent',
+        textposition='outside',
+        hovertemplate='<b>%{label}</b><br>%{value:.1f}M jobs<br>%{percent}<extra></extra>'
+    )])
+
+    fig.update_layout(
+        title=dict(
+            text=f"🎯 Employment Distribution ({latest_emp_data['YEAR']})",
+            font=dict(size=16, color='#2E8B57'),
+            x=0.5,
+            xanchor='center'
+        ),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#333'),
+        height=400,
+        showlegend=True,
+        legend=dict(font=dict(color='black')),
+        annotations=[dict(text=f'{total_emp:.1f}M<br>Total Jobs', x=0.5, y=0.5,
+                        font_size=20, showarrow=False, font_color='#2E8B57')]
+    )
+
+    return fig
+
+@cached_figure
+def build_revenue_chart(fee_earnings_df):
+    """Build the revenue bars, red for years that shrank"""
+    fig = go.Figure()
+
+    # Calculate year-over-year growth
+    revenue_growth = fee_earnings_df['FEE_CRORE'].pct_change() * 100
+
+    # Create bar chart with color coding for growth
+    colors = ['#FF6B6B' if x < 0 else '#2E8B57' for x in revenue_growth]
+
+    fig.add_trace(go.Bar(
+        x=fee_earnings_df['YEAR'],
+        y=fee_earnings_df['FEE_CRORE'],
+        name='Revenue (₹ Crores)',
+        marker_color=colors,
+        text=[f"₹{x:,.0f}" for x in fee_earnings_df['FEE_CRORE']],
+        textposition='outside',
+        hovertemplate='<b>Revenue:</b> ₹%{y:,.0f} crores<br><b>Year:</b> %{x}<br><b>Growth:</b> %{customdata:.1f}%<extra></extra>',
+        customdata=revenue_growth.fillna(0)
+    ))
+
+    fig.update_layout(
+        title=dict(
+            text="💰 Tourism Revenue: Growth Trajectory",
+            font=dict(size=16, color='#2E8B57'),
+            x=0.5
+        ),
+        xaxis=dict(
+            title=dict(text="Year", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        yaxis=dict(
+            title=dict(text="Revenue (₹ Crores)", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#333'),
+        height=400,
+        showlegend=False
+    )
+
+    return fig
+
+@cached_figure
+def build_global_position_chart(india_world_share_df):
+    """Build the global rank and market share lines on two axes"""
+    fig = go.Figure()
+
+    # Convert rank to numeric (remove 'th', 'st', 'nd', 'rd')
+    ranks = india_world_share_df['INDIA_WORLD_RANK'].str.extract(r'(\d+)')[0].astype(int)
+
+    # Add ranking trend (inverted so lower rank = higher on chart)
+    fig.add_trace(go.Scatter(
+        x=india_world_share_df['YEAR'],
+        y=51 - ranks,  # Invert ranking so improvement goes up
+        mode='lines+markers',
+        name='Global Ranking (Inverted)',
+        line=dict(color='#FF6B6B', width=4),
+        marker=dict(size=12, color='#FF6B6B',
+                   line=dict(width=2, color='white')),
+        yaxis='y',
+        hovertemplate='<b>Rank:</b> #%{customdata}<br><b>Year:</b> %{x}<extra></extra>',
+        customdata=ranks
+    ))
+
+    # Add market share trend on secondary axis
+    fig.add_trace(go.Scatter(
+        x=india_world_share_df['YEAR'],
+        y=india_world_share_df['INDIA_WORLD_SHARE_PERCENT'],
+        mode='lines+markers',
+        name='Market Share (%)',
+        line=dict(color='#2E8B57', width=4),
+        marker=dict(size=12, color='#3CB371',
+                   line=dict(width=2, color='white')),
+        yaxis='y2',
+        fill='tozeroy',
+        fillcolor='rgba(46,139,87,0.2)',
+        hovertemplate='<b>Market Share:</b> %{y:.2f}%<br><b>Year:</b> %{x}<extra></extra>'
+    ))
+
+    # Update layout with dual y-axes
+    fig.update_layout(
+        title=dict(
+            text="🌍 India's Global Tourism Journey",
+            font=dict(size=16, color='#2E8B57'),
+            x=0.5
+        ),
+        xaxis=dict(
+            title=dict(text="Year", font=dict(color='black')),
+            tickfont=dict(color='black')
+        ),
+        yaxis=dict(
+            title=dict(text="Ranking Performance", font=dict(color='#FF6B6B')),
+            tickfont=dict(color='black'),
+            side='left',
+            tickvals=[51-50, 51-40, 51-30, 51-20, 51-10, 51-1],
+            ticktext=['50th', '40th', '30th', '20th', '10th', '1st']
+        ),
+        yaxis2=dict(
+            title=dict(text="Market Share (%)", font=dict(color='#2E8B57')),
+            tickfont=dict(color='black'),
+            overlaying='y',
+            side='right'
+        ),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='black'),
+        height=400,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            font=dict(color='black')
+        ),
+    )
+
+    return fig
+
+@cached_figure
+def build_multiplier_funnel(direct_gdp, total_impact):
+    """Build the funnel from direct spending to total economic impact"""
+    fig = go.Figure(go.Funnel(
+        y = ["💰 Direct Tourism Spending", "🔄 Multiplier Effect", "📈 Total Economic Impact"],
+        x = [direct_gdp, direct_gdp * 0.92, total_impact],
+        textinfo = "value+percent initial",
+        texttemplate = "₹%{value:,.0f} Cr<br>%{percentInitial}",
+        textfont = {"color": "white", "size": 12},
+        outsidetextfont = {"color": "black", "size": 12},
+        marker = {"color": ["#2E8B57", "#3CB371", "#90EE90"],
+                 "line": {"width": [2, 2, 2], "color": ["white", "white", "white"]}},
+        connector = {"line": {"color": "rgb(63, 63, 63)", "dash": "dot", "width": 3}},
+        hovertemplate='<b>%{label}</b><br>₹%{value:,.0f} crores<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=dict(
+            text="💫 The ₹1 → ₹1.92 Magic Formula",
+            font=dict(size=16, color='#2E8B57'),
+            x=0.5
+        ),
+        yaxis=dict(
+            tickfont=dict(color='black', size=12),
+            showticklabels=True
+        ),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='black'),
+        height=400
+    )
+
+    return fig
+
+@cached_figure
+def build_impact_scorecard(categories, values):
+    """Build the radar of normalized economic impact scores"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        r=values,
+        theta=categories,
+        fill='toself',
+        fillcolor='rgba(46,139,87,0.3)',
+        line=dict(color='#2E8B57', width=3),
+        marker=dict(size=8, color='#3CB371'),
+        name='Tourism Impact Score'
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickfont=dict(size=10, color='black'),
+                gridcolor='rgba(46,139,87,0.3)'
+            ),
+            angularaxis=dict(
+                tickfont=dict(size=12, color='black')
+            )
+        ),
+        title=dict(
+            text="🎯 Tourism Impact Scorecard",
+            font=dict(size=16, color='#2E8B57'),
+            x=0.5
+        ),
+        plot_bgcolor='rgba(248,249,250,0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=400,
+        showlegend=False
+    )
+
+    return fig
 
 def show_economic_multiplier(tourism_gdp_df, tourism_employment_df, fee_earnings_df, india_world_share_df):
     """Chapter 2: The Economic Multiplier Story - Tourism's Economic Impact"""
@@ -58,142 +440,38 @@ def show_economic_multiplier(tourism_gdp_df, tourism_employment_df, fee_earnings
 
         with col1:
             direct_gdp = latest_data['DIRECT_CONTRIBUTION_GDP_PERCENT']
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #2E8B57, #3CB371); padding: 1.5rem; border-radius: 12px; text-align: center; color: white; margin-bottom: 1rem;">
-                <h3 style="margin: 0; font-size: 2rem;">{direct_gdp:.1f}%</h3>
-                <p style="margin: 0.5rem 0; font-size: 0.9rem; opacity: 0.9;">Direct GDP Share</p>
-                <p style="margin: 0; font-size: 0.8rem; background: rgba(255,255,255,0.2); padding: 0.3rem 0.8rem; border-radius: 15px; display: inline-block;">
-                    {latest_year}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(BADGE_TILE, gradient="#2E8B57, #3CB371", color="white", value_size="2rem",
+                       value=f"{direct_gdp:.1f}%", label="Direct GDP Share",
+                       badge_background="rgba(255,255,255,0.2)", badge=latest_year)
 
         with col2:
             total_gdp = latest_data['TOTAL_CONTRIBUTION_GDP_PERCENT']
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #3CB371, #90EE90); padding: 1.5rem; border-radius: 12px; text-align: center; color: white; margin-bottom: 1rem;">
-                <h3 style="margin: 0; font-size: 2rem;">{total_gdp:.1f}%</h3>
-                <p style="margin: 0.5rem 0; font-size: 0.9rem; opacity: 0.9;">Total GDP Impact</p>
-                <p style="margin: 0; font-size: 0.8rem; background: rgba(255,255,255,0.2); padding: 0.3rem 0.8rem; border-radius: 15px; display: inline-block;">
-                    With Multiplier
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(BADGE_TILE, gradient="#3CB371, #90EE90", color="white", value_size="2rem",
+                       value=f"{total_gdp:.1f}%", label="Total GDP Impact",
+                       badge_background="rgba(255,255,255,0.2)", badge="With Multiplier")
 
         with col3:
             multiplier = latest_data['GVA_MULTIPLIER']
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #90EE90, #98FB98); padding: 1.5rem; border-radius: 12px; text-align: center; color: #2E8B57; margin-bottom: 1rem;">
-                <h3 style="margin: 0; font-size: 2rem;">{multiplier:.2f}x</h3>
-                <p style="margin: 0.5rem 0; font-size: 0.9rem; opacity: 0.9;">Economic Multiplier</p>
-                <p style="margin: 0; font-size: 0.8rem; background: rgba(46,139,87,0.2); padding: 0.3rem 0.8rem; border-radius: 15px; display: inline-block;">
-                    Magic Formula
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(BADGE_TILE, gradient="#90EE90, #98FB98", color="#2E8B57", value_size="2rem",
+                       value=f"{multiplier:.2f}x", label="Economic Multiplier",
+                       badge_background="rgba(46,139,87,0.2)", badge="Magic Formula")
 
         with col4:
             tourism_gdp_crore = latest_data['TOURISM_DIRECT_GDP_CRORE']
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #98FB98, #F0FFF0); padding: 1.5rem; border-radius: 12px; text-align: center; color: #2E8B57; margin-bottom: 1rem;">
-                <h3 style="margin: 0; font-size: 1.5rem;">₹{tourism_gdp_crore:,.0f}</h3>
-                <p style="margin: 0.5rem 0; font-size: 0.9rem; opacity: 0.9;">Crores Direct GDP</p>
-                <p style="margin: 0; font-size: 0.8rem; background: rgba(46,139,87,0.2); padding: 0.3rem 0.8rem; border-radius: 15px; display: inline-block;">
-                    {latest_year}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(BADGE_TILE, gradient="#98FB98, #F0FFF0", color="#2E8B57", value_size="1.5rem",
+                       value=f"₹{tourism_gdp_crore:,.0f}", label="Crores Direct GDP",
+                       badge_background="rgba(46,139,87,0.2)", badge=latest_year)
 
         # GDP Trend Analysis
         col1, col2 = st.columns(2)
 
         with col1:
             # Direct vs Total GDP Contribution
-            fig = go.Figure()
-
-            fig.add_trace(go.Scatter(
-                x=tourism_gdp_df['YEAR'],
-                y=tourism_gdp_df['DIRECT_CONTRIBUTION_GDP_PERCENT'],
-                mode='lines+markers',
-                name='Direct Contribution',
-                line=dict(color='#2E8B57', width=4),
-                marker=dict(size=10, color='#2E8B57'),
-                hovertemplate='<b>Direct GDP:</b> %{y:.2f}%<br><b>Year:</b> %{x}<extra></extra>'
-            ))
-
-            fig.add_trace(go.Scatter(
-                x=tourism_gdp_df['YEAR'],
-                y=tourism_gdp_df['TOTAL_CONTRIBUTION_GDP_PERCENT'],
-                mode='lines+markers',
-                name='Total Impact (with Multiplier)',
-                line=dict(color='#90EE90', width=4),
-                marker=dict(size=10, color='#90EE90'),
-                hovertemplate='<b>Total GDP:</b> %{y:.2f}%<br><b>Year:</b> %{x}<extra></extra>'
-            ))
-
-            fig.update_layout(
-                title=dict(
-                    text="📊 Tourism's GDP Contribution: Direct vs Total Impact",
-                    font=dict(size=16, color='#2E8B57'),
-                    x=0.5,
-                    xanchor='center'
-                ),
-                xaxis=dict(
-                    title=dict(text="Year", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                yaxis=dict(
-                    title=dict(text="GDP Contribution (%)", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                plot_bgcolor='rgba(248,249,250,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#333'),
-                height=400,
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(color='black'))
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_gdp_share_chart(tourism_gdp_df), use_container_width=True)
 
         with col2:
             # GDP Value in Crores - Area Chart with Gradient
-            fig = go.Figure()
-
-            fig.add_trace(go.Scatter(
-                x=tourism_gdp_df['YEAR'],
-                y=tourism_gdp_df['TOURISM_DIRECT_GDP_CRORE'],
-                mode='lines+markers',
-                name='Direct GDP (₹ Crores)',
-                line=dict(color='#2E8B57', width=4),
-                marker=dict(size=12, color='#3CB371', line=dict(width=2, color='white')),
-                fill='tozeroy',
-                fillcolor='rgba(46,139,87,0.3)',
-                hovertemplate='<b>Direct GDP:</b> ₹%{y:,.0f} crores<br><b>Year:</b> %{x}<extra></extra>'
-            ))
-
-            fig.update_layout(
-                title=dict(
-                    text="💰 Tourism's Direct GDP Growth Journey",
-                    font=dict(size=16, color='#2E8B57'),
-                    x=0.5,
-                    xanchor='center'
-                ),
-                xaxis=dict(
-                    title=dict(text="Year", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                yaxis=dict(
-                    title=dict(text="GDP Value (₹ Crores)", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                plot_bgcolor='rgba(248,249,250,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#333'),
-                height=400,
-                showlegend=False
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_direct_gdp_chart(tourism_gdp_df), use_container_width=True)
 
     # Employment Impact
     if not tourism_employment_df.empty:
@@ -217,128 +495,29 @@ def show_economic_multiplier(tourism_gdp_df, tourism_employment_df, fee_earnings
 
         with col1:
             direct_emp = latest_emp_data['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION']
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #2E8B57, #3CB371); padding: 2rem; border-radius: 15px; text-align: center; color: white;">
-                <h3 style="margin: 0; font-size: 2.5rem;">{direct_emp:.1f}M</h3>
-                <p style="margin: 0.5rem 0; font-size: 1rem; opacity: 0.9;">Direct Employment</p>
-                <small style="opacity: 0.8;">Tourism Industries</small>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(STAT_TILE, gradient="#2E8B57, #3CB371", color="white",
+                       value=f"{direct_emp:.1f}M", label="Direct Employment", note="Tourism Industries")
 
         with col2:
             total_emp = latest_emp_data['DIRECT_INDIRECT_EMPLOYMENT_MILLION']
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #3CB371, #90EE90); padding: 2rem; border-radius: 15px; text-align: center; color: white;">
-                <h3 style="margin: 0; font-size: 2.5rem;">{total_emp:.1f}M</h3>
-                <p style="margin: 0.5rem 0; font-size: 1rem; opacity: 0.9;">Total Employment</p>
-                <small style="opacity: 0.8;">Direct + Indirect</small>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(STAT_TILE, gradient="#3CB371, #90EE90", color="white",
+                       value=f"{total_emp:.1f}M", label="Total Employment", note="Direct + Indirect")
 
         with col3:
             emp_share = latest_emp_data['DIRECT_INDIRECT_SHARE_PERCENT']
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #90EE90, #98FB98); padding: 2rem; border-radius: 15px; text-align: center; color: #2E8B57;">
-                <h3 style="margin: 0; font-size: 2.5rem;">{emp_share:.1f}%</h3>
-                <p style="margin: 0.5rem 0; font-size: 1rem; opacity: 0.9;">of Total Employment</p>
-                <small style="opacity: 0.8;">National Share</small>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(STAT_TILE, gradient="#90EE90, #98FB98", color="#2E8B57",
+                       value=f"{emp_share:.1f}%", label="of Total Employment", note="National Share")
 
         # Employment Trend - Stacked Area Chart
         col1, col2 = st.columns(2)
 
         with col1:
             # Employment Growth - Waterfall Chart Style
-            fig = go.Figure()
-
-            # Calculate indirect employment
-            indirect_employment = (tourism_employment_df['DIRECT_INDIRECT_EMPLOYMENT_MILLION'] -
-                                 tourism_employment_df['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION'])
-
-            fig.add_trace(go.Scatter(
-                x=tourism_employment_df['YEAR'],
-                y=tourism_employment_df['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION'],
-                mode='lines+markers',
-                name='Direct Employment',
-                line=dict(color='#2E8B57', width=3),
-                marker=dict(size=10, color='#2E8B57'),
-                fill='tozeroy',
-                fillcolor='rgba(46,139,87,0.4)',
-                hovertemplate='<b>Direct:</b> %{y:.1f}M jobs<br><b>Year:</b> %{x}<extra></extra>'
-            ))
-
-            fig.add_trace(go.Scatter(
-                x=tourism_employment_df['YEAR'],
-                y=indirect_employment,
-                mode='lines+markers',
-                name='Indirect Employment',
-                line=dict(color='#90EE90', width=3),
-                marker=dict(size=10, color='#90EE90'),
-                fill='tonexty',
-                fillcolor='rgba(144,238,144,0.4)',
-                hovertemplate='<b>Indirect:</b> %{y:.1f}M jobs<br><b>Year:</b> %{x}<extra></extra>'
-            ))
-
-            fig.update_layout(
-                title=dict(
-                    text="👥 Employment Breakdown: Direct vs Indirect",
-                    font=dict(size=16, color='#2E8B57'),
-                    x=0.5,
-                    xanchor='center'
-                ),
-                xaxis=dict(
-                    title=dict(text="Year", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                yaxis=dict(
-                    title=dict(text="Employment (Millions)", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                plot_bgcolor='rgba(248,249,250,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#333'),
-                height=400,
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(color='black'))
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_employment_breakdown_chart(tourism_employment_df), use_container_width=True)
 
         with col2:
             # Employment Share - Donut Chart
-            latest_emp_data = tourism_employment_df.iloc[-1]
-            direct_emp = latest_emp_data['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION']
-            total_emp = latest_emp_data['DIRECT_INDIRECT_EMPLOYMENT_MILLION']
-            indirect_emp = total_emp - direct_emp
-
-            fig = go.Figure(data=[go.Pie(
-                labels=['Direct Employment', 'Indirect Employment'],
-                values=[direct_emp, indirect_emp],
-                hole=0.6,
-                marker_colors=['#2E8B57', '#90EE90'],
-                textinfo='label+percent',
-                textposition='outside',
-                hovertemplate='<b>%{label}</b><br>%{value:.1f}M jobs<br>%{percent}<extra></extra>'
-            )])
-
-            fig.update_layout(
-                title=dict(
-                    text=f"🎯 Employment Distribution ({latest_emp_data['YEAR']})",
-                    font=dict(size=16, color='#2E8B57'),
-                    x=0.5,
-                    xanchor='center'
-                ),
-                plot_bgcolor='rgba(248,249,250,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#333'),
-                height=400,
-                showlegend=True,
-                legend=dict(font=dict(color='black')),
-                annotations=[dict(text=f'{total_emp:.1f}M<br>Total Jobs', x=0.5, y=0.5,
-                                font_size=20, showarrow=False, font_color='#2E8B57')]
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_employment_share_chart(tourism_employment_df), use_container_width=True)
 
     # Revenue and Global Position
     if not fee_earnings_df.empty and not india_world_share_df.empty:
@@ -357,125 +536,15 @@ def show_economic_multiplier(tourism_gdp_df, tourism_employment_df, fee_earnings
 
         with col1:
             # Revenue Growth - Candlestick Style with Growth Indicators
-            fig = go.Figure()
-
-            # Calculate year-over-year growth
-            revenue_growth = fee_earnings_df['FEE_CRORE'].pct_change() * 100
-
-            # Create bar chart with color coding for growth
-            colors = ['#FF6B6B' if x < 0 else '#2E8B57' for x in revenue_growth]
-
-            fig.add_trace(go.Bar(
-                x=fee_earnings_df['YEAR'],
-                y=fee_earnings_df['FEE_CRORE'],
-                name='Revenue (₹ Crores)',
-                marker_color=colors,
-                text=[f"₹{x:,.0f}" for x in fee_earnings_df['FEE_CRORE']],
-                textposition='outside',
-                hovertemplate='<b>Revenue:</b> ₹%{y:,.0f} crores<br><b>Year:</b> %{x}<br><b>Growth:</b> %{customdata:.1f}%<extra></extra>',
-                customdata=revenue_growth.fillna(0)
-            ))
-
-            fig.update_layout(
-                title=dict(
-                    text="💰 Tourism Revenue: Growth Trajectory",
-                    font=dict(size=16, color='#2E8B57'),
-                    x=0.5
-                ),
-                xaxis=dict(
-                    title=dict(text="Year", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                yaxis=dict(
-                    title=dict(text="Revenue (₹ Crores)", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                plot_bgcolor='rgba(248,249,250,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#333'),
-                height=400,
-                showlegend=False
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_revenue_chart(fee_earnings_df), use_container_width=True)
 
         with col2:
             # Global Position Trend - Dual Axis Chart
-            fig = go.Figure()
-
-            # Convert rank to numeric (remove 'th', 'st', 'nd', 'rd')
+            # Latest rank for the impact scorecard
             ranks = india_world_share_df['INDIA_WORLD_RANK'].str.extract(r'(\d+)')[0].astype(int)
             latest_rank = ranks.iloc[-1]
-            latest_share = india_world_share_df['INDIA_WORLD_SHARE_PERCENT'].iloc[-1]
-
-            # Add ranking trend (inverted so lower rank = higher on chart)
-            fig.add_trace(go.Scatter(
-                x=india_world_share_df['YEAR'],
-                y=51 - ranks,  # Invert ranking so improvement goes up
-                mode='lines+markers',
-                name='Global Ranking (Inverted)',
-                line=dict(color='#FF6B6B', width=4),
-                marker=dict(size=12, color='#FF6B6B',
-                           line=dict(width=2, color='white')),
-                yaxis='y',
-                hovertemplate='<b>Rank:</b> #%{customdata}<br><b>Year:</b> %{x}<extra></extra>',
-                customdata=ranks
-            ))
-
-            # Add market share trend on secondary axis
-            fig.add_trace(go.Scatter(
-                x=india_world_share_df['YEAR'],
-                y=india_world_share_df['INDIA_WORLD_SHARE_PERCENT'],
-                mode='lines+markers',
-                name='Market Share (%)',
-                line=dict(color='#2E8B57', width=4),
-                marker=dict(size=12, color='#3CB371',
-                           line=dict(width=2, color='white')),
-                yaxis='y2',
-                fill='tozeroy',
-                fillcolor='rgba(46,139,87,0.2)',
-                hovertemplate='<b>Market Share:</b> %{y:.2f}%<br><b>Year:</b> %{x}<extra></extra>'
-            ))
-
-            # Update layout with dual y-axes
-            fig.update_layout(
-                title=dict(
-                    text="🌍 India's Global Tourism Journey",
-                    font=dict(size=16, color='#2E8B57'),
-                    x=0.5
-                ),
-                xaxis=dict(
-                    title=dict(text="Year", font=dict(color='black')),
-                    tickfont=dict(color='black')
-                ),
-                yaxis=dict(
-                    title=dict(text="Ranking Performance", font=dict(color='#FF6B6B')),
-                    tickfont=dict(color='black'),
-                    side='left',
-                    tickvals=[51-50, 51-40, 51-30, 51-20, 51-10, 51-1],
-                    ticktext=['50th', '40th', '30th', '20th', '10th', '1st']
-                ),
-                yaxis2=dict(
-                    title=dict(text="Market Share (%)", font=dict(color='#2E8B57')),
-                    tickfont=dict(color='black'),
-                    overlaying='y',
-                    side='right'
-                ),
-                plot_bgcolor='rgba(248,249,250,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='black'),
-                height=400,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1,
-                    font=dict(color='black')
-                ),
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            
+            st.plotly_chart(build_global_position_chart(india_world_share_df), use_container_width=True)
 
     # Add Multiplier Effect Visualization
     if not tourism_gdp_df.empty:
@@ -499,41 +568,10 @@ def show_economic_multiplier(tourism_gdp_df, tourism_employment_df, fee_earnings
             multiplier = latest_data['GVA_MULTIPLIER']
             total_impact = direct_gdp * multiplier
 
-            fig = go.Figure(go.Funnel(
-                y = ["💰 Direct Tourism Spending", "🔄 Multiplier Effect", "📈 Total Economic Impact"],
-                x = [direct_gdp, direct_gdp * 0.92, total_impact],
-                textinfo = "value+percent initial",
-                texttemplate = "₹%{value:,.0f} Cr<br>%{percentInitial}",
-                textfont = {"color": "white", "size": 12},
-                outsidetextfont = {"color": "black", "size": 12},
-                marker = {"color": ["#2E8B57", "#3CB371", "#90EE90"],
-                         "line": {"width": [2, 2, 2], "color": ["white", "white", "white"]}},
-                connector = {"line": {"color": "rgb(63, 63, 63)", "dash": "dot", "width": 3}},
-                hovertemplate='<b>%{label}</b><br>₹%{value:,.0f} crores<extra></extra>'
-            ))
-
-            fig.update_layout(
-                title=dict(
-                    text="💫 The ₹1 → ₹1.92 Magic Formula",
-                    font=dict(size=16, color='#2E8B57'),
-                    x=0.5
-                ),
-                yaxis=dict(
-                    tickfont=dict(color='black', size=12),
-                    showticklabels=True
-                ),
-                plot_bgcolor='rgba(248,249,250,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='black'),
-                height=400
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_multiplier_funnel(direct_gdp, total_impact), use_container_width=True)
 
         with col2:
             # Multiplier Trend Over Time - Radar Chart
-            fig = go.Figure()
-
             # Create a radar chart showing different economic indicators
             categories = ['GDP Impact', 'Employment', 'Revenue Growth', 'Global Position', 'Multiplier Effect']
 
@@ -552,40 +590,7 @@ def show_economic_multiplier(tourism_gdp_df, tourism_employment_df, fee_earnings
                 min(multiplier * 50, 100)       # Multiplier scaled
             ]
 
-            fig.add_trace(go.Scatterpolar(
-                r=values,
-                theta=categories,
-                fill='toself',
-                fillcolor='rgba(46,139,87,0.3)',
-                line=dict(color='#2E8B57', width=3),
-                marker=dict(size=8, color='#3CB371'),
-                name='Tourism Impact Score'
-            ))
-
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[0, 100],
-                        tickfont=dict(size=10, color='black'),
-                        gridcolor='rgba(46,139,87,0.3)'
-                    ),
-                    angularaxis=dict(
-                        tickfont=dict(size=12, color='black')
-                    )
-                ),
-                title=dict(
-                    text="🎯 Tourism Impact Scorecard",
-                    font=dict(size=16, color='#2E8B57'),
-                    x=0.5
-                ),
-                plot_bgcolor='rgba(248,249,250,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                height=400,
-                showlegend=False
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_impact_scorecard(categories, values), use_container_width=True)
 
     # Economic Impact Summary
     st.markdown("""
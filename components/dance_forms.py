@@ -1,72 +1,11 @@
 import streamlit as st
 import pandas as pd
-from snowflake.snowpark.context import get_active_session
+from .image_assets import image_exists, get_first_stage_thumbnail, prefetch_stage_thumbnails_in_background
 from .data_loader import clear_dance_cache
 
-def get_snowflake_session():
-    """Get active Snowflake session for Snowflake native apps"""
-    return get_active_session()
-
-@st.cache_data
-def get_dance_image_from_stage(stage_name, file_path):
-    """Get image using Snowflake's built-in image handling for Native Apps"""
-    try:
-        session = get_snowflake_session()
-
-        # Map the old stage name to the new full stage name
-        if stage_name == "DANCE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."DANCE_IMAGES_STAGE"'
-        elif stage_name == "FESTIVAL_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."FESTIVAL_IMAGES_STAGE"'
-        elif stage_name == "HERITAGE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."HERITAGE_IMAGES_STAGE"'
-        else:
-            full_stage_name = f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"'
-
-
-
-        # CORRECT METHOD: Use session.file.get_stream() for Snowflake Native Apps
-        try:
-            # Construct the full stage path
-            stage_path = f"@{full_stage_name}/{file_path}"
-
-            # Read the image data directly from stage
-            image_data = session.file.get_stream(stage_path, decompress=False).read()
-
-            if image_data:
-                return image_data
-            else:
-                return None
-
-        except Exception as stream_error:
-            # st.error(f"Stream read failed: {stream_error}")
-            return None
-
-    except Exception as e:
-        st.error(f"Error getting dance image: {e}")
-        return None
-
-@st.cache_data
 def get_dance_image_info(stage_name, file_path):
-    """Cache dance image existence info from Snowflake stage"""
-    try:
-        session = get_snowflake_session()
-
-        # Map the old stage name to the new full stage name
-        if stage_name == "DANCE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."DANCE_IMAGES_STAGE"'
-        elif stage_name == "FESTIVAL_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."FESTIVAL_IMAGES_STAGE"'
-        elif stage_name == "HERITAGE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."HERITAGE_IMAGES_STAGE"'
-        else:
-            full_stage_name = f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"'
-
-        query = f"LIST '@{full_stage_name}' PATTERN='.*{file_path}.*'"
-        result = session.sql(query).to_pandas()
-        return {"exists": not result.empty}
-    except:
-        return {"exists": False}
+    """Get dance image existence info from the cached stage manifest"""
+    return {"exists": image_exists(stage_name, file_path)}
 
 
 
@@ -94,8 +33,13 @@ def show_dance_section(dance_df):
         show_automatic_dance_slideshow(dance_df)
         show_indian_dance_info()
 
+def get_dance_image_paths(image_filename):
+    """Candidate stage paths for a dance image, with and without the stage folder prefix"""
+    return [f"dance_images_stage/{image_filename}", image_filename]
+
+@st.fragment
 def show_automatic_dance_slideshow(dance_df):
-    """Simple elegant slideshow displaying classical dance forms"""
+    """Simple elegant slideshow displaying classical dance forms (reruns on its own as a fragment)"""
     # Filter to show only the classical dances including Kathak
     classical_dances = ['Bharatanatyam', 'Kuchipudi', 'Kathakali', 'Odissi', 'Manipuri', 'Mohiniyattam', 'Kathak']
     dances_with_images = dance_df[
@@ -125,13 +69,10 @@ def show_automatic_dance_slideshow(dance_df):
     with col2:
         # Display image using Snowflake stage
         if pd.notna(current_dance['DOWNLOADED_DANCE_IMAGES']):
-            # Try with the file path as stored in the stage (with prefix)
-            file_path = f"dance_images_stage/{current_dance['DOWNLOADED_DANCE_IMAGES']}"
-            image_url = get_dance_image_from_stage("DANCE_IMAGES", file_path)
-
-            # If that doesn't work, try without prefix
-            if not image_url:
-                image_url = get_dance_image_from_stage("DANCE_IMAGES", current_dance['DOWNLOADED_DANCE_IMAGES'])
+            # Try with the file path as stored in the stage (with prefix), then without it
+            image_url = get_first_stage_thumbnail(
+                "DANCE_IMAGES", get_dance_image_paths(current_dance['DOWNLOADED_DANCE_IMAGES']), width=800
+            )
 
             if image_url:
                 try:
@@ -146,6 +87,15 @@ def show_automatic_dance_slideshow(dance_df):
         else:
             show_dance_placeholder()
 
+    # Warm the neighbouring slides so the next ◀/▶ click is served from the cache
+    index = st.session_state.slideshow_index
+    neighbours = {(index - 1) % len(dances_with_images), (index + 1) % len(dances_with_images)}
+    prefetch_stage_thumbnails_in_background(
+        "DANCE_IMAGES",
+        [get_dance_image_paths(dances_with_images.iloc[i]['DOWNLOADED_DANCE_IMAGES']) for i in neighbours],
+        width=800
+    )
+
     # Simple navigation controls with better alignment
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -155,7 +105,7 @@ def show_automatic_dance_slideshow(dance_df):
     with nav_col2:
         if st.button("◀", key="prev_dance", help="Previous dance", use_container_width=True):
             st.session_state.slideshow_index = (st.session_state.slideshow_index - 1) % len(dances_with_images)
-            st.rerun()
+            st.rerun(scope="fragment")
 
     with nav_col3:
         st.markdown(f"""
@@ -169,7 +119,7 @@ def show_automatic_dance_slideshow(dance_df):
     with nav_col4:
         if st.button("▶", key="next_dance", help="Next dance", use_container_width=True):
             st.session_state.slideshow_index = (st.session_state.slideshow_index + 1) % len(dances_with_images)
-            st.rerun()
+            st.rerun(scope="fragment")
 
     # Add custom CSS for better button styling
     st.markdown("""
@@ -342,13 +292,10 @@ def show_featured_state_dances(dance_df, selected_state):
 
         # Display main dance image using Snowflake stage
         if pd.notna(main_dance['DOWNLOADED_DANCE_IMAGES']):
-            # Try with the file path as stored in the stage (with prefix)
-            file_path = f"dance_images_stage/{main_dance['DOWNLOADED_DANCE_IMAGES']}"
-            image_url = get_dance_image_from_stage("DANCE_IMAGES", file_path)
-
-            # If that doesn't work, try without prefix
-            if not image_url:
-                image_url = get_dance_image_from_stage("DANCE_IMAGES", main_dance['DOWNLOADED_DANCE_IMAGES'])
+            # Try with the file path as stored in the stage (with prefix), then without it
+            image_url = get_first_stage_thumbnail(
+                "DANCE_IMAGES", get_dance_image_paths(main_dance['DOWNLOADED_DANCE_IMAGES']), width=800
+            )
 
             if image_url:
                 try:
@@ -0,0 +1,131 @@
+import streamlit as st
+import pandas as pd
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+
+# Backend selection: "snowflake" (default) or "local" for the offline fixture replay
+DATA_BACKEND = os.environ.get("TOURISM_DATA_BACKEND", "snowflake").lower()
+
+# Fixture files for the local backend, one per table and named after it,
+# e.g. fixtures/FESTIVALS.csv or fixtures/Y2023_LEAN_PEAK_MONTH.parquet
+FIXTURE_DIR = os.environ.get(
+    "TOURISM_FIXTURE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+)
+
+# Stage files for the local backend, one folder per stage named like the LIST prefix,
+# e.g. fixtures/stages/festival_images_stage/diwali-national.jpg
+STAGE_FIXTURE_DIR = os.path.join(FIXTURE_DIR, "stages")
+
+# Fully qualified CULTURE_TOURISM_DB.<SCHEMA>.<TABLE> references, quoted or not
+QUALIFIED_TABLE_PATTERN = re.compile(r'"?CULTURE_TOURISM_DB"?\."?\w+"?\."?(\w+)"?', re.IGNORECASE)
+
+class LocalBackend:
+    """Offline backend replaying the CULTURE_TOURISM_DB tables from fixture files
+
+    Every fixture is loaded into an in-memory SQLite database under its table
+    name, and queries have their database and schema qualifiers stripped, so
+    the loaders' SQL runs unchanged without a Snowflake account.
+    """
+
+    def __init__(self, fixture_dir):
+        self.fixture_dir = fixture_dir
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self.lock = threading.Lock()
+        self.tables = self.load_fixtures()
+
+    def load_fixtures(self):
+        """Load every CSV/Parquet fixture as a table and return the table names"""
+        tables = []
+        if not os.path.isdir(self.fixture_dir):
+            print(f"Fixture directory not found: {self.fixture_dir}")
+            return tables
+
+        for file_name in sorted(os.listdir(self.fixture_dir)):
+            table_name, extension = os.path.splitext(file_name)
+            path = os.path.join(self.fixture_dir, file_name)
+            if extension == ".csv":
+                df = pd.read_csv(path)
+            elif extension == ".parquet":
+                df = pd.read_parquet(path)
+            else:
+                continue
+            df.to_sql(table_name.upper(), self.connection, index=False, if_exists="replace")
+            tables.append(table_name.upper())
+        return tables
+
+    def query(self, query, ttl=None):
+        """Run a Snowflake-style query against the fixture tables (ttl is ignored)"""
+        local_query = QUALIFIED_TABLE_PATTERN.sub(lambda match: match.group(1).upper(), query)
+        with self.lock:
+            return pd.read_sql_query(local_query, self.connection)
+
+    def get_stage_dir(self, full_stage_name):
+        """Get the fixture folder of a fully qualified stage"""
+        return os.path.join(STAGE_FIXTURE_DIR, full_stage_name.split('.')[-1].strip('"').lower())
+
+    def list_stage(self, full_stage_name):
+        """List a stage folder like Snowflake's LIST: name, size, md5 and last_modified per file"""
+        stage_dir = self.get_stage_dir(full_stage_name)
+        prefix = os.path.basename(stage_dir)
+        rows = []
+        for root, _, file_names in os.walk(stage_dir):
+            for file_name in sorted(file_names):
+                path = os.path.join(root, file_name)
+                with open(path, "rb") as f:
+                    md5 = hashlib.md5(f.read()).hexdigest()
+                rows.append({
+                    "name": f"{prefix}/{os.path.relpath(path, stage_dir).replace(os.sep, '/')}",
+                    "size": os.path.getsize(path),
+                    "md5": md5,
+                    "last_modified": os.path.getmtime(path)
+                })
+        return pd.DataFrame(rows, columns=["name", "size", "md5", "last_modified"])
+
+    def read_stage_file(self, stage_path):
+        """Read a file given as @<stage>/<path> from its stage folder"""
+        full_stage_name, file_path = stage_path.lstrip("@").split("/", 1)
+        with open(os.path.join(self.get_stage_dir(full_stage_name), file_path), "rb") as f:
+            return f.read()
+
+def get_fixture_versions(fixture_dir=FIXTURE_DIR):
+    """Get a version stamp (modification time and size) for every fixture table"""
+    versions = {}
+    if not os.path.isdir(fixture_dir):
+        return versions
+    for file_name in sorted(os.listdir(fixture_dir)):
+        table_name, extension = os.path.splitext(file_name)
+        if extension in (".csv", ".parquet"):
+            stat = os.stat(os.path.join(fixture_dir, file_name))
+            versions[table_name.upper()] = f"{stat.st_mtime_ns}|{stat.st_size}"
+    return versions
+
+@st.cache_resource
+def get_data_backend():
+    """Get the configured data backend; every backend exposes query(sql, ttl=None) -> DataFrame"""
+    if DATA_BACKEND == "local":
+        return LocalBackend(FIXTURE_DIR)
+    if DATA_BACKEND != "snowflake":
+        raise ValueError(f"Unknown data backend '{DATA_BACKEND}', expected 'snowflake' or 'local'")
+    return st.connection("snowflake")
+
+def get_snowpark_session():
+    """Get the active Snowpark session (imported here so the local backend runs without Snowpark)"""
+    from snowflake.snowpark.context import get_active_session
+    return get_active_session()
+
+def list_stage_files(full_stage_name):
+    """List a stage as a DataFrame with name, size, md5 and last_modified columns"""
+    if DATA_BACKEND == "local":
+        return get_data_backend().list_stage(full_stage_name)
+    return get_snowpark_session().sql(f"LIST '@{full_stage_name}'").to_pandas()
+
+def read_stage_bytes(stage_path):
+    """Read the bytes of a staged file given as @<stage>/<path>"""
+    if DATA_BACKEND == "local":
+        return get_data_backend().read_stage_file(stage_path)
+    # Use session.file.get_stream() for Snowflake Native Apps
+    return get_snowpark_session().file.get_stream(stage_path, decompress=False).read()
@@ -1,25 +1,178 @@
 import streamlit as st
 import pandas as pd
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from .data_backend import DATA_BACKEND, get_data_backend, get_fixture_versions
+from .state_metrics import get_state_metrics
+
+# Upper bound on concurrent warehouse queries issued by load_datasets()
+MAX_PARALLEL_QUERIES = 8
+
+# Persistent snapshot tier consulted by safe_query() before Snowflake.
+# Snapshots live under SNAPSHOT_DIR/<backend>/SNAPSHOT_VERSION so a new version starts cold;
+# set TOURISM_SNAPSHOT_DIR to an empty string to disable the tier.
+SNAPSHOT_DIR = os.environ.get(
+    "TOURISM_SNAPSHOT_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".snapshots")
+)
+SNAPSHOT_VERSION = os.environ.get("TOURISM_SNAPSHOT_VERSION", "v2")
+
+# Seconds between version probes (INFORMATION_SCHEMA, or fixture files offline) used to detect changed tables
+VERSION_PROBE_TTL = int(os.environ.get("TOURISM_VERSION_PROBE_TTL", "300"))
+
+# Declared per-table dtypes applied once when a table is fetched:
+# 'numeric' is a column name pattern parsed to numbers (thousands separators removed),
+# 'category' the low-cardinality text columns stored as categoricals. Values keep the
+# units of the source table; display corrections belong to the pages that need them.
+STATE_ARRIVAL_DTYPES = {'numeric': r'YEAR_\d{4}', 'category': ['STATE', 'REGION']}
+TABLE_DTYPES = {
+    'FESTIVALS': {'category': ['STATE']},
+    'DANCE_FORMS': {'category': ['STATE']},
+    'HERITAGE_SITES': {'category': ['STATE_NAME', 'CITY_NAME', 'HERITAGE_TYPE']},
+    'ITA_MONTHWISE': {'numeric': r'YEAR_\d{4}'},
+    'STATE_DOMESTIC_TOURIST_ARRIVAL': STATE_ARRIVAL_DTYPES,
+    'STATE_FOREIGN_TOURIST_ARRIVAL': STATE_ARRIVAL_DTYPES,
+    'STATE_TOTAL_TOURIST_ARRIVAL': STATE_ARRIVAL_DTYPES
+}
+
+# Calendar months, matched in free-text MONTH_SEASON values by full name or abbreviation
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+MONTH_ABBREVIATIONS = [name[:3] for name in MONTH_NAMES]
+MONTH_PATTERN = re.compile(
+    r'\b(' + '|'.join(f"{name[:3]}(?:{name[3:]})?" for name in MONTH_NAMES) + r'|Sept)\b',
+    re.IGNORECASE
+)
 
 def get_snowflake_connection():
     """Get Snowflake connection"""
     return st.connection("snowflake")
 
+def get_snapshot_dir():
+    """Get the snapshot directory for the active backend and version"""
+    return os.path.join(SNAPSHOT_DIR, DATA_BACKEND, SNAPSHOT_VERSION)
+
+def get_query_tables(query):
+    """Get the unqualified names of the tables a query reads from"""
+    tables = re.findall(r'\bFROM\s+([\w."]+)', query, re.IGNORECASE)
+    return [table.replace('"', '').split('.')[-1].upper() for table in tables]
+
+def get_snapshot_path(query):
+    """Get the snapshot file for a query, keyed by its table names and query hash"""
+    table_names = "+".join(get_query_tables(query)) or "QUERY"
+    query_hash = hashlib.sha1(" ".join(query.split()).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(get_snapshot_dir(), f"{table_names}-{query_hash}.parquet")
+
+def read_snapshot(query):
+    """Read a query result from the snapshot tier, or None if there is none"""
+    if not SNAPSHOT_DIR:
+        return None
+    path = get_snapshot_path(query)
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        print(f"Error reading snapshot '{path}': {e}")
+        return None
+
+def write_snapshot(query, df):
+    """Write a query result to the snapshot tier atomically"""
+    if not SNAPSHOT_DIR or df.empty:
+        return
+    path = get_snapshot_path(query)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error writing snapshot '{path}': {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def normalize_dtypes(df, table_name):
+    """Apply a table's declared dtypes and downcast wide integers"""
+    spec = TABLE_DTYPES.get(table_name, {})
+
+    if 'numeric' in spec:
+        for column in df.columns:
+            if re.fullmatch(spec['numeric'], column):
+                values = df[column]
+                if values.dtype == object:
+                    values = values.astype(str).str.replace(',', '', regex=False)
+                df[column] = pd.to_numeric(values, errors='coerce')
+
+    for column in spec.get('category', []):
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+
+    # int32 is plenty for these tables and halves the memory of every integer column
+    for column in df.select_dtypes(include='int64').columns:
+        if df[column].between(-2**31, 2**31 - 1).all():
+            df[column] = df[column].astype('int32')
+
+    return df
+
+def get_month_bit(month_name):
+    """Bit for a calendar month in a MONTH_MASK (January is bit 0)"""
+    return 1 << MONTH_NAMES.index(month_name)
+
+def parse_month_mask(month_season):
+    """Bitmask of the calendar months named in a free-text value such as 'March-April'"""
+    mask = 0
+    for match in MONTH_PATTERN.findall(month_season if isinstance(month_season, str) else ''):
+        mask |= 1 << MONTH_ABBREVIATIONS.index(match[:3].title())
+    return mask
+
+def add_month_mask(df, column='MONTH_SEASON'):
+    """Parse a free-text month column once into an integer MONTH_MASK column"""
+    if column not in df.columns:
+        return df
+    # Each distinct text is parsed once; the catalogue repeats a handful of seasons
+    masks = {value: parse_month_mask(value) for value in df[column].dropna().unique()}
+    df['MONTH_MASK'] = df[column].map(masks).fillna(0).astype('int32')
+    return df
+
 def safe_query(query, description="data"):
-    """Safely execute a query with proper error handling"""
+    """Safely execute a query with proper error handling
+
+    Results are served from the on-disk snapshot tier when available, so app
+    restarts and new replicas start warm without waking the warehouse. Fresh
+    single-table results are normalized with TABLE_DTYPES before they are
+    snapshotted, so pages always receive typed frames.
+    """
+    snapshot = read_snapshot(query)
+    if snapshot is not None:
+        return snapshot
+
     try:
-        conn = get_snowflake_connection()
-        return conn.query(query)
+        backend = get_data_backend()
+        # ttl=0: results are cached by the loaders and the snapshot tier instead
+        df = backend.query(query, ttl=0)
     except Exception as e:
         st.warning(f"Could not load {description}. Table may not exist or not be accessible.")
         print(f"Error executing query '{query}': {e}")
         return pd.DataFrame()
 
+    tables = get_query_tables(query)
+    if len(tables) == 1 and not df.empty:
+        df = normalize_dtypes(df, tables[0])
+
+    write_snapshot(query, df)
+    return df
+
 # Cultural Data Tables
 @st.cache_data
 def load_festivals_data():
     """Load festivals data from Snowflake"""
-    return safe_query("SELECT * FROM CULTURE_TOURISM_DB.CULTURAL_DATA.FESTIVALS", "festivals data")
+    return add_month_mask(safe_query("SELECT * FROM CULTURE_TOURISM_DB.CULTURAL_DATA.FESTIVALS", "festivals data"))
 
 @st.cache_data
 def load_dance_data():
@@ -112,41 +265,101 @@ def load_unesco_sites_data():
     """Load UNESCO sites data from Snowflake"""
     return safe_query("SELECT * FROM CULTURE_TOURISM_DB.TOURISM_DATA.UNESCO_SITES", "UNESCO sites data")
 
-# Year-wise Lean Peak Month Data
-@st.cache_data
-def load_y2017_lean_peak_month_data():
-    """Load 2017 lean peak month data from Snowflake"""
-    return safe_query("SELECT * FROM CULTURE_TOURISM_DB.TOURISM_DATA.Y2017_LEAN_PEAK_MONTH", "2017 lean peak month data")
-
-@st.cache_data
-def load_y2018_lean_peak_month_data():
-    """Load 2018 lean peak month data from Snowflake"""
-    return safe_query("SELECT * FROM CULTURE_TOURISM_DB.TOURISM_DATA.Y2018_LEAN_PEAK_MONTH", "2018 lean peak month data")
+# Lean/Peak Month Data: one Y<year>_LEAN_PEAK_MONTH table per year
+LEAN_PEAK_YEARS = list(range(2017, 2024))
 
 @st.cache_data
-def load_y2019_lean_peak_month_data():
-    """Load 2019 lean peak month data from Snowflake"""
-    return safe_query("SELECT * FROM CULTURE_TOURISM_DB.TOURISM_DATA.Y2019_LEAN_PEAK_MONTH", "2019 lean peak month data")
+def load_lean_peak_month_data():
+    """Load lean peak month data for every year from Snowflake as one long-format table with a YEAR column"""
+    query = "\nUNION ALL\n".join(
+        f"SELECT {year} AS YEAR, t.* FROM CULTURE_TOURISM_DB.TOURISM_DATA.Y{year}_LEAN_PEAK_MONTH t"
+        for year in LEAN_PEAK_YEARS
+    )
+    return safe_query(query, "lean peak month data")
+
+def get_lean_peak_year(lean_peak_df, year):
+    """Get the lean peak month rows of a single year from the long-format table"""
+    if lean_peak_df.empty or 'YEAR' not in lean_peak_df.columns:
+        return pd.DataFrame()
+    return lean_peak_df[lean_peak_df['YEAR'] == int(year)].drop(columns='YEAR').reset_index(drop=True)
+
+# Projected loading: column lists and simple filters pushed into the SQL
+TABLE_SCHEMAS = {
+    'FESTIVALS': 'CULTURAL_DATA',
+    'DANCE_FORMS': 'CULTURAL_DATA',
+    'HERITAGE_SITES': 'CULTURAL_DATA',
+    'AGE_WISE_STATISTICS': 'TOURISM_DATA',
+    'CENTRALLY_PROTECTED_MONUMENTS_DOMESTIC_VISITS': 'TOURISM_DATA',
+    'CENTRALLY_PROTECTED_MONUMENTS_FOREIGN_VISITS': 'TOURISM_DATA',
+    'DURATION_STAY': 'TOURISM_DATA',
+    'FEE_EARNINGS': 'TOURISM_DATA',
+    'INDIA_WORLD_SHARE': 'TOURISM_DATA',
+    'ITA_MONTHWISE': 'TOURISM_DATA',
+    'ITA_YEARLY': 'TOURISM_DATA',
+    'STATE_DOMESTIC_TOURIST_ARRIVAL': 'TOURISM_DATA',
+    'STATE_FOREIGN_TOURIST_ARRIVAL': 'TOURISM_DATA',
+    'STATE_TOTAL_TOURIST_ARRIVAL': 'TOURISM_DATA',
+    'TOP_MONUMENTS_DOMESTIC_VISITORS': 'TOURISM_DATA',
+    'TOP_MONUMENTS_FOREIGN_VISITS': 'TOURISM_DATA',
+    'TOURISM_EMPLOYMENT': 'TOURISM_DATA',
+    'TOURISM_GDP': 'TOURISM_DATA',
+    'UNESCO_SITES': 'TOURISM_DATA'
+}
+
+# Tables storing one YEAR_<year> column per year instead of a YEAR column
+WIDE_YEAR_TABLES = {'STATE_DOMESTIC_TOURIST_ARRIVAL', 'STATE_FOREIGN_TOURIST_ARRIVAL', 'STATE_TOTAL_TOURIST_ARRIVAL'}
+
+# State column per table where it is not called STATE
+STATE_COLUMNS = {'HERITAGE_SITES': 'STATE_NAME'}
+
+STATE_ARRIVAL_COLUMNS = ('STATE', 'REGION')
+STATE_ARRIVAL_YEARS = (2017, 2023)
+HERITAGE_GALLERY_COLUMNS = ('HERITAGE_NAME', 'HERITAGE_TYPE', 'CITY_NAME', 'STATE_NAME', 'IMAGE_NAME')
+
+def quote_literal(value):
+    """Quote a value as a SQL string literal"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def quote_identifier(name):
+    """Validate a column name before it is placed in SQL"""
+    if not re.fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', name):
+        raise ValueError(f"Invalid column name: {name}")
+    return name
 
 @st.cache_data
-def load_y2020_lean_peak_month_data():
-    """Load 2020 lean peak month data from Snowflake"""
-    return safe_query("SELECT * FROM CULTURE_TOURISM_DB.TOURISM_DATA.Y2020_LEAN_PEAK_MONTH", "2020 lean peak month data")
+def load_table_data(table, columns=None, states=None, regions=None, year_range=None):
+    """Load a table from Snowflake with the column projection and filters pushed into the query
+
+    year_range is an inclusive (start, end) pair. It selects the YEAR_<year>
+    columns of the wide state arrival tables and filters on YEAR elsewhere.
+    Results are cached per table, projection and filter combination.
+    """
+    if table not in TABLE_SCHEMAS:
+        raise KeyError(f"Unknown table: {table}")
+
+    select_columns = [quote_identifier(column) for column in columns] if columns else []
+    conditions = []
+
+    if year_range is not None:
+        start_year, end_year = (int(year) for year in year_range)
+        if table in WIDE_YEAR_TABLES:
+            if not select_columns:
+                raise ValueError(f"A column list is required to project year columns of {table}")
+            select_columns += [f"YEAR_{year}" for year in range(start_year, end_year + 1)]
+        else:
+            conditions.append(f"YEAR BETWEEN {start_year} AND {end_year}")
 
-@st.cache_data
-def load_y2021_lean_peak_month_data():
-    """Load 2021 lean peak month data from Snowflake"""
-    return safe_query("SELECT * FROM CULTURE_TOURISM_DB.TOURISM_DATA.Y2021_LEAN_PEAK_MONTH", "2021 lean peak month data")
+    if states:
+        state_column = STATE_COLUMNS.get(table, 'STATE')
+        conditions.append(f"{state_column} IN ({', '.join(quote_literal(state) for state in states)})")
 
-@st.cache_data
-def load_y2022_lean_peak_month_data():
-    """Load 2022 lean peak month data from Snowflake"""
-    return safe_query("SELECT * FROM CULTURE_TOURISM_DB.TOURISM_DATA.Y2022_LEAN_PEAK_MONTH", "2022 lean peak month data")
+    if regions:
+        conditions.append(f"REGION IN ({', '.join(quote_literal(region) for region in regions)})")
 
-@st.cache_data
-def load_y2023_lean_peak_month_data():
-    """Load 2023 lean peak month data from Snowflake"""
-    return safe_query("SELECT * FROM CULTURE_TOURISM_DB.TOURISM_DATA.Y2023_LEAN_PEAK_MONTH", "2023 lean peak month data")
+    query = f"SELECT {', '.join(select_columns) or '*'} FROM CULTURE_TOURISM_DB.{TABLE_SCHEMAS[table]}.{table}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return safe_query(query, f"{table.lower().replace('_', ' ')} data")
 
 # Image loading functions for Snowflake stages
 @st.cache_data
@@ -271,14 +484,16 @@ def clear_all_cache():
     load_tourism_gdp_data.clear()
     load_unesco_sites_data.clear()
 
-    # Year-wise Lean Peak Data
-    load_y2017_lean_peak_month_data.clear()
-    load_y2018_lean_peak_month_data.clear()
-    load_y2019_lean_peak_month_data.clear()
-    load_y2020_lean_peak_month_data.clear()
-    load_y2021_lean_peak_month_data.clear()
-    load_y2022_lean_peak_month_data.clear()
-    load_y2023_lean_peak_month_data.clear()
+    # Lean Peak Data
+    load_lean_peak_month_data.clear()
+
+    # Projected Data
+    load_table_data.clear()
+
+    # Combined/Compatibility Data
+    load_centrally_protected_data.clear()
+    load_top_monuments_data.clear()
+    load_state_tourism_data.clear()
 
 # Additional functions for compatibility with existing code
 def load_unesco_data():
@@ -297,18 +512,21 @@ def load_age_statistics_data():
     """Alias for load_age_wise_statistics_data for compatibility"""
     return load_age_wise_statistics_data()
 
+@st.cache_data
 def load_centrally_protected_data():
     """Load combined centrally protected data for compatibility"""
     domestic_df = load_centrally_protected_domestic_data()
     foreign_df = load_centrally_protected_foreign_data()
     return pd.concat([domestic_df, foreign_df], ignore_index=True) if not domestic_df.empty and not foreign_df.empty else domestic_df if not domestic_df.empty else foreign_df
 
+@st.cache_data
 def load_top_monuments_data():
     """Load combined top monuments data for compatibility"""
     domestic_df = load_top_monuments_domestic_data()
     foreign_df = load_top_monuments_foreign_data()
     return pd.concat([domestic_df, foreign_df], ignore_index=True) if not domestic_df.empty and not foreign_df.empty else domestic_df if not domestic_df.empty else foreign_df
 
+@st.cache_data
 def load_state_tourism_data():
     """Load combined state tourism data for compatibility"""
     domestic_df = load_state_domestic_tourist_arrivals_data()
@@ -317,58 +535,232 @@ def load_state_tourism_data():
     return total_df if not total_df.empty else pd.concat([domestic_df, foreign_df], ignore_index=True) if not domestic_df.empty and not foreign_df.empty else domestic_df if not domestic_df.empty else foreign_df
 
 def load_all_lean_peak_data():
-    """Load all lean peak data by year"""
+    """Load all lean peak data by year (per-year views of load_lean_peak_month_data)"""
+    lean_peak_df = load_lean_peak_month_data()
+    return {str(year): get_lean_peak_year(lean_peak_df, year) for year in LEAN_PEAK_YEARS}
+
+# Loaders whose results derive from each table, cleared when the table changes
+TABLE_LOADERS = {
+    'FESTIVALS': [load_festivals_data],
+    'DANCE_FORMS': [load_dance_data],
+    'HERITAGE_SITES': [load_heritage_sites_data],
+    'AGE_WISE_STATISTICS': [load_age_wise_statistics_data],
+    'CENTRALLY_PROTECTED_MONUMENTS_DOMESTIC_VISITS': [load_centrally_protected_domestic_data, load_centrally_protected_data],
+    'CENTRALLY_PROTECTED_MONUMENTS_FOREIGN_VISITS': [load_centrally_protected_foreign_data, load_centrally_protected_data],
+    'DURATION_STAY': [load_duration_stay_data],
+    'FEE_EARNINGS': [load_fee_earnings_data],
+    'INDIA_WORLD_SHARE': [load_india_world_share_data],
+    'ITA_MONTHWISE': [load_ita_monthwise_data],
+    'ITA_YEARLY': [load_ita_yearly_data],
+    'STATE_DOMESTIC_TOURIST_ARRIVAL': [load_state_domestic_tourist_arrivals_data, load_state_tourism_data],
+    'STATE_FOREIGN_TOURIST_ARRIVAL': [load_state_foreign_tourist_arrivals_data, load_state_tourism_data],
+    'STATE_TOTAL_TOURIST_ARRIVAL': [load_state_total_tourist_arrivals_data, load_state_tourism_data],
+    'TOP_MONUMENTS_DOMESTIC_VISITORS': [load_top_monuments_domestic_data, load_top_monuments_data],
+    'TOP_MONUMENTS_FOREIGN_VISITS': [load_top_monuments_foreign_data, load_top_monuments_data],
+    'TOURISM_EMPLOYMENT': [load_tourism_employment_data],
+    'TOURISM_GDP': [load_tourism_gdp_data],
+    'UNESCO_SITES': [load_unesco_sites_data],
+    'Y2017_LEAN_PEAK_MONTH': [load_lean_peak_month_data],
+    'Y2018_LEAN_PEAK_MONTH': [load_lean_peak_month_data],
+    'Y2019_LEAN_PEAK_MONTH': [load_lean_peak_month_data],
+    'Y2020_LEAN_PEAK_MONTH': [load_lean_peak_month_data],
+    'Y2021_LEAN_PEAK_MONTH': [load_lean_peak_month_data],
+    'Y2022_LEAN_PEAK_MONTH': [load_lean_peak_month_data],
+    'Y2023_LEAN_PEAK_MONTH': [load_lean_peak_month_data]
+}
+
+# Table versions already reflected in this process's in-memory caches
+_memory_table_versions = {}
+_table_versions_lock = threading.Lock()
+
+@st.cache_data(ttl=VERSION_PROBE_TTL, show_spinner=False)
+def get_table_versions():
+    """Get a version stamp for every table in one probe
+
+    Snowflake tables are stamped with LAST_ALTERED and ROW_COUNT, local
+    fixtures with their file modification time and size.
+    """
+    if DATA_BACKEND == "local":
+        return get_fixture_versions()
+    if DATA_BACKEND != "snowflake":
+        return {}
+    query = """
+        SELECT TABLE_NAME, LAST_ALTERED, ROW_COUNT
+        FROM CULTURE_TOURISM_DB.INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA IN ('CULTURAL_DATA', 'TOURISM_DATA')
+    """
+    try:
+        result = get_data_backend().query(query, ttl=0)
+    except Exception as e:
+        print(f"Error probing table versions: {e}")
+        return {}
     return {
-        '2017': load_y2017_lean_peak_month_data(),
-        '2018': load_y2018_lean_peak_month_data(),
-        '2019': load_y2019_lean_peak_month_data(),
-        '2020': load_y2020_lean_peak_month_data(),
-        '2021': load_y2021_lean_peak_month_data(),
-        '2022': load_y2022_lean_peak_month_data(),
-        '2023': load_y2023_lean_peak_month_data()
+        row['TABLE_NAME']: f"{row['LAST_ALTERED']}|{row['ROW_COUNT']}"
+        for _, row in result.iterrows()
     }
 
+def remove_table_snapshots(table_name):
+    """Remove every snapshot file whose query reads from a table"""
+    snapshot_dir = get_snapshot_dir()
+    if not os.path.isdir(snapshot_dir):
+        return
+    pattern = re.compile(r'^(.+)-[0-9a-f]{12}\.parquet$')
+    for file_name in os.listdir(snapshot_dir):
+        match = pattern.match(file_name)
+        if match and table_name in match.group(1).split('+'):
+            os.remove(os.path.join(snapshot_dir, file_name))
+
+def invalidate_changed_tables():
+    """Drop cached results and snapshots of tables whose version changed
+
+    In-memory caches are compared against the versions this process last saw,
+    snapshots against the versions recorded next to them on disk, so only the
+    tables that actually changed are fetched again.
+    """
+    current_versions = get_table_versions()
+    if not current_versions:
+        return []
+
+    changed_tables = set()
+    with _table_versions_lock:
+        for table_name, version in current_versions.items():
+            seen_version = _memory_table_versions.get(table_name)
+            if seen_version is not None and seen_version != version:
+                for loader in TABLE_LOADERS.get(table_name, []):
+                    loader.clear()
+                # Projections are cached together, so any change drops them all
+                load_table_data.clear()
+                changed_tables.add(table_name)
+            _memory_table_versions[table_name] = version
+
+        if SNAPSHOT_DIR:
+            versions_path = os.path.join(get_snapshot_dir(), "versions.json")
+            try:
+                with open(versions_path) as f:
+                    snapshot_versions = json.load(f)
+            except (OSError, ValueError):
+                snapshot_versions = {}
+
+            stale_tables = [table_name for table_name, version in current_versions.items()
+                            if snapshot_versions.get(table_name) != version]
+            if stale_tables:
+                for table_name in stale_tables:
+                    remove_table_snapshots(table_name)
+                try:
+                    os.makedirs(os.path.dirname(versions_path), exist_ok=True)
+                    with open(versions_path, "w") as f:
+                        json.dump(current_versions, f, indent=2, sort_keys=True)
+                except OSError as e:
+                    print(f"Error writing snapshot versions '{versions_path}': {e}")
+                changed_tables.update(stale_tables)
+
+    # The local backend holds the fixtures in memory, so changed files need a fresh load
+    if changed_tables and DATA_BACKEND == "local":
+        get_data_backend.clear()
+
+    return sorted(changed_tables)
+
+# Dataset registry: maps every dataset name to the loader that resolves it.
+# Pages declare the names they need so that only those loaders run on a rerun.
+def load_state_metrics_data(dataset_name):
+    """Load a registered state arrivals dataset with its derived per-state metrics"""
+    return get_state_metrics(DATASET_LOADERS[dataset_name]())
+
+DATASET_LOADERS = {
+    # Cultural Data
+    'festivals_df': load_festivals_data,
+    'dance_df': load_dance_data,
+    'heritage_sites_df': load_heritage_sites_data,
+
+    # Tourism Data
+    'age_wise_statistics_df': load_age_wise_statistics_data,
+    'centrally_protected_domestic_df': load_centrally_protected_domestic_data,
+    'centrally_protected_foreign_df': load_centrally_protected_foreign_data,
+    'duration_stay_df': load_duration_stay_data,
+    'fee_earnings_df': load_fee_earnings_data,
+    'india_world_share_df': load_india_world_share_data,
+    'ita_monthwise_df': load_ita_monthwise_data,
+    'ita_yearly_df': load_ita_yearly_data,
+    'state_domestic_tourist_arrivals_df': load_state_domestic_tourist_arrivals_data,
+    'state_foreign_tourist_arrivals_df': load_state_foreign_tourist_arrivals_data,
+    'state_total_tourist_arrivals_df': load_state_total_tourist_arrivals_data,
+    'top_monuments_domestic_df': load_top_monuments_domestic_data,
+    'top_monuments_foreign_df': load_top_monuments_foreign_data,
+    'tourism_employment_df': load_tourism_employment_data,
+    'tourism_gdp_df': load_tourism_gdp_data,
+    'unesco_sites_df': load_unesco_sites_data,
+
+    # Lean Peak Data (long format with a YEAR column)
+    'lean_peak_df': load_lean_peak_month_data,
+
+    # Combined/Compatibility Data
+    'ita_df': load_ita_data,  # Alias for yearly
+    'ita_monthly_df': load_ita_monthly_data,  # Alias for monthwise
+    'state_tourism_df': load_state_tourism_data,  # Combined state data
+    'centrally_protected_df': load_centrally_protected_data,  # Combined protected data
+    'top_monuments_df': load_top_monuments_data,  # Combined monuments data
+    'age_statistics_df': load_age_statistics_data,  # Alias for age wise
+    'lean_peak_all_years': load_all_lean_peak_data,  # All years lean peak data
+
+    # Projected Data (only the columns the pages read)
+    'state_total_yearly_df': partial(load_table_data, 'STATE_TOTAL_TOURIST_ARRIVAL',
+                                     columns=STATE_ARRIVAL_COLUMNS, year_range=STATE_ARRIVAL_YEARS),
+    'state_domestic_yearly_df': partial(load_table_data, 'STATE_DOMESTIC_TOURIST_ARRIVAL',
+                                        columns=STATE_ARRIVAL_COLUMNS, year_range=STATE_ARRIVAL_YEARS),
+    'state_foreign_yearly_df': partial(load_table_data, 'STATE_FOREIGN_TOURIST_ARRIVAL',
+                                       columns=STATE_ARRIVAL_COLUMNS, year_range=STATE_ARRIVAL_YEARS),
+    'heritage_gallery_df': partial(load_table_data, 'HERITAGE_SITES', columns=HERITAGE_GALLERY_COLUMNS),
+
+    # Derived Data (projected state arrivals with regions, millions, growth and recovery metrics)
+    'state_total_metrics_df': partial(load_state_metrics_data, 'state_total_yearly_df'),
+    'state_domestic_metrics_df': partial(load_state_metrics_data, 'state_domestic_yearly_df'),
+    'state_foreign_metrics_df': partial(load_state_metrics_data, 'state_foreign_yearly_df')
+}
+
+def load_datasets(names, max_workers=MAX_PARALLEL_QUERIES):
+    """Load only the named datasets and return them as a dictionary
+
+    Cold loaders run concurrently on a bounded thread pool so a page with
+    several tables costs roughly one round-trip instead of one per table.
+    Each loader fills its own cache, so later calls are served from memory.
+    """
+    names = list(names)
+    unknown = [name for name in names if name not in DATASET_LOADERS]
+    if unknown:
+        raise KeyError(f"Unknown dataset(s): {', '.join(unknown)}")
+
+    # Re-fetch only the tables that changed since they were cached
+    invalidate_changed_tables()
+
+    if len(names) <= 1 or max_workers <= 1:
+        return {name: DATASET_LOADERS[name]() for name in names}
+
+    # Worker threads need the script context for st.cache_data and st.warning
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(names)),
+                            initializer=add_script_run_ctx,
+                            initargs=(None, ctx)) as executor:
+        futures = {name: executor.submit(DATASET_LOADERS[name]) for name in names}
+        return {name: future.result() for name, future in futures.items()}
+
 def load_all_data():
     """Load all data and return as a dictionary"""
-    return {
-        # Cultural Data
-        'festivals_df': load_festivals_data(),
-        'dance_df': load_dance_data(),
-        'heritage_sites_df': load_heritage_sites_data(),
-
-        # Tourism Data
-        'age_wise_statistics_df': load_age_wise_statistics_data(),
-        'centrally_protected_domestic_df': load_centrally_protected_domestic_data(),
-        'centrally_protected_foreign_df': load_centrally_protected_foreign_data(),
-        'duration_stay_df': load_duration_stay_data(),
-        'fee_earnings_df': load_fee_earnings_data(),
-        'india_world_share_df': load_india_world_share_data(),
-        'ita_monthwise_df': load_ita_monthwise_data(),
-        'ita_yearly_df': load_ita_yearly_data(),
-        'state_domestic_tourist_arrivals_df': load_state_domestic_tourist_arrivals_data(),
-        'state_foreign_tourist_arrivals_df': load_state_foreign_tourist_arrivals_data(),
-        'state_total_tourist_arrivals_df': load_state_total_tourist_arrivals_data(),
-        'top_monuments_domestic_df': load_top_monuments_domestic_data(),
-        'top_monuments_foreign_df': load_top_monuments_foreign_data(),
-        'tourism_employment_df': load_tourism_employment_data(),
-        'tourism_gdp_df': load_tourism_gdp_data(),
-        'unesco_sites_df': load_unesco_sites_data(),
-
-        # Year-wise Lean Peak Data
-        'y2017_lean_peak_df': load_y2017_lean_peak_month_data(),
-        'y2018_lean_peak_df': load_y2018_lean_peak_month_data(),
-        'y2019_lean_peak_df': load_y2019_lean_peak_month_data(),
-        'y2020_lean_peak_df': load_y2020_lean_peak_month_data(),
-        'y2021_lean_peak_df': load_y2021_lean_peak_month_data(),
-        'y2022_lean_peak_df': load_y2022_lean_peak_month_data(),
-        'y2023_lean_peak_df': load_y2023_lean_peak_month_data(),
-
-        # Combined/Compatibility Data
-        'ita_df': load_ita_data(),  # Alias for yearly
-        'ita_monthly_df': load_ita_monthly_data(),  # Alias for monthwise
-        'state_tourism_df': load_state_tourism_data(),  # Combined state data
-        'centrally_protected_df': load_centrally_protected_data(),  # Combined protected data
-        'top_monuments_df': load_top_monuments_data(),  # Combined monuments data
-        'age_statistics_df': load_age_statistics_data(),  # Alias for age wise
-        'lean_peak_all_years': load_all_lean_peak_data()  # All years lean peak data
-    }
+    return load_datasets(DATASET_LOADERS)
+
+def refresh_snapshots():
+    """Rewrite every snapshot of the current version from Snowflake"""
+    snapshot_dir = get_snapshot_dir()
+    if os.path.isdir(snapshot_dir):
+        for file_name in os.listdir(snapshot_dir):
+            if file_name.endswith(".parquet"):
+                os.remove(os.path.join(snapshot_dir, file_name))
+
+    # With the snapshots gone every loader goes back to Snowflake and rewrites them
+    clear_all_cache()
+    data = load_all_data()
+    return sum(1 for df in data.values() if isinstance(df, pd.DataFrame) and not df.empty)
+
+if __name__ == "__main__":
+    # Refresh the snapshot tier: python -m components.data_loader
+    refreshed = refresh_snapshots()
+    print(f"Refreshed {refreshed} datasets into {get_snapshot_dir()}")
@@ -3,53 +3,15 @@ import pandas as pd
 import plotly.express as px
 import base64
 import io
-from snowflake.snowpark.context import get_active_session
+from string import Template
+from utils.figure_cache import cached_figure
+from .card_lists import render_card_html, render_card_list
+from .data_loader import MONTH_NAMES, get_month_bit
+from .image_assets import image_exists, get_stage_thumbnail_uri, prefetch_stage_thumbnails
 
-def get_snowflake_session():
-    """Get active Snowflake session for Snowflake native apps"""
-    return get_active_session()
-
-@st.cache_data
-def get_festival_image_from_stage(stage_name, file_path):
-    """Get festival image binary data from Snowflake stage"""
-    try:
-        session = get_snowflake_session()
-
-        # Map stage name to full qualified name
-        if stage_name == "FESTIVAL_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."FESTIVAL_IMAGES_STAGE"'
-        else:
-            full_stage_name = f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"'
-
-        # Use session.file.get_stream() for Snowflake Native Apps
-        stage_path = f"@{full_stage_name}/{file_path}"
-        image_data = session.file.get_stream(stage_path, decompress=False).read()
-
-        if image_data:
-            return image_data
-        else:
-            return None
-
-    except Exception as e:
-        return None
-
-@st.cache_data
 def get_festival_image_info(stage_name, file_path):
-    """Cache festival image existence info from Snowflake stage"""
-    try:
-        session = get_snowflake_session()
-
-        # Map stage name to full qualified name
-        if stage_name == "FESTIVAL_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."FESTIVAL_IMAGES_STAGE"'
-        else:
-            full_stage_name = f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"'
-
-        query = f"LIST '@{full_stage_name}' PATTERN='.*{file_path}.*'"
-        result = session.sql(query).to_pandas()
-        return {"exists": not result.empty}
-    except:
-        return {"exists": False}
+    """Get festival image existence info from the cached stage manifest"""
+    return {"exists": image_exists(stage_name, file_path)}
 
 # Exact mapping between festival names and their image files
 FESTIVAL_IMAGE_MAPPING = {
@@ -131,42 +93,9 @@ def verify_festival_images(stage_name="FESTIVAL_IMAGES"):
 
     return len(missing_images) == 0
 
-def show_monthly_festival_chart(festivals_df):
-    """Display a beautiful chart showing festival count by month"""
-
-    # Create month mapping for better analysis
-    month_mapping = {
-        'January': ['January', 'Jan'],
-        'February': ['February', 'Feb'],
-        'March': ['March', 'Mar', 'March-April'],
-        'April': ['April', 'Apr', 'March-April', 'April-May'],
-        'May': ['May', 'April-May', 'May-June'],
-        'June': ['June', 'Jun', 'May-June', 'June-July'],
-        'July': ['July', 'Jul', 'June-July', 'July-August'],
-        'August': ['August', 'Aug', 'July-August', 'August-September'],
-        'September': ['September', 'Sep', 'August-September', 'September-October'],
-        'October': ['October', 'Oct', 'September-October', 'October-November'],
-        'November': ['November', 'Nov', 'October-November'],
-        'December': ['December', 'Dec']
-    }
-
-    # Count festivals by month
-    monthly_counts = {}
-    for month in month_mapping.keys():
-        count = 0
-        for _, festival in festivals_df.iterrows():
-            month_season = festival['MONTH_SEASON']
-            if any(keyword in month_season for keyword in month_mapping[month]):
-                count += 1
-        monthly_counts[month] = count
-
-    # Create DataFrame for plotting
-    chart_data = pd.DataFrame({
-        'Month': list(monthly_counts.keys()),
-        'Festival Count': list(monthly_counts.values())
-    })
-
-    # Create a beautiful bar chart with better gradient colors
+@cached_figure
+def build_monthly_festival_chart(chart_data):
+    """Build the bars of festival counts per month"""
     fig = px.bar(
         chart_data,
         x='Month',
@@ -205,8 +134,23 @@ def show_monthly_festival_chart(festivals_df):
         )
     )
 
-    # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+def show_monthly_festival_chart(festivals_df):
+    """Display a beautiful chart showing festival count by month"""
+
+    # Count festivals by month from the MONTH_MASK parsed at load
+    month_masks = festivals_df['MONTH_MASK'].to_numpy()
+    monthly_counts = {month: int(((month_masks & get_month_bit(month)) != 0).sum()) for month in MONTH_NAMES}
+
+    # Create DataFrame for plotting
+    chart_data = pd.DataFrame({
+        'Month': list(monthly_counts.keys()),
+        'Festival Count': list(monthly_counts.values())
+    })
+
+    # Create a beautiful bar chart with better gradient colors
+    st.plotly_chart(build_monthly_festival_chart(chart_data), use_container_width=True)
 
     # Add some insights with better contrasting colors
     max_month = max(monthly_counts, key=monthly_counts.get)
@@ -261,8 +205,7 @@ def show_festivals_section(festivals_df):
 
     with col2:
         # Extract months from festival data for filtering
-        months = ["All Months", "January", "February", "March", "April", "May", "June",
-                 "July", "August", "September", "October", "November", "December"]
+        months = ["All Months"] + MONTH_NAMES
         selected_month = st.selectbox("📅 Select Month/Season:", months)
 
     # Filter data based on selection
@@ -272,7 +215,7 @@ def show_festivals_section(festivals_df):
         filtered_df = filtered_df[filtered_df['STATE'] == selected_state]
 
     if selected_month != "All Months":
-        filtered_df = filtered_df[filtered_df['MONTH_SEASON'].str.contains(selected_month, case=False, na=False)]
+        filtered_df = filtered_df[(filtered_df['MONTH_MASK'] & get_month_bit(selected_month)) != 0]
 
     # Pagination logic for "All States" and "All Months" selection
     festivals_per_page = 10
@@ -284,6 +227,12 @@ def show_festivals_section(festivals_df):
         st.session_state.current_page = 0  # Reset to first page
         st.session_state.last_festival_filter = current_filter_key
 
+    show_festival_cards(filtered_df, show_pagination, festivals_per_page)
+
+
+@st.fragment
+def show_festival_cards(filtered_df, show_pagination, festivals_per_page):
+    """Display a page of festival cards with pagination, rerunning on its own as a fragment"""
     # Initialize session state for festivals pagination
     if 'current_page' not in st.session_state:
         st.session_state.current_page = 0
@@ -326,8 +275,13 @@ def show_festivals_section(festivals_df):
 
     # Display festivals in beautiful cards
     if not display_df.empty:
-        for _, festival in display_df.iterrows():
-            display_festival_card(festival)
+        # Fetch every visible card's image concurrently before the cards render
+        prefetch_stage_thumbnails(
+            "FESTIVAL_IMAGES",
+            [FESTIVAL_IMAGE_MAPPING.get(name) for name in display_df['FESTIVAL_NAME']],
+            width=400
+        )
+        display_festival_cards(display_df)
 
         # Add pagination navigation
         if show_pagination and total_pages > 1:
@@ -355,13 +309,13 @@ def show_festivals_section(festivals_df):
                     if current_page_num > 1:
                         if st.button("⬅️ Previous", key="prev_festivals", use_container_width=True):
                             st.session_state.current_page -= 1
-                            st.rerun()
+                            st.rerun(scope="fragment")
 
                 with nav_col2:
                     if current_page_num < total_pages:
                         if st.button("Next ➡️", key="next_festivals", use_container_width=True):
                             st.session_state.current_page += 1
-                            st.rerun()
+                            st.rerun(scope="fragment")
 
             st.markdown("</div>", unsafe_allow_html=True)
 
@@ -376,130 +330,106 @@ def show_festivals_section(festivals_df):
         """, unsafe_allow_html=True)
 
 
-def display_festival_card(festival, stage_name="FESTIVAL_IMAGES"):
-    """Display festival in a beautiful rectangular card with image on left and description on right"""
-
+# Shared by every festival card on the page (one rule set instead of one <style> per card)
+FESTIVAL_CARD_STYLESHEET = """
+.festival-card {
+    background: white !important;
+    padding: 2rem !important;
+    margin: 2rem 0 !important;
+    border-radius: 20px !important;
+    box-shadow: 0 15px 35px rgba(0,0,0,0.15) !important;
+    border: 3px solid #4ECDC4 !important;
+    display: flex !important;
+    align-items: flex-start !important;
+    gap: 2rem !important;
+    min-height: 300px !important;
+}
+.festival-card .image-section {
+    flex: 1 !important;
+    max-width: 350px !important;
+    display: flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+    min-height: 300px !important;
+}
+.festival-card .content-section {
+    flex: 2 !important;
+    padding-left: 1rem !important;
+}
+.festival-card .image-container {
+    display: flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+    width: 100% !important;
+    height: 100% !important;
+}
+.festival-card img {
+    border-radius: 15px !important;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2) !important;
+    max-width: 100% !important;
+    max-height: 250px !important;
+    width: auto !important;
+    height: auto !important;
+    object-fit: contain !important;
+}
+"""
+
+# Rectangular card with image on left and description on right
+FESTIVAL_CARD_TEMPLATE = Template("""<div class="festival-card" id="$card_id">
+<div class="image-section">$image_html</div>
+<div class="content-section">
+<h2 style="color: #008080; font-family: 'Playfair Display', serif; font-size: 2rem; margin-bottom: 1rem; font-weight: bold;">🎭 $name</h2>
+<div style="margin-bottom: 1.5rem;">
+<p style="color: #20B2AA; font-weight: bold; font-size: 1.1rem; margin-bottom: 0.5rem;">📍 $state</p>
+<p style="color: #008080; font-weight: bold; font-size: 1rem; margin-bottom: 1rem;">📅 $month_season</p>
+</div>
+<div style="color: #333; line-height: 1.6; font-family: 'Poppins', sans-serif; font-size: 0.95rem;">$description</div>
+</div>
+</div>
+<br>""")
+
+FESTIVAL_IMAGE_TEMPLATE = Template('<div class="image-container"><img src="$image_uri" alt="$name"></div>')
+
+FESTIVAL_PLACEHOLDER_TEMPLATE = Template("""<div class="image-container">
+<div style="height: 250px; display: flex; align-items: center; justify-content: center; background: linear-gradient(135deg, #FF6B6B, #4ECDC4); border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.2);">
+<div style="text-align: center; color: white;">
+<div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🎪</div>
+<div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">$name</div>
+</div>
+</div>
+</div>""")
+
+def get_festival_card(festival, stage_name="FESTIVAL_IMAGES"):
+    """Get the template values for one festival card"""
     # Get image data using exact mapping with caching
     festival_name = festival['FESTIVAL_NAME']
-    image_data = None
+    image_uri = None
 
     if festival_name in FESTIVAL_IMAGE_MAPPING:
         image_filename = FESTIVAL_IMAGE_MAPPING[festival_name]
         image_info = get_festival_image_info(stage_name, image_filename)
         if image_info["exists"]:
-            image_data = get_festival_image_from_stage(stage_name, image_filename)
+            # Cards cap the image at 350px, so embed a thumbnail rather than the original
+            image_uri = get_stage_thumbnail_uri(stage_name, image_filename, width=400)
 
-    # Create the entire card using a different approach - custom CSS with data attributes
-    card_id = f"festival-card-{festival_name.replace(' ', '-').lower()}"
-
-    # Add custom CSS for this specific card
-    st.markdown(f"""
-    <style>
-    #{card_id} {{
-        background: white !important;
-        padding: 2rem !important;
-        margin: 2rem 0 !important;
-        border-radius: 20px !important;
-        box-shadow: 0 15px 35px rgba(0,0,0,0.15) !important;
-        border: 3px solid #4ECDC4 !important;
-        display: flex !important;
-        align-items: flex-start !important;
-        gap: 2rem !important;
-        min-height: 300px !important;
-    }}
-    #{card_id} .image-section {{
-        flex: 1 !important;
-        max-width: 350px !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        min-height: 300px !important;
-    }}
-    #{card_id} .content-section {{
-        flex: 2 !important;
-        padding-left: 1rem !important;
-    }}
-    #{card_id} .image-container {{
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        width: 100% !important;
-        height: 100% !important;
-    }}
-    #{card_id} img {{
-        border-radius: 15px !important;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.2) !important;
-        max-width: 100% !important;
-        max-height: 250px !important;
-        width: auto !important;
-        height: auto !important;
-        object-fit: contain !important;
-    }}
-    </style>
-    """, unsafe_allow_html=True)
-
-    # Get image HTML using Snowflake data
-    if image_data:
-        try:
-            # Convert image data to base64 for embedding
-            import base64
-            img_str = base64.b64encode(image_data).decode()
-            image_html = f'<div class="image-container"><img src="data:image/jpeg;base64,{img_str}" alt="{festival_name}"></div>'
-        except:
-            image_html = f"""
-            <div class="image-container">
-                <div style="height: 250px; display: flex; align-items: center; justify-content: center;
-                            background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
-                            border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.2);">
-                    <div style="text-align: center; color: white;">
-                        <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🎪</div>
-                        <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{festival_name}</div>
-                    </div>
-                </div>
-            </div>
-            """
+    if image_uri:
+        image_html = render_card_html(FESTIVAL_IMAGE_TEMPLATE, {'image_uri': image_uri, 'name': festival_name})
     else:
-        image_html = f"""
-        <div class="image-container">
-            <div style="height: 250px; display: flex; align-items: center; justify-content: center;
-                        background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
-                        border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.2);">
-                <div style="text-align: center; color: white;">
-                    <div style="font-size: 3.5rem; margin-bottom: 0.5rem;">🎪</div>
-                    <div style="font-size: 1rem; font-weight: bold; opacity: 0.9;">{festival_name}</div>
-                </div>
-            </div>
-        </div>
-        """
-
-    # Create the complete card as a single HTML block
-    st.markdown(f"""
-    <div id="{card_id}">
-        <div class="image-section">
-            {image_html}
-        </div>
-        <div class="content-section">
-            <h2 style="color: #008080; font-family: 'Playfair Display', serif;
-                       font-size: 2rem; margin-bottom: 1rem; font-weight: bold;">
-                🎭 {festival['FESTIVAL_NAME']}
-            </h2>
-            <div style="margin-bottom: 1.5rem;">
-                <p style="color: #20B2AA; font-weight: bold; font-size: 1.1rem; margin-bottom: 0.5rem;">
-                    📍 {festival['STATE']}
-                </p>
-                <p style="color: #008080; font-weight: bold; font-size: 1rem; margin-bottom: 1rem;">
-                    📅 {festival['MONTH_SEASON']}
-                </p>
-            </div>
-            <div style="color: #333; line-height: 1.6; font-family: 'Poppins', sans-serif; font-size: 0.95rem;">
-                {festival['DESCRIPTION']}
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+        image_html = render_card_html(FESTIVAL_PLACEHOLDER_TEMPLATE, {'name': festival_name})
+
+    return {
+        'card_id': f"festival-card-{festival_name.replace(' ', '-').lower()}",
+        'image_html': image_html,
+        'name': festival_name,
+        'state': festival['STATE'],
+        'month_season': festival['MONTH_SEASON'],
+        'description': festival['DESCRIPTION']
+    }
 
-    # Add spacing between cards
-    st.markdown("<br>", unsafe_allow_html=True)
+def display_festival_cards(festivals, stage_name="FESTIVAL_IMAGES"):
+    """Display festivals as beautiful rectangular cards, sent to the browser as one element"""
+    cards = [get_festival_card(festival, stage_name) for _, festival in festivals.iterrows()]
+    render_card_list(FESTIVAL_CARD_TEMPLATE, cards, stylesheet=FESTIVAL_CARD_STYLESHEET)
 
 def show_festival_placeholder(festival_name):
     """Show placeholder for festival images"""
@@ -1,75 +1,75 @@
 import streamlit as st
 import pandas as pd
-from snowflake.snowpark.context import get_active_session
-
-def get_snowflake_session():
-    """Get active Snowflake session for Snowflake native apps"""
-    return get_active_session()
-
-@st.cache_data
-def get_heritage_image_from_stage(stage_name, file_path):
-    """Get heritage image binary data from Snowflake stage"""
-    try:
-        session = get_snowflake_session()
-
-        # Map stage name to full qualified name
-        if stage_name == "HERITAGE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."HERITAGE_IMAGES_STAGE"'
-        else:
-            full_stage_name = f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"'
-
-        # Use session.file.get_stream() for Snowflake Native Apps
-        stage_path = f"@{full_stage_name}/{file_path}"
-        image_data = session.file.get_stream(stage_path, decompress=False).read()
-
-        if image_data:
-            return image_data
-        else:
-            return None
-
-    except Exception as e:
-        return None
+from string import Template
+from .data_loader import load_heritage_sites_data, load_top_monuments_foreign_data
+from .card_lists import render_card_html, render_card_list
+from .html_templates import compile_panel, show_panel
+from .image_assets import image_exists, get_stage_thumbnail, get_stage_thumbnail_uri, prefetch_stage_thumbnails, prefetch_stage_thumbnails_in_background
+
+# Headline count tile of the heritage overview
+HERITAGE_STAT_TILE = compile_panel("""
+<div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
+            padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
+            margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
+            border: 2px solid #20B2AA; transition: transform 0.3s ease;">
+    <h5 style="color: #008080; margin-bottom: 1rem; font-size: 1.3rem; font-weight: 600;
+                font-family: 'Poppins', sans-serif;">$title</h5>
+    <p style="margin: 0; line-height: 1.6; font-size: 2.5rem; color: #008080;
+                font-weight: bold; font-family: 'Poppins', sans-serif;">$value</p>
+    <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">$label</p>
+</div>
+""")
+
+# Slideshow stand-in when a site's image is not on the stage
+SLIDE_IMAGE_PLACEHOLDER = compile_panel("""
+<div style="background: linear-gradient(135deg, #008080, #20B2AA); color: white;
+            padding: 8rem 2rem; border-radius: 15px; text-align: center; margin: 1rem 0;">
+    <h2 style="color: white; margin-bottom: 1rem; font-size: 2rem;">🏛️</h2>
+    <h3 style="color: white; margin: 0; font-size: 1.5rem;">$name</h3>
+    <p style="color: rgba(255,255,255,0.8); margin: 0.5rem 0 0 0;">$location</p>
+</div>
+""")
+
+# Slideshow side panel with the current site's story
+SLIDE_INFO_PANEL = compile_panel("""
+<div style="background: rgba(255,255,255,0.98); backdrop-filter: blur(15px);
+            padding: 2rem; border-radius: 20px; height: 100%;
+            box-shadow: 0 15px 35px rgba(0,128,128,0.2); border: 3px solid #008080;">
+    <h3 style="color: #008080; margin-bottom: 1rem; font-family: 'Playfair Display', serif;
+               font-size: 1.8rem; font-weight: 700;">
+        $name
+    </h3>
+    <p style="color: #666; font-size: 1rem; margin-bottom: 1rem; font-family: 'Poppins', sans-serif;">
+        📍 $location
+    </p>
+    <p style="color: #333; font-size: 1rem; line-height: 1.7; margin-bottom: 1.5rem;
+              font-family: 'Poppins', sans-serif; text-align: justify;">
+        $description
+    </p>
+    <div style="border-top: 2px solid #e0e0e0; padding-top: 1rem;">
+        <p style="color: #008080; font-size: 0.9rem; font-weight: 600; margin: 0;
+                  font-family: 'Poppins', sans-serif;">
+            ✨ $significance
+        </p>
+    </div>
+</div>
+""")
 
-@st.cache_data
 def get_heritage_image_info(stage_name, file_path):
-    """Cache heritage image existence info from Snowflake stage"""
-    try:
-        session = get_snowflake_session()
-
-        # Map stage name to full qualified name
-        if stage_name == "HERITAGE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."HERITAGE_IMAGES_STAGE"'
-        else:
-            full_stage_name = f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"'
-
-        query = f"LIST '@{full_stage_name}' PATTERN='.*{file_path}.*'"
-        result = session.sql(query).to_pandas()
-        return {"exists": not result.empty}
-    except:
-        return {"exists": False}
+    """Get heritage image existence info from the cached stage manifest"""
+    return {"exists": image_exists(stage_name, file_path)}
 
 def load_heritage_data():
-    """Load heritage sites data from Snowflake tables"""
-    try:
-        session = get_snowflake_session()
-
-        # Load heritage sites data from correct location
-        heritage_df = session.table("CULTURE_TOURISM_DB.CULTURAL_DATA.HERITAGE_SITES").to_pandas()
-
-        # Load top monuments data
-        protected_df = session.table("CULTURE_TOURISM_DB.TOURISM_DATA.TOP_MONUMENTS_FOREIGN_VISITS").to_pandas()
-
-        return heritage_df, protected_df
-    except Exception as e:
-        st.error(f"Error loading heritage data: {e}")
-        return pd.DataFrame(), pd.DataFrame()
+    """Load heritage sites and top monuments data through the configured data backend"""
+    return load_heritage_sites_data(), load_top_monuments_foreign_data()
 
-def show_heritage_section():
+def show_heritage_section(heritage_df=None):
     """Display enhanced heritage sites information with real data and creative storytelling"""
     st.markdown('<h2 class="section-header">🏛️ Heritage Sites</h2>', unsafe_allow_html=True)
 
-    # Load heritage data
-    heritage_df, protected_df = load_heritage_data()
+    # Load heritage data unless the caller already resolved it
+    if heritage_df is None:
+        heritage_df, protected_df = load_heritage_data()
 
     # Check if data loaded successfully
     if heritage_df.empty:
@@ -116,60 +116,16 @@ def show_heritage_section():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.markdown(f"""
-        <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
-                    padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
-                    margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-                    border: 2px solid #20B2AA; transition: transform 0.3s ease;">
-            <h5 style="color: #008080; margin-bottom: 1rem; font-size: 1.3rem; font-weight: 600;
-                        font-family: 'Poppins', sans-serif;">🏛️ Heritage Treasures</h5>
-            <p style="margin: 0; line-height: 1.6; font-size: 2.5rem; color: #008080;
-                        font-weight: bold; font-family: 'Poppins', sans-serif;">{total_sites}</p>
-            <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">Documented Sites</p>
-        </div>
-        """, unsafe_allow_html=True)
+        show_panel(HERITAGE_STAT_TILE, title="🏛️ Heritage Treasures", value=total_sites, label="Documented Sites")
 
     with col2:
-        st.markdown(f"""
-        <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
-                    padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
-                    margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-                    border: 2px solid #20B2AA; transition: transform 0.3s ease;">
-            <h5 style="color: #008080; margin-bottom: 1rem; font-size: 1.3rem; font-weight: 600;
-                        font-family: 'Poppins', sans-serif;">🗺️ Cultural Regions</h5>
-            <p style="margin: 0; line-height: 1.6; font-size: 2.5rem; color: #008080;
-                        font-weight: bold; font-family: 'Poppins', sans-serif;">{unique_states}</p>
-            <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">States & Territories</p>
-        </div>
-        """, unsafe_allow_html=True)
+        show_panel(HERITAGE_STAT_TILE, title="🗺️ Cultural Regions", value=unique_states, label="States & Territories")
 
     with col3:
-        st.markdown(f"""
-        <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
-                    padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
-                    margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-                    border: 2px solid #20B2AA; transition: transform 0.3s ease;">
-            <h5 style="color: #008080; margin-bottom: 1rem; font-size: 1.3rem; font-weight: 600;
-                        font-family: 'Poppins', sans-serif;">🏙️ Heritage Cities</h5>
-            <p style="margin: 0; line-height: 1.6; font-size: 2.5rem; color: #008080;
-                        font-weight: bold; font-family: 'Poppins', sans-serif;">{unique_cities}</p>
-            <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">Historic Centers</p>
-        </div>
-        """, unsafe_allow_html=True)
+        show_panel(HERITAGE_STAT_TILE, title="🏙️ Heritage Cities", value=unique_cities, label="Historic Centers")
 
     with col4:
-        st.markdown(f"""
-        <div style="background: rgba(255,255,255,0.95); backdrop-filter: blur(10px);
-                    padding: 2rem; border-radius: 15px; border-left: 6px solid #008080;
-                    margin-bottom: 1rem; text-align: center; box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-                    border: 2px solid #20B2AA; transition: transform 0.3s ease;">
-            <h5 style="color: #008080; margin-bottom: 1rem; font-size: 1.3rem; font-weight: 600;
-                        font-family: 'Poppins', sans-serif;">🕉️ Sacred Temples</h5>
-            <p style="margin: 0; line-height: 1.6; font-size: 2.5rem; color: #008080;
-                        font-weight: bold; font-family: 'Poppins', sans-serif;">{temple_count}</p>
-            <p style="margin: 0; color: #333; font-size: 1rem; font-weight: 500;">Divine Architecture</p>
-        </div>
-        """, unsafe_allow_html=True)
+        show_panel(HERITAGE_STAT_TILE, title="🕉️ Sacred Temples", value=temple_count, label="Divine Architecture")
     # Interactive Heritage Slideshow
     show_heritage_slideshow()
 
@@ -212,6 +168,7 @@ def show_heritage_section():
     </div>
     """, unsafe_allow_html=True)
 
+@st.fragment
 def show_heritage_slideshow():
     """Display an interactive heritage slideshow with real images"""
     st.markdown("""
@@ -309,7 +266,7 @@ def show_heritage_slideshow():
         # Use Snowflake stage for image loading
         # Extract filename from the image path
         image_filename = current_site["image"].split("/")[-1]
-        image_data = get_heritage_image_from_stage("HERITAGE_IMAGES", image_filename)
+        image_data = get_stage_thumbnail("HERITAGE_IMAGES", image_filename, width=800)
         if image_data:
             try:
                 st.image(image_data, use_container_width=True, caption=f"{current_site['name']}, {current_site['location']}")
@@ -317,39 +274,11 @@ def show_heritage_slideshow():
                 st.error(f"Error displaying heritage image: {e}")
                 show_heritage_placeholder(current_site['name'])
         else:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #008080, #20B2AA); color: white;
-                        padding: 8rem 2rem; border-radius: 15px; text-align: center; margin: 1rem 0;">
-                <h2 style="color: white; margin-bottom: 1rem; font-size: 2rem;">🏛️</h2>
-                <h3 style="color: white; margin: 0; font-size: 1.5rem;">{current_site['name']}</h3>
-                <p style="color: rgba(255,255,255,0.8); margin: 0.5rem 0 0 0;">{current_site['location']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(SLIDE_IMAGE_PLACEHOLDER, name=current_site['name'], location=current_site['location'])
 
     with col2:
-        st.markdown(f"""
-        <div style="background: rgba(255,255,255,0.98); backdrop-filter: blur(15px);
-                    padding: 2rem; border-radius: 20px; height: 100%;
-                    box-shadow: 0 15px 35px rgba(0,128,128,0.2); border: 3px solid #008080;">
-            <h3 style="color: #008080; margin-bottom: 1rem; font-family: 'Playfair Display', serif;
-                       font-size: 1.8rem; font-weight: 700;">
-                {current_site['name']}
-            </h3>
-            <p style="color: #666; font-size: 1rem; margin-bottom: 1rem; font-family: 'Poppins', sans-serif;">
-                📍 {current_site['location']}
-            </p>
-            <p style="color: #333; font-size: 1rem; line-height: 1.7; margin-bottom: 1.5rem;
-                      font-family: 'Poppins', sans-serif; text-align: justify;">
-                {current_site['description']}
-            </p>
-            <div style="border-top: 2px solid #e0e0e0; padding-top: 1rem;">
-                <p style="color: #008080; font-size: 0.9rem; font-weight: 600; margin: 0;
-                          font-family: 'Poppins', sans-serif;">
-                    ✨ {current_site['significance']}
-                </p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        show_panel(SLIDE_INFO_PANEL, name=current_site['name'], location=current_site['location'],
+                   description=current_site['description'], significance=current_site['significance'])
 
     # Slide indicators with enhanced styling
     st.markdown(f"""
@@ -361,6 +290,15 @@ def show_heritage_slideshow():
     </div>
     """, unsafe_allow_html=True)
 
+    # Warm the neighbouring slides so the next ◀/▶ click is served from the cache
+    index = st.session_state.heritage_slide_index
+    neighbours = {(index - 1) % len(featured_sites), (index + 1) % len(featured_sites)}
+    prefetch_stage_thumbnails_in_background(
+        "HERITAGE_IMAGES",
+        [[featured_sites[i]["image"].split("/")[-1]] for i in neighbours],
+        width=800
+    )
+
 def display_heritage_site_card(site):
     """Display an enhanced heritage site card with better styling"""
     # Determine icon based on type
@@ -415,6 +353,215 @@ def display_heritage_site_card(site):
     </div>
     """, unsafe_allow_html=True)
 
+# Shared by every card in the heritage gallery, sent once with the first batch of cards
+HERITAGE_GALLERY_STYLESHEET = """
+/* Pinterest-style masonry layout */
+.pinterest-container {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+    grid-gap: 20px;
+    margin: 20px 0;
+    padding: 0 10px;
+}
+
+/* Responsive breakpoints */
+@media (max-width: 1400px) {
+    .pinterest-container {
+        grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
+    }
+}
+
+@media (max-width: 1200px) {
+    .pinterest-container {
+        grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
+        grid-gap: 15px;
+    }
+}
+
+@media (max-width: 768px) {
+    .pinterest-container {
+        grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
+        grid-gap: 12px;
+        padding: 0 5px;
+    }
+}
+
+@media (max-width: 480px) {
+    .pinterest-container {
+        grid-template-columns: 1fr;
+        grid-gap: 10px;
+        padding: 0;
+    }
+}
+
+/* Pinterest card styling */
+.pinterest-card {
+    background: white;
+    border-radius: 15px;
+    overflow: hidden;
+    box-shadow: 0 8px 25px rgba(0,128,128,0.15);
+    border: 2px solid #20B2AA;
+    transition: all 0.1s ease;
+    cursor: pointer;
+    position: relative;
+}
+
+.pinterest-card:hover {
+    transform: translateY(-8px) scale(1.02);
+    box-shadow: 0 20px 40px rgba(0,128,128,0.3);
+    border-color: #008080;
+}
+
+.pinterest-card img {
+    width: 100%;
+    height: auto;
+    display: block;
+    transition: transform 0.3s ease;
+}
+
+.pinterest-card:hover img {
+    transform: scale(1.05);
+}
+
+.pinterest-card-content {
+    padding: 15px;
+    background: white;
+}
+
+.pinterest-card-title {
+    color: #008080;
+    font-size: 1.1rem;
+    font-weight: 700;
+    margin-bottom: 8px;
+    font-family: 'Playfair Display', serif;
+    line-height: 1.3;
+    display: -webkit-box;
+    -webkit-line-clamp: 2;
+    -webkit-box-orient: vertical;
+    overflow: hidden;
+}
+
+.pinterest-card-location {
+    color: #666;
+    font-size: 0.9rem;
+    margin-bottom: 10px;
+    font-family: 'Poppins', sans-serif;
+    display: flex;
+    align-items: center;
+}
+
+.pinterest-card-type {
+    background: linear-gradient(135deg, #008080, #20B2AA);
+    color: white;
+    padding: 6px 12px;
+    border-radius: 20px;
+    font-size: 0.8rem;
+    font-weight: 600;
+    display: inline-block;
+    font-family: 'Poppins', sans-serif;
+    text-transform: capitalize;
+    box-shadow: 0 2px 8px rgba(0,128,128,0.3);
+}
+
+.pinterest-placeholder {
+    width: 100%;
+    height: 200px;
+    background: linear-gradient(135deg, #008080, #20B2AA);
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    color: white;
+    font-size: 1.2rem;
+    font-family: 'Poppins', sans-serif;
+    text-align: center;
+    position: relative;
+}
+
+.pinterest-placeholder::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    bottom: 0;
+    background: linear-gradient(45deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%);
+    animation: shimmer 2s infinite;
+}
+
+@keyframes shimmer {
+    0% { transform: translateX(-100%); }
+    100% { transform: translateX(100%); }
+}
+
+/* Card content */
+.pinterest-card-name {
+    background: linear-gradient(135deg, #004d4d);
+    color: white;
+    padding: 4px 10px;
+    border-radius: 8px;
+    font-size: 1rem;
+    font-weight: 600;
+    margin: 5px 5px 10px 5px;
+    font-family: 'Poppins', sans-serif;
+    line-height: 1.3;
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.5);
+}
+
+.pinterest-card-chip {
+    background: white;
+    color: black;
+    padding: 4px 12px;
+    border-radius: 8px;
+    font-size: 0.8rem;
+    margin-bottom: 8px;
+    font-family: 'Poppins', sans-serif;
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
+}
+
+.pinterest-card-location {
+    margin-top: 10px;
+    margin-bottom: 10px;
+}
+
+.pinterest-card-kind {
+    display: inline-block;
+}
+
+/* Streamlit column adjustments for Pinterest layout */
+.stColumn > div {
+    padding: 0 !important;
+}
+
+/* Remove default Streamlit margins */
+.element-container {
+    margin-bottom: 0 !important;
+}
+"""
+
+# Pinterest-style card: thumbnail (or placeholder) above the name, location and type chips
+HERITAGE_CARD_TEMPLATE = Template("""<div class="pinterest-card">$image_html<div class="pinterest-card-name">$name<div class="pinterest-card-chip pinterest-card-location">📍 $city, $state</div><div class="pinterest-card-chip pinterest-card-kind">$heritage_type</div></div></div>""")
+
+HERITAGE_IMAGE_TEMPLATE = Template('<img src="$image_uri" alt="$name">')
+
+HERITAGE_PLACEHOLDER_TEMPLATE = Template('<div class="pinterest-placeholder">🏛️<br>$short_name...</div>')
+
+def get_heritage_card(site):
+    """Get the template values for one heritage gallery card"""
+    # Cards are at most ~350px wide, so the 400px thumbnail warmed by the prefetch is enough
+    image_uri = get_stage_thumbnail_uri("HERITAGE_IMAGES", site['IMAGE_NAME'], width=400)
+    if image_uri:
+        image_html = render_card_html(HERITAGE_IMAGE_TEMPLATE, {'image_uri': image_uri, 'name': site['HERITAGE_NAME']})
+    else:
+        image_html = render_card_html(HERITAGE_PLACEHOLDER_TEMPLATE, {'short_name': site['HERITAGE_NAME'][:20]})
+
+    return {
+        'image_html': image_html,
+        'name': site['HERITAGE_NAME'],
+        'city': site['CITY_NAME'],
+        'state': site['STATE_NAME'],
+        'heritage_type': site['HERITAGE_TYPE']
+    }
+
 def show_heritage_gallery(heritage_df):
     """Display a Pinterest-style gallery of heritage sites from CSV data"""
     if heritage_df.empty:
@@ -488,160 +635,7 @@ def show_heritage_gallery(heritage_df):
         </div>
         """, unsafe_allow_html=True)
 
-        # Enhanced Pinterest-style CSS for better responsive design
-        st.markdown("""
-        <style>
-        /* Pinterest-style masonry layout */
-        .pinterest-container {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            grid-gap: 20px;
-            margin: 20px 0;
-            padding: 0 10px;
-        }
-
-        /* Responsive breakpoints */
-        @media (max-width: 1400px) {
-            .pinterest-container {
-                grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            }
-        }
-
-        @media (max-width: 1200px) {
-            .pinterest-container {
-                grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
-                grid-gap: 15px;
-            }
-        }
-
-        @media (max-width: 768px) {
-            .pinterest-container {
-                grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
-                grid-gap: 12px;
-                padding: 0 5px;
-            }
-        }
-
-        @media (max-width: 480px) {
-            .pinterest-container {
-                grid-template-columns: 1fr;
-                grid-gap: 10px;
-                padding: 0;
-            }
-        }
-
-        /* Pinterest card styling */
-        .pinterest-card {
-            background: white;
-            border-radius: 15px;
-            overflow: hidden;
-            box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-            border: 2px solid #20B2AA;
-            transition: all 0.1s ease;
-            cursor: pointer;
-            position: relative;
-        }
-
-        .pinterest-card:hover {
-            transform: translateY(-8px) scale(1.02);
-            box-shadow: 0 20px 40px rgba(0,128,128,0.3);
-            border-color: #008080;
-        }
-
-        .pinterest-card img {
-            width: 100%;
-            height: auto;
-            display: block;
-            transition: transform 0.3s ease;
-        }
-
-        .pinterest-card:hover img {
-            transform: scale(1.05);
-        }
-
-        .pinterest-card-content {
-            padding: 15px;
-            background: white;
-        }
-
-        .pinterest-card-title {
-            color: #008080;
-            font-size: 1.1rem;
-            font-weight: 700;
-            margin-bottom: 8px;
-            font-family: 'Playfair Display', serif;
-            line-height: 1.3;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }
-
-        .pinterest-card-location {
-            color: #666;
-            font-size: 0.9rem;
-            margin-bottom: 10px;
-            font-family: 'Poppins', sans-serif;
-            display: flex;
-            align-items: center;
-        }
-
-        .pinterest-card-type {
-            background: linear-gradient(135deg, #008080, #20B2AA);
-            color: white;
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            font-weight: 600;
-            display: inline-block;
-            font-family: 'Poppins', sans-serif;
-            text-transform: capitalize;
-            box-shadow: 0 2px 8px rgba(0,128,128,0.3);
-        }
-
-        .pinterest-placeholder {
-            width: 100%;
-            height: 200px;
-            background: linear-gradient(135deg, #008080, #20B2AA);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 1.2rem;
-            font-family: 'Poppins', sans-serif;
-            text-align: center;
-            position: relative;
-        }
-
-        .pinterest-placeholder::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(45deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%);
-            animation: shimmer 2s infinite;
-        }
-
-        @keyframes shimmer {
-            0% { transform: translateX(-100%); }
-            100% { transform: translateX(100%); }
-        }
-
-        /* Streamlit column adjustments for Pinterest layout */
-        .stColumn > div {
-            padding: 0 !important;
-        }
-
-        /* Remove default Streamlit margins */
-        .element-container {
-            margin-bottom: 0 !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Create Pinterest-style gallery using Streamlit columns for better performance
+        # Create Pinterest-style gallery
         total_sites = len(filtered_df)
 
         # Add pagination for better performance with large datasets
@@ -654,109 +648,16 @@ def show_heritage_gallery(heritage_df):
         sites_to_show = min(st.session_state.heritage_sites_shown, total_sites)
         display_df = filtered_df.head(sites_to_show)
 
-        # Display Pinterest-style gallery using Streamlit's native components
-        # This approach is more efficient than base64 encoding all images
-
-        # Create a container for the Pinterest layout
-        st.markdown('<div class="pinterest-container">', unsafe_allow_html=True)
+        # Fetch every visible card's image concurrently before the cards render
+        prefetch_stage_thumbnails("HERITAGE_IMAGES", display_df['IMAGE_NAME'], width=400)
 
-        # Use Streamlit columns to create a masonry-like effect
-        # Responsive column count based on screen size
-        # Note: Streamlit doesn't have built-in responsive detection, so we use a reasonable default
-        num_columns = 4  # Default for desktop
-        cols = st.columns(num_columns, gap="small")
-
-        # Distribute sites across columns for masonry effect
-        for idx, (_, site) in enumerate(display_df.iterrows()):
-            col_idx = idx % num_columns
-
-            with cols[col_idx]:
-                # Create Pinterest-style card
-                with st.container():
-                    # Custom CSS for this specific card
-                    st.markdown(f"""
-                    <div class="pinterest-card" style="
-                        break-inside: avoid;
-                        margin-bottom: 20px;
-                        background: white;
-                        border-radius: 15px;
-                        overflow: hidden;
-                        box-shadow: 0 8px 25px rgba(0,128,128,0.15);
-                        border: 2px solid #20B2AA;
-                        transition: transform 0.3s ease, box-shadow 0.3s ease;
-                    ">
-                    """, unsafe_allow_html=True)
-
-                    # Display image using Snowflake stage
-                    image_filename = site['IMAGE_NAME']
-                    image_data = get_heritage_image_from_stage("HERITAGE_IMAGES", image_filename)
-
-                    if image_data:
-                        try:
-                            st.image(image_data, use_container_width=True, caption="")
-                        except Exception as e:
-                            show_heritage_placeholder(site['HERITAGE_NAME'])
-                    else:
-                        st.markdown(f"""
-                        <div style="
-                            width: 100%;
-                            height: 200px;
-                            background: linear-gradient(135deg, #008080, #20B2AA);
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                            color: white;
-                            font-size: 1.2rem;
-                            font-family: 'Poppins', sans-serif;
-                            text-align: center;
-                        ">
-                            🏛️<br>{site["HERITAGE_NAME"][:20]}...
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    # Card content
-                    st.markdown(f"""
-                    <div style="padding: 5px;">
-                        <div style="
-                            background: linear-gradient(135deg, #004d4d);
-                            color: white;
-                            padding: 4px 10px;
-                            border-radius: 8px;
-                            font-size: 1rem;
-                            font-weight: 600;
-                            margin-bottom: 10px;
-                            font-family: 'Poppins', sans-serif;
-                            line-height: 1.3;
-                            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.5);
-                        ">{site["HERITAGE_NAME"]}<br>
-                        <div style="
-                            background: white;
-                            color: black;
-                            padding: 4px 12px;
-                            border-radius: 8px;
-                            font-size: 0.8rem;
-                            margin-top:10px;
-                            margin-bottom: 10px;
-                            font-family: 'Poppins', sans-serif;
-                            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-                        ">📍 {site["CITY_NAME"]}, {site["STATE_NAME"]}</div>
-                        <div style="
-                            background: white;
-                            color: black;
-                            padding: 4px 12px;
-                            margin-bottom:8px;
-                            border-radius: 8px;
-                            font-size: 0.8rem;
-                            display: inline-block;
-                            font-family: 'Poppins', sans-serif;
-                            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-                        ">{site["HERITAGE_TYPE"]}</div></div>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    st.markdown("</div>", unsafe_allow_html=True)
-
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Each loaded batch of cards is its own grid element with unchanged content across reruns,
+        # so after Load More Streamlit sends only the new batch and replays earlier ones from the browser's message cache
+        for start in range(0, sites_to_show, sites_per_page):
+            batch_df = display_df.iloc[start:start + sites_per_page]
+            render_card_list(HERITAGE_CARD_TEMPLATE, [get_heritage_card(site) for _, site in batch_df.iterrows()],
+                             stylesheet=HERITAGE_GALLERY_STYLESHEET if start == 0 else "",
+                             container_class="pinterest-container")
 
         # Status text and Load More button on same line
         col1, col2, col3 = st.columns([1, 2, 1])
@@ -774,28 +675,6 @@ def show_heritage_gallery(heritage_df):
                     </div>
                     """, unsafe_allow_html=True)
                 with col_button:
-                    # Add custom CSS for button styling
-                    st.markdown("""
-                    <style>
-                    div.stButton > button[key="load_more_heritage"] {
-                        background: linear-gradient(135deg, #008080, #20B2AA) !important;
-                        color: white !important;
-                        border: none !important;
-                        border-radius: 25px !important;
-                        padding: 0.5rem 1rem !important;
-                        font-weight: 600 !important;
-                        font-family: 'Poppins', sans-serif !important;
-                        box-shadow: 0 4px 12px rgba(0,128,128,0.3) !important;
-                        transition: all 0.3s ease !important;
-                    }
-                    div.stButton > button[key="load_more_heritage"]:hover {
-                        background: linear-gradient(135deg, #20B2AA, #008080) !important;
-                        transform: translateY(-2px) !important;
-                        box-shadow: 0 6px 16px rgba(0,128,128,0.4) !important;
-                    }
-                    </style>
-                    """, unsafe_allow_html=True)
-
                     if st.button(f"🔄 Load 20 More",
                                key="load_more_heritage",
                                help="Load more heritage sites"):
@@ -834,6 +713,11 @@ def show_heritage_gallery(heritage_df):
 
 # Note: display_heritage_gallery_card function removed - now using CSS Grid approach
 
+# One ranked row in the regional insights lists
+INSIGHT_ROW_TEMPLATE = Template("""<div style="background: rgba(255,255,255,0.9); padding: 1rem; border-radius: 10px; margin-bottom: 0.5rem; border-left: 4px solid #20B2AA;">
+<p style="margin: 0; color: #333; font-family: 'Poppins', sans-serif;">$emoji <strong>$label</strong>: $count $unit</p>
+</div>""")
+
 def show_regional_heritage_insights(heritage_df):
     """Display regional heritage insights and patterns"""
     st.markdown("""
@@ -860,16 +744,11 @@ def show_regional_heritage_insights(heritage_df):
         </div>
         """, unsafe_allow_html=True)
 
-        for i, (state, count) in enumerate(state_counts.items()):
-            rank_emoji = ["🥇", "🥈", "🥉", "🏅", "⭐"][i]
-            st.markdown(f"""
-            <div style="background: rgba(255,255,255,0.9); padding: 1rem; border-radius: 10px;
-                        margin-bottom: 0.5rem; border-left: 4px solid #20B2AA;">
-                <p style="margin: 0; color: #333; font-family: 'Poppins', sans-serif;">
-                    {rank_emoji} <strong>{state}</strong>: {count} heritage sites
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        rank_emojis = ["🥇", "🥈", "🥉", "🏅", "⭐"]
+        render_card_list(INSIGHT_ROW_TEMPLATE, [
+            {'emoji': rank_emoji, 'label': state, 'count': count, 'unit': 'heritage sites'}
+            for rank_emoji, (state, count) in zip(rank_emojis, state_counts.items())
+        ])
 
     with col2:
         st.markdown("""
@@ -884,16 +763,10 @@ def show_regional_heritage_insights(heritage_df):
 
         type_emojis = {"Temple": "🕉️", "Monument": "🏛️", "Palace": "👑", "Fort": "🏰", "Church": "⛪", "Mosque": "🕌"}
 
-        for heritage_type, count in heritage_type_counts.items():
-            emoji = type_emojis.get(heritage_type, "🏛️")
-            st.markdown(f"""
-            <div style="background: rgba(255,255,255,0.9); padding: 1rem; border-radius: 10px;
-                        margin-bottom: 0.5rem; border-left: 4px solid #20B2AA;">
-                <p style="margin: 0; color: #333; font-family: 'Poppins', sans-serif;">
-                    {emoji} <strong>{heritage_type}</strong>: {count} sites
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_card_list(INSIGHT_ROW_TEMPLATE, [
+            {'emoji': type_emojis.get(heritage_type, "🏛️"), 'label': heritage_type, 'count': count, 'unit': 'sites'}
+            for heritage_type, count in heritage_type_counts.items()
+        ])
 
     # Heritage storytelling insights
     st.markdown("""
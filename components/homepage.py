@@ -2,62 +2,105 @@ import streamlit as st
 import pandas as pd
 import os
 from PIL import Image
-from snowflake.snowpark.context import get_active_session
+from .html_templates import compile_panel, show_panel
+from .image_assets import image_exists, get_stage_thumbnail_uri, get_first_stage_thumbnail, get_image_data_uri
 from utils.helpers import create_india_map, create_tourism_growth_trend_chart, create_year_over_year_growth_chart, create_decade_comparison_chart, create_gdp_contribution_chart, create_employment_trends_chart
 
-def get_snowflake_session():
-    """Get active Snowflake session for Snowflake native apps"""
-    return get_active_session()
-
-@st.cache_data
-def get_image_from_stage(stage_name, file_path):
-    """Get image binary data from Snowflake stage"""
-    try:
-        session = get_snowflake_session()
-
-        # Map stage name to full qualified name
-        if stage_name == "FESTIVAL_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."FESTIVAL_IMAGES_STAGE"'
-        elif stage_name == "HERITAGE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."HERITAGE_IMAGES_STAGE"'
-        elif stage_name == "DANCE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."DANCE_IMAGES_STAGE"'
-        else:
-            full_stage_name = f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"'
-
-        # Use session.file.get_stream() for Snowflake Native Apps
-        stage_path = f"@{full_stage_name}/{file_path}"
-        image_data = session.file.get_stream(stage_path, decompress=False).read()
-
-        if image_data:
-            return image_data
-        else:
-            return None
-
-    except Exception as e:
-        return None
+# Headline metric tile of the economic impact row
+METRIC_CARD = compile_panel("""
+<div class="metric-card">
+    <div class="metric-icon">$icon</div>
+    <div class="metric-number">$value</div>
+    <div class="metric-label">$label</div>
+    <div class="metric-sublabel">$sublabel</div>
+</div>
+""")
+
+# Highlight cards; image_html is the stage image or the icon placeholder
+FESTIVAL_HIGHLIGHT_CARD = compile_panel("""
+<div class="enhanced-festival-card">
+    <div class="festival-card-header">
+        $image_html
+        <div class="festival-card-overlay">
+            <div class="festival-card-category">🎭 Festival</div>
+        </div>
+    </div>
+    <div class="festival-card-content">
+        <h4 class="festival-card-title">$name</h4>
+        <div class="festival-card-details">
+            <div class="festival-detail-item">
+                <span class="detail-icon">📍</span>
+                <span class="detail-text">$state</span>
+            </div>
+            <div class="festival-detail-item">
+                <span class="detail-icon">📅</span>
+                <span class="detail-text">$month_season</span>
+            </div>
+        </div>
+        <p class="festival-card-description">
+            $description...
+        </p>
+    </div>
+</div>
+""")
+
+HERITAGE_HIGHLIGHT_CARD = compile_panel("""
+<div class="enhanced-heritage-card">
+    <div class="heritage-card-header">
+        $image_html
+        <div class="heritage-card-overlay">
+            <div class="heritage-card-category">🏛️ Heritage</div>
+        </div>
+    </div>
+    <div class="heritage-card-content">
+        <h4 class="heritage-card-title">$name</h4>
+        <div class="heritage-card-details">
+            <div class="heritage-detail-item">
+                <span class="detail-icon">📍</span>
+                <span class="detail-text">$location</span>
+            </div>
+            <div class="heritage-detail-item">
+                <span class="detail-icon">🏗️</span>
+                <span class="detail-text">$type</span>
+            </div>
+        </div>
+        <p class="heritage-card-description">
+            $description
+        </p>
+    </div>
+</div>
+""")
+
+DANCE_HIGHLIGHT_CARD = compile_panel("""
+<div class="enhanced-dance-card">
+    <div class="dance-card-header">
+        $image_html
+        <div class="dance-card-overlay">
+            <div class="dance-card-category">💃 Dance</div>
+        </div>
+    </div>
+    <div class="dance-card-content">
+        <h4 class="dance-card-title">$name</h4>
+        <div class="dance-card-details">
+            <div class="dance-detail-item">
+                <span class="detail-icon">📍</span>
+                <span class="detail-text">$origin</span>
+            </div>
+            <div class="dance-detail-item">
+                <span class="detail-icon">🎨</span>
+                <span class="detail-text">$style</span>
+            </div>
+        </div>
+        <p class="dance-card-description">
+            $description
+        </p>
+    </div>
+</div>
+""")
 
-@st.cache_data
 def get_image_info(stage_name, file_path):
-    """Cache image existence info from Snowflake stage"""
-    try:
-        session = get_snowflake_session()
-
-        # Map stage name to full qualified name
-        if stage_name == "FESTIVAL_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."FESTIVAL_IMAGES_STAGE"'
-        elif stage_name == "HERITAGE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."HERITAGE_IMAGES_STAGE"'
-        elif stage_name == "DANCE_IMAGES":
-            full_stage_name = '"CULTURE_TOURISM_DB"."ASSETS"."DANCE_IMAGES_STAGE"'
-        else:
-            full_stage_name = f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"'
-
-        query = f"LIST '@{full_stage_name}' PATTERN='.*{file_path}.*'"
-        result = session.sql(query).to_pandas()
-        return {"exists": not result.empty}
-    except:
-        return {"exists": False}
+    """Get image existence info from the cached stage manifest"""
+    return {"exists": image_exists(stage_name, file_path)}
 
 def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, tourism_employment_df=None):
     """Display enhanced homepage with overview including GDP and employment stats"""
@@ -84,23 +127,10 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
             latest_gdp_contribution = tourism_gdp_df['DIRECT_CONTRIBUTION_GDP_PERCENT'].iloc[-1]
             latest_year = tourism_gdp_df['YEAR'].iloc[-1]
             first_year = tourism_gdp_df['YEAR'].iloc[0]
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-icon">💰</div>
-                <div class="metric-number">{latest_gdp_contribution:.1f}%</div>
-                <div class="metric-label">GDP Contribution</div>
-                <div class="metric-sublabel">Since {first_year} | Latest: {latest_year}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(METRIC_CARD, icon="💰", value=f"{latest_gdp_contribution:.1f}%", label="GDP Contribution",
+                       sublabel=f"Since {first_year} | Latest: {latest_year}")
         else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-icon">💰</div>
-                <div class="metric-number">2.6%</div>
-                <div class="metric-label">GDP Contribution</div>
-                <div class="metric-sublabel">Since 2015-16</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(METRIC_CARD, icon="💰", value="2.6%", label="GDP Contribution", sublabel="Since 2015-16")
 
     with col6:
         # Tourism employment
@@ -108,23 +138,10 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
             latest_employment = tourism_employment_df['TOURISM_CHARACTERISTIC_INDUSTRIES_MILLION'].iloc[-1]
             latest_year = tourism_employment_df['YEAR'].iloc[-1]
             first_year = tourism_employment_df['YEAR'].iloc[0]
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-icon">👥</div>
-                <div class="metric-number">{latest_employment:.1f}M</div>
-                <div class="metric-label">Tourism Jobs</div>
-                <div class="metric-sublabel">Since {first_year} | Latest: {latest_year}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(METRIC_CARD, icon="👥", value=f"{latest_employment:.1f}M", label="Tourism Jobs",
+                       sublabel=f"Since {first_year} | Latest: {latest_year}")
         else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-icon">👥</div>
-                <div class="metric-number">33M</div>
-                <div class="metric-label">Tourism Jobs</div>
-                <div class="metric-sublabel">Since 2015-16</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(METRIC_CARD, icon="👥", value="33M", label="Tourism Jobs", sublabel="Since 2015-16")
 
     with col7:
         # Total tourism employment (direct + indirect)
@@ -132,23 +149,10 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
             total_employment = tourism_employment_df['DIRECT_INDIRECT_EMPLOYMENT_MILLION'].iloc[-1]
             latest_year = tourism_employment_df['YEAR'].iloc[-1]
             first_year = tourism_employment_df['YEAR'].iloc[0]
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-icon">🏢</div>
-                <div class="metric-number">{total_employment:.1f}M</div>
-                <div class="metric-label">Total Tourism Employment</div>
-                <div class="metric-sublabel">Since {first_year} | Latest: {latest_year}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(METRIC_CARD, icon="🏢", value=f"{total_employment:.1f}M", label="Total Tourism Employment",
+                       sublabel=f"Since {first_year} | Latest: {latest_year}")
         else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-icon">🏢</div>
-                <div class="metric-number">76M</div>
-                <div class="metric-label">Total Tourism Employment</div>
-                <div class="metric-sublabel">Since 2015-16</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(METRIC_CARD, icon="🏢", value="76M", label="Total Tourism Employment", sublabel="Since 2015-16")
 
     with col8:
         # Tourism's share in total employment
@@ -156,23 +160,10 @@ def show_homepage(festivals_df, ita_df, state_tourism_df, tourism_gdp_df=None, t
             employment_share = tourism_employment_df['DIRECT_INDIRECT_SHARE_PERCENT'].iloc[-1]
             latest_year = tourism_employment_df['YEAR'].iloc[-1]
             first_year = tourism_employment_df['YEAR'].iloc[0]
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-icon">📊</div>
-                <div class="metric-number">{employment_share:.1f}%</div>
-                <div class="metric-label">Employment Share</div>
-                <div class="metric-sublabel">Since {first_year} | Latest: {latest_year}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(METRIC_CARD, icon="📊", value=f"{employment_share:.1f}%", label="Employment Share",
+                       sublabel=f"Since {first_year} | Latest: {latest_year}")
         else:
-            st.markdown("""
-            <div class="metric-card">
-                <div class="metric-icon">📊</div>
-                <div class="metric-number">12.6%</div>
-                <div class="metric-label">Employment Share</div>
-                <div class="metric-sublabel">Since 2015-16</div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(METRIC_CARD, icon="📊", value="12.6%", label="Employment Share", sublabel="Since 2015-16")
 
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -275,32 +266,14 @@ def show_festival_highlights(festivals_df):
             image_filename = target_festivals.get(festival_name, f"{festival_name.lower().replace(' ', '_')}-national.jpg")
 
             # Try to get image from Snowflake stage
-            image_data = get_image_from_stage("FESTIVAL_IMAGES", image_filename)
+            image_uri = get_stage_thumbnail_uri("FESTIVAL_IMAGES", image_filename, width=400)
 
             image_found = False
             image_html = ""
 
-            if image_data:
-                # Convert image data to base64 for embedding (maintaining original styling)
-                import base64
-                import io
-                from PIL import Image as PILImage
-
-                try:
-                    # Load image from binary data
-                    img = PILImage.open(io.BytesIO(image_data))
-                    # Resize image
-                    img.thumbnail((400, 250), PILImage.Resampling.LANCZOS)
-
-                    # Convert to base64
-                    buffered = io.BytesIO()
-                    img.save(buffered, format="JPEG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
-
-                    image_html = f'<img src="data:image/jpeg;base64,{img_str}" class="festival-card-image" alt="{festival_data["FESTIVAL_NAME"]}">'
-                    image_found = True
-                except:
-                    image_found = False
+            if image_uri:
+                image_html = f'<img src="{image_uri}" class="festival-card-image" alt="{festival_data["FESTIVAL_NAME"]}">'
+                image_found = True
 
             if not image_found:
                 # Create enhanced placeholder (original styling)
@@ -312,32 +285,9 @@ def show_festival_highlights(festivals_df):
                 """
 
             # Enhanced festival card with animations and better styling (ORIGINAL STYLING)
-            st.markdown(f"""
-            <div class="enhanced-festival-card">
-                <div class="festival-card-header">
-                    {image_html}
-                    <div class="festival-card-overlay">
-                        <div class="festival-card-category">🎭 Festival</div>
-                    </div>
-                </div>
-                <div class="festival-card-content">
-                    <h4 class="festival-card-title">{festival_data['FESTIVAL_NAME']}</h4>
-                    <div class="festival-card-details">
-                        <div class="festival-detail-item">
-                            <span class="detail-icon">📍</span>
-                            <span class="detail-text">{festival_data['STATE']}</span>
-                        </div>
-                        <div class="festival-detail-item">
-                            <span class="detail-icon">📅</span>
-                            <span class="detail-text">{festival_data['MONTH_SEASON']}</span>
-                        </div>
-                    </div>
-                    <p class="festival-card-description">
-                        {festival_data['DESCRIPTION'][:120]}...
-                    </p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(FESTIVAL_HIGHLIGHT_CARD, image_html=image_html, name=festival_data['FESTIVAL_NAME'],
+                       state=festival_data['STATE'], month_season=festival_data['MONTH_SEASON'],
+                       description=festival_data['DESCRIPTION'][:120])
 
 def show_heritage_highlights():
     """Display heritage site highlights"""
@@ -376,34 +326,11 @@ def show_heritage_highlights():
 
         with cols[col_idx]:
             # Try to load and display heritage image from Snowflake stage
-            image_data = get_image_from_stage("HERITAGE_IMAGES", site['image_filename'])
+            image_uri = get_stage_thumbnail_uri("HERITAGE_IMAGES", site['image_filename'], width=400)
             image_html = ""
 
-            if image_data:
-                try:
-                    # Convert image data to base64 for embedding (maintaining original styling)
-                    import base64
-                    import io
-                    from PIL import Image as PILImage
-
-                    # Load image from binary data
-                    img = PILImage.open(io.BytesIO(image_data))
-                    # Resize image
-                    img.thumbnail((400, 250), PILImage.Resampling.LANCZOS)
-
-                    # Convert to base64
-                    buffered = io.BytesIO()
-                    img.save(buffered, format="JPEG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
-
-                    image_html = f'<img src="data:image/jpeg;base64,{img_str}" class="heritage-card-image" alt="{site["name"]}">'
-                except:
-                    # Fallback to icon
-                    image_html = f"""
-                    <div class="heritage-icon-container">
-                        <span class="heritage-icon">{site['icon']}</span>
-                    </div>
-                    """
+            if image_uri:
+                image_html = f'<img src="{image_uri}" class="heritage-card-image" alt="{site["name"]}">'
             else:
                 # Fallback to icon
                 image_html = f"""
@@ -413,32 +340,8 @@ def show_heritage_highlights():
                 """
 
             # ORIGINAL STYLING - Enhanced heritage card
-            st.markdown(f"""
-            <div class="enhanced-heritage-card">
-                <div class="heritage-card-header">
-                    {image_html}
-                    <div class="heritage-card-overlay">
-                        <div class="heritage-card-category">🏛️ Heritage</div>
-                    </div>
-                </div>
-                <div class="heritage-card-content">
-                    <h4 class="heritage-card-title">{site['name']}</h4>
-                    <div class="heritage-card-details">
-                        <div class="heritage-detail-item">
-                            <span class="detail-icon">📍</span>
-                            <span class="detail-text">{site['location']}</span>
-                        </div>
-                        <div class="heritage-detail-item">
-                            <span class="detail-icon">🏗️</span>
-                            <span class="detail-text">{site['type']}</span>
-                        </div>
-                    </div>
-                    <p class="heritage-card-description">
-                        {site['description']}
-                    </p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(HERITAGE_HIGHLIGHT_CARD, image_html=image_html, name=site['name'], location=site['location'],
+                       type=site['type'], description=site['description'])
 
 def show_dance_highlights():
     """Display dance form highlights"""
@@ -477,40 +380,14 @@ def show_dance_highlights():
 
         with cols[col_idx]:
             # Try to load and display dance image from Snowflake stage
-            # First try with the dance_images_stage/ prefix
-            file_path_with_prefix = f"dance_images_stage/{dance['image_filename']}"
-            image_data = get_image_from_stage("DANCE_IMAGES", file_path_with_prefix)
-
-            # If that doesn't work, try without prefix
-            if not image_data:
-                image_data = get_image_from_stage("DANCE_IMAGES", dance['image_filename'])
+            # Try with the dance_images_stage/ prefix first, then without it
+            image_uri = get_image_data_uri(get_first_stage_thumbnail(
+                "DANCE_IMAGES", [f"dance_images_stage/{dance['image_filename']}", dance['image_filename']], width=400
+            ))
 
             image_html = ""
-            if image_data:
-                try:
-                    # Convert image data to base64 for embedding (maintaining original styling)
-                    import base64
-                    import io
-                    from PIL import Image as PILImage
-
-                    # Load image from binary data
-                    img = PILImage.open(io.BytesIO(image_data))
-                    # Resize image
-                    img.thumbnail((400, 250), PILImage.Resampling.LANCZOS)
-
-                    # Convert to base64
-                    buffered = io.BytesIO()
-                    img.save(buffered, format="JPEG")
-                    img_str = base64.b64encode(buffered.getvalue()).decode()
-
-                    image_html = f'<img src="data:image/jpeg;base64,{img_str}" class="dance-card-image" alt="{dance["name"]}">'
-                except:
-                    # Fallback to icon
-                    image_html = f"""
-                    <div class="dance-icon-container">
-                        <span class="dance-icon">{dance['icon']}</span>
-                    </div>
-                    """
+            if image_uri:
+                image_html = f'<img src="{image_uri}" class="dance-card-image" alt="{dance["name"]}">'
             else:
                 # Fallback to icon
                 image_html = f"""
@@ -520,32 +397,8 @@ def show_dance_highlights():
                 """
 
             # ORIGINAL STYLING - Enhanced dance card
-            st.markdown(f"""
-            <div class="enhanced-dance-card">
-                <div class="dance-card-header">
-                    {image_html}
-                    <div class="dance-card-overlay">
-                        <div class="dance-card-category">💃 Dance</div>
-                    </div>
-                </div>
-                <div class="dance-card-content">
-                    <h4 class="dance-card-title">{dance['name']}</h4>
-                    <div class="dance-card-details">
-                        <div class="dance-detail-item">
-                            <span class="detail-icon">📍</span>
-                            <span class="detail-text">{dance['origin']}</span>
-                        </div>
-                        <div class="dance-detail-item">
-                            <span class="detail-icon">🎨</span>
-                            <span class="detail-text">{dance['style']}</span>
-                        </div>
-                    </div>
-                    <p class="dance-card-description">
-                        {dance['description']}
-                    </p>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            show_panel(DANCE_HIGHLIGHT_CARD, image_html=image_html, name=dance['name'], origin=dance['origin'],
+                       style=dance['style'], description=dance['description'])
 
 def create_tourism_story_section(ita_df, tourism_gdp_df, tourism_employment_df):
     """Create a simple tourism trend section"""
@@ -0,0 +1,62 @@
+import streamlit as st
+import re
+from functools import lru_cache
+from string import Template
+
+# Rendered panels kept in memory; reruns with unchanged inputs reuse the same string
+PANEL_CACHE_SIZE = 1024
+
+# Longest string value a memoized panel may take; panels with larger values, such
+# as inline data-URI images, are substituted directly and never enter the cache
+PANEL_CACHE_MAX_VALUE_LENGTH = 512
+
+def compile_panel(source):
+    """Precompile an HTML panel into a string.Template
+
+    The indentation and line breaks of the source are collapsed once here, so
+    the template only has to substitute values when a panel is rendered.
+    Placeholders use string.Template syntax ($name or ${name}); a literal
+    dollar sign is written $$.
+    """
+    return Template(re.sub(r'\s*\n\s*', ' ', source.strip()))
+
+@lru_cache(maxsize=PANEL_CACHE_SIZE)
+def render_panel_values(panel, values):
+    """Substitute a tuple of (name, value) pairs into a precompiled panel"""
+    return panel.substitute(dict(values))
+
+def render_panel(panel, **values):
+    """Render a precompiled panel, memoized on the panel and its input values
+
+    Values are inserted as given (like the f-strings the panels replace), so
+    numbers should be formatted by the caller. They must be hashable. Only
+    panels whose values are small are memoized: hashing a large value costs
+    about as much as the substitution, and the cache is shared by every session.
+    """
+    if any(isinstance(value, str) and len(value) > PANEL_CACHE_MAX_VALUE_LENGTH for value in values.values()):
+        return panel.substitute(values)
+    return render_panel_values(panel, tuple(sorted(values.items())))
+
+def show_panel(panel, **values):
+    """Render a precompiled panel and display it as HTML"""
+    st.markdown(render_panel(panel, **values), unsafe_allow_html=True)
+
+# Gradient tile with a large value, a label and a pill-shaped badge (chapter key metrics)
+BADGE_TILE = compile_panel("""
+<div style="background: linear-gradient(135deg, $gradient); padding: 1.5rem; border-radius: 12px; text-align: center; color: $color; margin-bottom: 1rem;">
+    <h3 style="margin: 0; font-size: $value_size;">$value</h3>
+    <p style="margin: 0.5rem 0; font-size: 0.9rem; opacity: 0.9;">$label</p>
+    <p style="margin: 0; font-size: 0.8rem; background: $badge_background; padding: 0.3rem 0.8rem; border-radius: 15px; display: inline-block;">
+        $badge
+    </p>
+</div>
+""")
+
+# Larger gradient tile with a value, a label and a small note
+STAT_TILE = compile_panel("""
+<div style="background: linear-gradient(135deg, $gradient); padding: 2rem; border-radius: 15px; text-align: center; color: $color;">
+    <h3 style="margin: 0; font-size: 2.5rem;">$value</h3>
+    <p style="margin: 0.5rem 0; font-size: 1rem; opacity: 0.9;">$label</p>
+    <small style="opacity: 0.8;">$note</small>
+</div>
+""")
@@ -0,0 +1,381 @@
+import streamlit as st
+import base64
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, features
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from .data_backend import list_stage_files, read_stage_bytes
+
+# Seconds a stage manifest (one LIST per stage) is reused before it is listed again
+STAGE_MANIFEST_TTL = int(os.environ.get("TOURISM_STAGE_MANIFEST_TTL", "600"))
+
+# Memory budget shared by every cached image across all pages and sessions
+IMAGE_CACHE_BYTES = int(os.environ.get("TOURISM_IMAGE_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+# Thumbnails rendered once per source file and width, shared across sessions and restarts
+THUMBNAIL_DIR = os.environ.get(
+    "TOURISM_THUMBNAIL_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".thumbnails")
+)
+
+# Target widths in pixels; requests are rounded up to the next one so only a few sizes exist per image
+THUMBNAIL_WIDTHS = (400, 800, 1200)
+
+# Preferred thumbnail encoding; falls back to JPEG when Pillow was built without WebP
+THUMBNAIL_FORMAT = os.environ.get("TOURISM_THUMBNAIL_FORMAT", "WEBP").upper()
+THUMBNAIL_QUALITY = int(os.environ.get("TOURISM_THUMBNAIL_QUALITY", "80"))
+
+# Budget for the remembered candidate paths of get_first_stage_thumbnail(), counted in path characters
+RESOLVED_PATHS_BUDGET = int(os.environ.get("TOURISM_RESOLVED_PATHS_BUDGET", str(1024 * 1024)))
+
+# Upper bound on concurrent stage reads issued by prefetch_stage_thumbnails()
+MAX_PARALLEL_IMAGE_FETCHES = int(os.environ.get("TOURISM_MAX_PARALLEL_IMAGE_FETCHES", "8"))
+
+# Short stage names used by the components and their fully qualified stages
+STAGE_NAMES = {
+    "FESTIVAL_IMAGES": '"CULTURE_TOURISM_DB"."ASSETS"."FESTIVAL_IMAGES_STAGE"',
+    "HERITAGE_IMAGES": '"CULTURE_TOURISM_DB"."ASSETS"."HERITAGE_IMAGES_STAGE"',
+    "DANCE_IMAGES": '"CULTURE_TOURISM_DB"."ASSETS"."DANCE_IMAGES_STAGE"'
+}
+
+def get_full_stage_name(stage_name):
+    """Map a short stage name to its fully qualified stage name"""
+    return STAGE_NAMES.get(stage_name, f'"CULTURE_TOURISM_DB"."ASSETS"."{stage_name}_STAGE"')
+
+@st.cache_data(ttl=STAGE_MANIFEST_TTL, show_spinner=False)
+def get_stage_manifest(stage_name):
+    """List a stage once and index its files by path and by file name
+
+    Returns a dict mapping each file's path relative to the stage (and its bare
+    file name) to its size, md5 and last_modified, so existence checks are
+    dictionary lookups instead of a LIST per image. Returns None when the stage
+    could not be listed, which callers treat as unknown rather than empty.
+    """
+    try:
+        result = list_stage_files(get_full_stage_name(stage_name))
+    except Exception as e:
+        print(f"Error listing stage {stage_name}: {e}")
+        return None
+
+    result.columns = [column.strip('"').lower() for column in result.columns]
+    manifest = {}
+    for _, row in result.iterrows():
+        # LIST names are prefixed with the lower-cased stage name, e.g. "festival_images_stage/diwali.jpg"
+        relative_path = row['name'].split('/', 1)[1] if '/' in row['name'] else row['name']
+        info = {
+            "path": relative_path,
+            "size": int(row['size']),
+            "md5": row.get('md5'),
+            "last_modified": row.get('last_modified')
+        }
+        manifest[relative_path] = info
+        manifest.setdefault(relative_path.rsplit('/', 1)[-1], info)
+    return manifest
+
+def get_image_metadata(stage_name, file_path):
+    """Get a staged file's manifest entry, or None if the stage does not contain it or could not be listed"""
+    manifest = get_stage_manifest(stage_name) or {}
+    return manifest.get(file_path) or manifest.get(file_path.rsplit('/', 1)[-1])
+
+def image_exists(stage_name, file_path):
+    """Check whether a file exists in a stage using the cached manifest"""
+    return resolve_stage_file(stage_name, file_path) is not None
+
+class ImageCache:
+    """Least-recently-used cache of image bytes (or any sized values) bounded by a total size budget
+
+    Entries are keyed by (stage path, md5), so the same staged file is held
+    once no matter which page asks for it, and a re-uploaded file gets a new
+    key instead of serving stale bytes.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= len(self.entries.pop(key))
+            self.entries[key] = data
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+@st.cache_resource
+def get_image_cache():
+    """Get the process-wide image cache"""
+    return ImageCache(IMAGE_CACHE_BYTES)
+
+def resolve_stage_file(stage_name, file_path):
+    """Resolve a file to its (stage path, md5), or None if it is known to be missing
+
+    The manifest's path is used so a bare file name resolves to its folder. When
+    the stage could not be listed the file is assumed present with no md5,
+    unless an earlier read of it already failed.
+    """
+    if get_stage_manifest(stage_name) is None:
+        stage_path = f"@{get_full_stage_name(stage_name)}/{file_path}"
+        return None if get_image_cache().get(get_missing_file_key(stage_path)) else (stage_path, None)
+
+    metadata = get_image_metadata(stage_name, file_path)
+    if metadata is None:
+        return None
+    return f"@{get_full_stage_name(stage_name)}/{metadata['path']}", metadata["md5"]
+
+def get_missing_file_key(stage_path):
+    """Get the image cache key recording that a staged file could not be read"""
+    return ("missing", stage_path)
+
+def read_stage_file(cache, stage_path):
+    """Read a staged file's bytes, or None if it cannot be read
+
+    Failed reads are recorded in the cache, so while the stage cannot be listed
+    resolve_stage_file() stops offering the file instead of reading it on every render.
+    """
+    try:
+        image_data = read_stage_bytes(stage_path) or None
+    except Exception as e:
+        print(f"Error reading {stage_path}: {e}")
+        image_data = None
+    if image_data is None:
+        cache.put(get_missing_file_key(stage_path), stage_path)
+    return image_data
+
+def get_stage_image(stage_name, file_path):
+    """Get original image binary data from a Snowflake stage through the shared image cache
+
+    Prefer get_stage_thumbnail for display; originals are only needed on demand.
+    """
+    resolved = resolve_stage_file(stage_name, file_path)
+    if resolved is None:
+        return None
+
+    cache = get_image_cache()
+    image_data = cache.get(resolved)
+    if image_data is not None:
+        return image_data
+
+    image_data = read_stage_file(cache, resolved[0])
+    if image_data:
+        cache.put(resolved, image_data)
+    return image_data
+
+@st.cache_resource
+def get_thumbnail_format():
+    """Get the thumbnail encoding Pillow supports here, as (format, file extension, mime type)"""
+    if THUMBNAIL_FORMAT == "WEBP" and features.check("webp"):
+        return "WEBP", "webp", "image/webp"
+    return "JPEG", "jpg", "image/jpeg"
+
+def get_thumbnail_width(width):
+    """Round a requested width up to the nearest configured thumbnail width"""
+    return next((target for target in THUMBNAIL_WIDTHS if target >= width), THUMBNAIL_WIDTHS[-1])
+
+def render_thumbnail(image_data, width, image_format):
+    """Resize image bytes to at most the given width and re-encode them"""
+    img = Image.open(io.BytesIO(image_data))
+    if img.width > width:
+        img = img.resize((width, round(img.height * width / img.width)), Image.Resampling.LANCZOS)
+    if image_format == "JPEG" and img.mode != "RGB":
+        img = img.convert("RGB")
+    elif img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA")
+
+    buffered = io.BytesIO()
+    img.save(buffered, format=image_format, quality=THUMBNAIL_QUALITY)
+    return buffered.getvalue()
+
+def load_thumbnail(cache, resolved, width, thumbnail_format):
+    """Load a thumbnail for a resolved (stage path, md5) from memory, disk or the stage
+
+    Takes the cache and format explicitly and makes no Streamlit calls, so it
+    can run on background threads that have no script context.
+    """
+    stage_path, md5 = resolved
+    image_format, extension, _ = thumbnail_format
+    cache_key = (stage_path, md5, width, image_format)
+
+    thumbnail = cache.get(cache_key)
+    if thumbnail is not None:
+        return thumbnail
+
+    # Without an md5 the source may change under the same path, so skip the disk cache
+    thumbnail_path = os.path.join(THUMBNAIL_DIR, f"{md5}-{width}.{extension}") if md5 else None
+    if thumbnail_path and os.path.exists(thumbnail_path):
+        with open(thumbnail_path, "rb") as f:
+            thumbnail = f.read()
+        cache.put(cache_key, thumbnail)
+        return thumbnail
+
+    image_data = read_stage_file(cache, stage_path)
+    if not image_data:
+        return None
+
+    try:
+        thumbnail = render_thumbnail(image_data, width, image_format)
+    except Exception as e:
+        print(f"Error creating thumbnail for {stage_path}: {e}")
+        return image_data
+
+    if thumbnail_path:
+        try:
+            os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+            # Write to a temporary file first so concurrent sessions never read a partial thumbnail
+            tmp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(thumbnail)
+            os.replace(tmp_path, thumbnail_path)
+        except OSError as e:
+            print(f"Error writing thumbnail {thumbnail_path}: {e}")
+
+    cache.put(cache_key, thumbnail)
+    return thumbnail
+
+def get_stage_thumbnail(stage_name, file_path, width=400):
+    """Get a resized, re-encoded copy of a staged image for display
+
+    Thumbnails are cached in memory and on disk under the source md5 and target
+    width, so each size is rendered once and the original is only fetched on a
+    miss. Falls back to the original bytes if the image cannot be decoded.
+    """
+    resolved = resolve_stage_file(stage_name, file_path)
+    if resolved is None:
+        return None
+    return load_thumbnail(get_image_cache(), resolved, get_thumbnail_width(width), get_thumbnail_format())
+
+@st.cache_resource
+def get_resolved_paths():
+    """Get the process-wide, size-bounded record of which candidate path resolved for each image"""
+    return ImageCache(RESOLVED_PATHS_BUDGET)
+
+def order_candidates(stage_name, candidates):
+    """Put the candidate path that resolved last time first"""
+    remembered = get_resolved_paths().get((stage_name, tuple(candidates)))
+    if remembered in candidates:
+        return [remembered] + [path for path in candidates if path != remembered]
+    return list(candidates)
+
+def get_first_stage_thumbnail(stage_name, candidates, width=400):
+    """Get the thumbnail for the first of several candidate paths that resolves
+
+    The path that worked is remembered per image, so later calls try it first
+    instead of paying for the failed variants again.
+    """
+    candidates = [path for path in candidates if isinstance(path, str) and path]
+    for file_path in order_candidates(stage_name, candidates):
+        thumbnail = get_stage_thumbnail(stage_name, file_path, width)
+        if thumbnail:
+            get_resolved_paths().put((stage_name, tuple(candidates)), file_path)
+            return thumbnail
+    return None
+
+def get_image_mime(image_data):
+    """Sniff the mime type of image bytes (thumbnails, or originals when resizing failed)"""
+    if image_data[:4] == b"RIFF" and image_data[8:12] == b"WEBP":
+        return "image/webp"
+    if image_data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    return "image/jpeg"
+
+def get_image_data_uri(image_data):
+    """Encode image bytes as a data URI for embedding in HTML, or None if there are none"""
+    if not image_data:
+        return None
+    return f"data:{get_image_mime(image_data)};base64,{base64.b64encode(image_data).decode()}"
+
+def get_stage_thumbnail_uri(stage_name, file_path, width=400):
+    """Get a staged image thumbnail as a data URI for embedding in HTML"""
+    return get_image_data_uri(get_stage_thumbnail(stage_name, file_path, width))
+
+def prefetch_stage_thumbnails(stage_name, file_paths, width=400, max_workers=MAX_PARALLEL_IMAGE_FETCHES):
+    """Warm the image cache with thumbnails for every file a page is about to render
+
+    Uncached files are fetched concurrently on a bounded thread pool, so a page
+    of cards costs roughly one stage round-trip instead of one per card. The
+    cards then read their thumbnails from the cache as usual.
+    """
+    file_paths = list(dict.fromkeys(path for path in file_paths if isinstance(path, str) and path))
+    if not file_paths:
+        return
+
+    # List the stage once up front instead of racing every worker to fill the manifest cache
+    get_stage_manifest(stage_name)
+
+    if len(file_paths) == 1 or max_workers <= 1:
+        for file_path in file_paths:
+            get_stage_thumbnail(stage_name, file_path, width)
+        return
+
+    # Worker threads need the script context for st.cache_data
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths)),
+                            initializer=add_script_run_ctx,
+                            initargs=(None, ctx)) as executor:
+        list(executor.map(lambda file_path: get_stage_thumbnail(stage_name, file_path, width), file_paths))
+
+@st.cache_resource
+def get_prefetch_executor():
+    """Get the process-wide thread pool used for background image prefetching"""
+    return ThreadPoolExecutor(max_workers=MAX_PARALLEL_IMAGE_FETCHES, thread_name_prefix="image-prefetch")
+
+def warm_first_thumbnail(cache, resolved_paths, key, resolved_candidates, width, thumbnail_format):
+    """Load the first resolvable candidate's thumbnail and remember which path worked"""
+    try:
+        for file_path, resolved in resolved_candidates:
+            if load_thumbnail(cache, resolved, width, thumbnail_format):
+                resolved_paths.put(key, file_path)
+                return
+    except Exception as e:
+        # Nothing waits on the prefetch pool's futures, so report failures here
+        print(f"Error prefetching thumbnail for {key[1]}: {e}")
+
+def prefetch_stage_thumbnails_in_background(stage_name, candidate_lists, width=400):
+    """Start fetching thumbnails for upcoming slides without waiting for them
+
+    Each entry lists the candidate paths for one image, as for
+    get_first_stage_thumbnail. Paths are resolved against the stage manifest
+    here, and only the fetch and resize run on the prefetch pool, so the
+    current slide renders without waiting and the next click hits the cache.
+    """
+    cache = get_image_cache()
+    resolved_paths = get_resolved_paths()
+    width = get_thumbnail_width(width)
+    thumbnail_format = get_thumbnail_format()
+    executor = get_prefetch_executor()
+
+    for candidates in candidate_lists:
+        candidates = [path for path in candidates if isinstance(path, str) and path]
+        resolved_candidates = []
+        for file_path in order_candidates(stage_name, candidates):
+            resolved = resolve_stage_file(stage_name, file_path)
+            if resolved is not None:
+                resolved_candidates.append((file_path, resolved))
+        if not resolved_candidates:
+            continue
+
+        stage_path, md5 = resolved_candidates[0][1]
+        if cache.get((stage_path, md5, width, thumbnail_format[0])) is not None:
+            continue
+        executor.submit(warm_first_thumbnail, cache, resolved_paths, (stage_name, tuple(candidates)),
+                        resolved_candidates, width, thumbnail_format)
@@ -0,0 +1,167 @@
+import streamlit as st
+import pandas as pd
+import re
+import unicodedata
+from collections import Counter
+
+# UNESCO site names pinned to the monument names used in the visitor tables;
+# sites not listed here are resolved by their own name
+UNESCO_MONUMENT_MAPPING = {
+    'Taj Mahal': 'Taj Mahal',
+    'Agra Fort': 'Agra Fort',
+    'Fatehpur Sikri': 'Fatehpur Sikri',
+    'Red Fort Complex': 'Red Fort',
+    'Qutb Minar and its Monuments': 'Qutub Minar',
+    'Humayun\'s Tomb': 'Humayun Tomb',
+    'Sun Temple': 'Sun Temple Konark',
+    'Monuments at Mahabalipuram': 'Group of Monuments Mamallapuram',
+    'Ellora Caves': 'Ellora Caves',
+    'Ajanta Caves': 'Ajanta Caves'
+}
+
+# Minimum share of a query's trigrams a candidate must contain to count as a match
+MIN_MATCH_SCORE = 0.8
+
+# Minimum Dice similarity of a match, so a short query does not match any longer name containing it
+MIN_DICE_SCORE = 0.6
+
+# Words that carry no identity in monument names
+STOPWORDS = {'the', 'of', 'and', 'at', 'its', 'in', 'a', 'group', 'monument', 'monuments', 'complex', 'site'}
+
+# Whole-word spellings that the letter rules below do not fold together
+TOKEN_ALIASES = {
+    'mamallapuram': 'mahabalipuram',
+    'konarak': 'konark',
+    'qutb': 'qutub',
+    'st': 'saint',
+    'ft': 'fort'
+}
+
+# Transliteration variants folded to one spelling, applied in order
+TRANSLITERATION_RULES = [(re.compile(pattern), replacement) for pattern, replacement in [
+    (r'ee', 'i'),                   # 'Meenakshi' / 'Minakshi'
+    (r'oo', 'u'),                   # 'Choota' / 'Chuta'
+    (r'([a-z])\1', r'\1'),          # 'Mamallapuram' / 'Mamalapuram'
+    (r'c(?=[aou])', 'k'),           # 'Golconda' / 'Golkonda'
+    (r'(?<=[bdgjkt])h', ''),        # aspirated stops only: 'Bhimbetka' / 'Bimbetka'
+    (r'(?<=[^aeiou])w', 'v'),       # after a consonant: 'Dwarka' / 'Dvarka'
+    (r'q', 'k'),                    # 'Qutub' / 'Kutub'
+    (r'y$', 'i')                    # 'Hampy' / 'Hampi'
+]]
+
+def fold_spelling(token):
+    """Fold transliteration variants of a name token to one spelling"""
+    for pattern, replacement in TRANSLITERATION_RULES:
+        token = pattern.sub(replacement, token)
+    return token
+
+def normalize_monument_name(name):
+    """Normalize a monument name for matching: ASCII, lower case, no punctuation or stopwords, folded spelling"""
+    if not isinstance(name, str):
+        return ''
+    text = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode().lower()
+    text = re.sub(r"'s\b", "", text)
+    tokens = [TOKEN_ALIASES.get(token, token) for token in re.findall(r'[a-z0-9]+', text)]
+    return ' '.join(fold_spelling(token) for token in tokens if token not in STOPWORDS)
+
+def get_trigrams(key):
+    """Character trigrams of each word in a normalized name, padded at word boundaries"""
+    grams = set()
+    for token in key.split():
+        padded = f" {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class MonumentNameResolver:
+    """Approximate monument name lookup over one name column
+
+    Names are normalized once and indexed by character trigram, so a query
+    only scores the candidates sharing a trigram with it instead of scanning
+    every name. A candidate matches when it contains at least MIN_MATCH_SCORE
+    of the query's trigrams and its Dice similarity to the query is at least
+    MIN_DICE_SCORE; ties go to the closest-sized, then earliest, name.
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.keys = [normalize_monument_name(name) for name in self.names]
+        self.grams = [get_trigrams(key) for key in self.keys]
+
+        self.exact = {}
+        self.postings = {}
+        self.resolved = {}
+        for position, (key, grams) in enumerate(zip(self.keys, self.grams)):
+            if key:
+                self.exact.setdefault(key, position)
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(position)
+
+    def resolve(self, name, min_score=MIN_MATCH_SCORE, min_dice=MIN_DICE_SCORE):
+        """Get the row position of the best match for a name, or None"""
+        key = normalize_monument_name(name)
+        if not key:
+            return None
+        if key in self.exact:
+            return self.exact[key]
+        if (key, min_score, min_dice) not in self.resolved:
+            self.resolved[(key, min_score, min_dice)] = self.match(key, min_score, min_dice)
+        return self.resolved[(key, min_score, min_dice)]
+
+    def match(self, key, min_score, min_dice):
+        """Score the candidates sharing a trigram with a normalized name and pick the best"""
+        query = get_trigrams(key)
+        shared = Counter(position for gram in query for position in self.postings.get(gram, ()))
+        if not shared:
+            return None
+
+        def dice(position):
+            return 2 * shared[position] / (len(query) + len(self.grams[position]))
+
+        best = max(shared, key=lambda position: (shared[position], dice(position), -position))
+        if shared[best] / len(query) < min_score or dice(best) < min_dice:
+            return None
+        return best
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_monument_resolver(names):
+    """Get the resolver for a tuple of monument names, built once per distinct name list"""
+    return MonumentNameResolver(names)
+
+def lookup_monument_values(names, monuments_df, name_column, value_column):
+    """Look up a monument table value for each name, NaN where no monument matches"""
+    resolver = get_monument_resolver(tuple(monuments_df[name_column].astype(object)))
+    values = pd.to_numeric(monuments_df[value_column], errors='coerce').to_numpy()
+    positions = [resolver.resolve(name) for name in names]
+    return pd.Series([values[p] if p is not None else float('nan') for p in positions], index=names.index)
+
+@st.cache_data(show_spinner=False)
+def enrich_unesco_visitors(unesco_df, site_column, top_monuments_domestic_df, top_monuments_foreign_df,
+                           centrally_protected_domestic_df, centrally_protected_foreign_df):
+    """Add Domestic_Visitors_Millions and Foreign_Visitors_Lakhs to the UNESCO sites
+
+    Sites are resolved against the top monument tables first, and gaps are
+    filled from the latest year of the centrally protected monuments. Cached on
+    the content of the inputs, so it reruns only when they change.
+    """
+    enriched = unesco_df.reset_index(drop=True)
+    monument_names = enriched[site_column].map(UNESCO_MONUMENT_MAPPING).fillna(enriched[site_column])
+
+    # Add visitor data to UNESCO sites
+    if not top_monuments_domestic_df.empty:
+        enriched['Domestic_Visitors_Millions'] = lookup_monument_values(
+            monument_names, top_monuments_domestic_df, 'MONUMENT_NAME', 'DOMESTIC_TOTAL_VISITS_MILLIONS')
+    if not top_monuments_foreign_df.empty:
+        enriched['Foreign_Visitors_Lakhs'] = lookup_monument_values(
+            monument_names, top_monuments_foreign_df, 'MONUMENT_NAME', 'FOREIGN_TOTAL_VISITS_LAKHS')
+
+    # Fill NaN values from centrally protected monuments data (2023-24), converted to millions and lakhs
+    if not centrally_protected_domestic_df.empty and not centrally_protected_foreign_df.empty:
+        for target_column, protected_df, unit in [
+            ('Domestic_Visitors_Millions', centrally_protected_domestic_df, 1000000),
+            ('Foreign_Visitors_Lakhs', centrally_protected_foreign_df, 100000)
+        ]:
+            fallback = lookup_monument_values(monument_names, protected_df, 'MONUMENT', 'YEAR_2023_24') / unit
+            current = enriched[target_column] if target_column in enriched.columns else pd.Series(float('nan'), index=enriched.index)
+            enriched[target_column] = current.fillna(fallback)
+
+    return enriched
@@ -0,0 +1,50 @@
+import streamlit as st
+from utils.state_dimension import derive_region_6, REGION_5_BY_REGION_6
+
+# Correction from the state arrival tables' units to visitors (they hold ten times the count)
+STATE_ARRIVAL_UNIT_CORRECTION = 0.1
+
+def compute_state_metrics(state_df):
+    """Derive the per-state indicators the pages plot from a state arrivals frame
+
+    Adds NEW_REGION (the five display regions), a unit-corrected <YEAR>_M
+    column in millions for every year column, Growth_2022_23 (NaN without 2022
+    arrivals), and, when 2019 and 2020 are present, Recovery_Rate (2023 vs 2019)
+    and Pandemic_Impact (2020 vs 2019) in percent, zero without 2019 arrivals.
+    The YEAR_<year> columns keep the table's units.
+    """
+    metrics = state_df.copy()
+    if metrics.empty:
+        return metrics
+
+    # Display region from the source region with West & Central split, defaulting to Center
+    metrics['NEW_REGION'] = derive_region_6(metrics).map(REGION_5_BY_REGION_6).fillna('CENTER')
+
+    # Apply the unit correction and convert to millions
+    year_columns = [column for column in metrics.columns if column.startswith('YEAR_')]
+    for column in year_columns:
+        metrics[f'{column}_M'] = metrics[column] * STATE_ARRIVAL_UNIT_CORRECTION / 1_000_000
+
+    # Growth is NaN, not ±inf, for states without arrivals in the base year
+    if 'YEAR_2022' in metrics.columns and 'YEAR_2023' in metrics.columns:
+        base_2022 = metrics['YEAR_2022'].where(metrics['YEAR_2022'] > 0)
+        metrics['Growth_2022_23'] = ((metrics['YEAR_2023'] - metrics['YEAR_2022']) / base_2022) * 100
+
+    if 'YEAR_2019' in metrics.columns and 'YEAR_2020' in metrics.columns:
+        base_2019 = metrics['YEAR_2019'].where(metrics['YEAR_2019'] > 0)
+        metrics['Recovery_Rate'] = (((metrics['YEAR_2023'] - metrics['YEAR_2019']) / base_2019) * 100).fillna(0)
+        metrics['Pandemic_Impact'] = (((metrics['YEAR_2020'] - metrics['YEAR_2019']) / base_2019) * 100).fillna(0)
+
+    return metrics
+
+@st.cache_data(show_spinner=False)
+def get_state_metrics(state_df):
+    """Get the derived state metrics, computed once per version of the input frame"""
+    return compute_state_metrics(state_df)
+
+@st.cache_data(show_spinner=False)
+def get_regional_totals(state_metrics_df, year='YEAR_2023'):
+    """Get a year's arrivals per display region in millions, largest first"""
+    return (state_metrics_df.groupby('NEW_REGION')[f'{year}_M'].sum()
+            .rename_axis('REGION').rename(year).reset_index()
+            .sort_values(year, ascending=False))
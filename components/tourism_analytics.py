@@ -383,13 +383,8 @@ def show_seasonal_patterns(ita_monthly_df, lean_peak_df, monthly_foreigners_df):
     </div>
     """, unsafe_allow_html=True)
 
-    # Clean and prepare data
-    monthly_df = ita_monthly_df.copy()
-
-    # Convert string numbers to numeric (remove commas)
-    for col in ['YEAR_2021', 'YEAR_2022', 'YEAR_2023']:
-        if col in monthly_df.columns:
-            monthly_df[col] = monthly_df[col].astype(str).str.replace(',', '').astype(float)
+    # YEAR_2021..2023 arrive numeric: data_loader parses them once at load time
+    monthly_df = ita_monthly_df
 
     # Add seasonal context section
     st.markdown("""
@@ -5,7 +5,7 @@ from components.data_loader import (
     load_centrally_protected_domestic_data, load_centrally_protected_foreign_data,
     load_tourism_gdp_data, load_tourism_employment_data, load_fee_earnings_data,
     load_india_world_share_data, load_ita_data, load_ita_monthly_data,
-    load_duration_stay_data, load_age_statistics_data, load_all_lean_peak_data,
+    load_duration_stay_data, load_age_statistics_data, load_lean_peak_month_data,
     load_state_tourism_data, load_state_foreign_tourism_data, load_dance_data,
     load_festivals_data
 )
@@ -82,7 +82,7 @@ def show_tourism_storytelling():
         ita_monthly_df = load_ita_monthly_data()
         stay_duration_df = load_duration_stay_data()
         age_statistics_df = load_age_statistics_data()
-        all_lean_peak_data = load_all_lean_peak_data()
+        lean_peak_df = load_lean_peak_month_data()
 
         # Regional data
         state_total_df = load_state_tourism_data()  # This loads total arrivals
@@ -120,7 +120,7 @@ def show_tourism_storytelling():
             ita_monthly_df,
             stay_duration_df,
             age_statistics_df,
-            all_lean_peak_data
+            lean_peak_df
         )
 
     elif selected_chapter == "🗺️ Chapter 4: The Regional Tapestry":
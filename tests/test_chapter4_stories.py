@@ -0,0 +1,31 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("plotly")
+pytest.importorskip("streamlit")
+
+from components import chapter4_regional_tapestry as chapter4
+from components.html_templates import render_panel
+
+
+def test_state_stories_are_displayed(monkeypatch):
+    rendered = []
+    monkeypatch.setattr(chapter4.st, "markdown", lambda body, **kwargs: rendered.append(body))
+
+    champion_states = pd.DataFrame({
+        'STATE': ['Uttar Pradesh', 'Goa'],
+        'REGION': ['NORTH', 'WEST'],
+        'YEAR_2023': [48.0, 8.5]
+    })
+    chapter4.show_state_stories(champion_states)
+
+    assert len(rendered) == 1
+    html = rendered[0]
+    assert html.count(chapter4.STATE_STORY.template.split('$', 1)[0]) == 2
+    assert render_panel(
+        chapter4.STATE_STORY, icon='🕌', state='Uttar Pradesh', title='Heritage Capital',
+        story="Home to the iconic Taj Mahal and Agra Fort, UP dominates with 48.0M visitors. "
+              "The Golden Triangle circuit makes it India's tourism crown jewel.",
+        highlight='Taj Mahal alone attracts 6-8M visitors annually'
+    ) in html
+    assert 'WEST Gem' in html
@@ -0,0 +1,62 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+pytest.importorskip("PIL")
+
+from components import image_assets
+
+
+@pytest.fixture
+def stage(monkeypatch):
+    """A stage whose listing and reads are controlled by the test, with every image cache cleared"""
+    reads = []
+    listing = {"result": pd.DataFrame(columns=["name", "size", "md5", "last_modified"])}
+
+    def list_stage_files(full_stage_name):
+        if isinstance(listing["result"], Exception):
+            raise listing["result"]
+        return listing["result"].copy()
+
+    def read_stage_bytes(stage_path):
+        reads.append(stage_path)
+        raise FileNotFoundError(stage_path)
+
+    monkeypatch.setattr(image_assets, "list_stage_files", list_stage_files)
+    monkeypatch.setattr(image_assets, "read_stage_bytes", read_stage_bytes)
+    image_assets.get_stage_manifest.clear()
+    image_assets.get_image_cache().clear()
+    yield listing, reads
+    image_assets.get_stage_manifest.clear()
+    image_assets.get_image_cache().clear()
+
+
+def test_empty_stage_listing_means_no_files(stage):
+    listing, reads = stage
+
+    assert not image_assets.image_exists("FESTIVAL_IMAGES", "diwali.jpg")
+    assert image_assets.get_stage_thumbnail("FESTIVAL_IMAGES", "diwali.jpg") is None
+    assert reads == []
+
+
+def test_failed_listing_reads_each_missing_file_once(stage):
+    listing, reads = stage
+    listing["result"] = RuntimeError("LIST failed")
+
+    assert image_assets.image_exists("FESTIVAL_IMAGES", "diwali.jpg")
+    for _ in range(3):
+        assert image_assets.get_stage_thumbnail("FESTIVAL_IMAGES", "diwali.jpg") is None
+
+    assert len(reads) == 1
+    assert not image_assets.image_exists("FESTIVAL_IMAGES", "diwali.jpg")
+
+
+def test_listed_files_resolve_to_their_folder(stage):
+    listing, reads = stage
+    listing["result"] = pd.DataFrame([{
+        "name": "festival_images_stage/national/diwali.jpg", "size": 10, "md5": "abc", "last_modified": None
+    }])
+
+    assert image_assets.resolve_stage_file("FESTIVAL_IMAGES", "diwali.jpg") == (
+        '@"CULTURE_TOURISM_DB"."ASSETS"."FESTIVAL_IMAGES_STAGE"/national/diwali.jpg', "abc")
+    assert image_assets.resolve_stage_file("FESTIVAL_IMAGES", "holi.jpg") is None
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+from components.monument_index import UNESCO_MONUMENT_MAPPING, MonumentNameResolver, normalize_monument_name
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+MONUMENT_NAMES = [
+    'Taj Mahal', 'Agra Fort', 'Red Fort', 'Qutub Minar', 'Sun Temple Konark',
+    'Group of Monuments Mamallapuram', 'Ellora Caves', 'Elephanta Caves', 'Fatehpur Sikri',
+    'Humayun Tomb', "Akbar's Tomb Sikandra", 'Golconda Fort', 'Qutb Shahi Tombs', 'Purana Qila',
+    'Safdarjung Tomb', 'Jantar Mantar Delhi', 'Great Stupa Sanchi', 'Dwarkadhish Temple', 'Hampi'
+]
+
+
+def resolved_name(resolver, name):
+    position = resolver.resolve(name)
+    return resolver.names[position] if position is not None else None
+
+
+@pytest.mark.parametrize("query, expected", [
+    ('Red Fort Complex', 'Red Fort'),
+    ('Qutb Minar and its Monuments', 'Qutub Minar'),
+    ("Humayun's Tomb", 'Humayun Tomb'),
+    ('Monuments at Mahabalipuram', 'Group of Monuments Mamallapuram'),
+    ('Golkonda Fort', 'Golconda Fort'),
+    ('Kutub Minar', 'Qutub Minar'),
+    ('Qutub Shahi Tomb', 'Qutb Shahi Tombs'),
+    ('Dvarkadish Temple', 'Dwarkadhish Temple'),
+    ('Hampy', 'Hampi'),
+    ('Elephanta', 'Elephanta Caves')
+])
+def test_known_matches(query, expected):
+    assert resolved_name(MonumentNameResolver(MONUMENT_NAMES), query) == expected
+
+
+@pytest.mark.parametrize("query", [
+    'Ajanta Caves',          # shares 'Caves' with Ellora and Elephanta
+    'Sun Temple Modhera',    # a different Sun Temple
+    'Jantar Mantar Jaipur',  # a different Jantar Mantar
+    'Lal Qila',              # shares 'Qila' with Purana Qila
+    'Jal Mahal',             # shares 'Mahal' with Taj Mahal
+    'Shore Temple',
+    'Sher Shah Tomb',
+    'Tomb',                  # contained in every tomb, but too short for any of them
+    'Taj'
+])
+def test_near_misses_do_not_match(query):
+    assert resolved_name(MonumentNameResolver(MONUMENT_NAMES), query) is None
+
+
+def test_spelling_folds_keep_distinct_sounds():
+    assert normalize_monument_name('Bhimbetka') == normalize_monument_name('Bimbetka')
+    assert normalize_monument_name('Dwarka') == normalize_monument_name('Dvarka')
+    assert normalize_monument_name('Shore Temple') != normalize_monument_name('Sore Temple')
+    assert normalize_monument_name('Hazara') != normalize_monument_name('Hajara')
+    assert normalize_monument_name('Shaniwar Wada') == 'shaniwar wada'
+
+
+@pytest.mark.parametrize("table", ['TOP_MONUMENTS_DOMESTIC_VISITORS', 'TOP_MONUMENTS_FOREIGN_VISITS'])
+def test_unesco_sites_resolve_against_the_top_monuments(table):
+    monuments = pd.read_csv(FIXTURE_DIR / f"{table}.csv")['MONUMENT_NAME']
+    resolver = MonumentNameResolver(monuments)
+    sites = pd.read_csv(FIXTURE_DIR / "UNESCO_SITES.csv")['SITE_NAME']
+
+    for site in sites:
+        expected = UNESCO_MONUMENT_MAPPING.get(site, site)
+        assert resolved_name(resolver, site) == (expected if expected in set(monuments) else None)
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+from components.state_metrics import compute_state_metrics
+from utils.state_dimension import STATE_ROWS, WEST_AND_CENTRAL, WEST_CENTRAL_SPLIT, derive_region_6
+
+FIXTURE_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+STATE_TABLES = ['STATE_TOTAL_TOURIST_ARRIVAL', 'STATE_DOMESTIC_TOURIST_ARRIVAL', 'STATE_FOREIGN_TOURIST_ARRIVAL']
+
+
+@pytest.mark.parametrize("table", STATE_TABLES)
+def test_split_override_agrees_with_source_regions(table):
+    state_df = pd.read_csv(FIXTURE_DIR / f"{table}.csv")
+    source_region = state_df.set_index('STATE')['REGION']
+
+    # Every state is in the dimension table, and every West & Central state is split
+    assert set(source_region.index) <= {row[0] for row in STATE_ROWS}
+    assert set(source_region[source_region == WEST_AND_CENTRAL].index) <= set(WEST_CENTRAL_SPLIT)
+
+    # The override only splits West & Central, it never moves a state out of another region
+    split_states = source_region.reindex(list(WEST_CENTRAL_SPLIT)).dropna()
+    assert (split_states == WEST_AND_CENTRAL).all()
+
+    region_6 = derive_region_6(state_df)
+    assert region_6.notna().all()
+    assert (region_6[state_df['REGION'] != WEST_AND_CENTRAL] == state_df['REGION'][state_df['REGION'] != WEST_AND_CENTRAL]).all()
+
+
+def test_display_regions_follow_the_split():
+    state_df = pd.DataFrame({
+        'STATE': ['Gujarat', 'Madhya Pradesh', 'Assam', 'Kerala', 'Nowhere'],
+        'REGION': [WEST_AND_CENTRAL, WEST_AND_CENTRAL, 'NORTH EAST', 'SOUTH', WEST_AND_CENTRAL],
+        'YEAR_2023': [1.0, 1.0, 1.0, 1.0, 1.0]
+    })
+    metrics = compute_state_metrics(state_df).set_index('STATE')
+
+    assert metrics['NEW_REGION'].to_dict() == {
+        'Gujarat': 'WEST',
+        'Madhya Pradesh': 'CENTER',
+        'Assam': 'EAST',
+        'Kerala': 'SOUTH',
+        'Nowhere': 'CENTER'
+    }
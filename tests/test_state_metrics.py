@@ -0,0 +1,28 @@
+import math
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+from components.state_metrics import compute_state_metrics
+
+
+def test_growth_is_nan_without_base_year_arrivals():
+    state_df = pd.DataFrame({
+        'STATE': ['Goa', 'Ladakh', 'Lakshadweep'],
+        'REGION': ['WEST & CENTRAL', 'NORTH', 'SOUTH'],
+        'YEAR_2019': [100.0, 0.0, 50.0],
+        'YEAR_2020': [40.0, 10.0, 20.0],
+        'YEAR_2022': [80.0, 0.0, 0.0],
+        'YEAR_2023': [120.0, 30.0, 0.0]
+    })
+    metrics = compute_state_metrics(state_df).set_index('STATE')
+
+    assert metrics.loc['Goa', 'Growth_2022_23'] == 50.0
+    assert math.isnan(metrics.loc['Ladakh', 'Growth_2022_23'])
+    assert math.isnan(metrics.loc['Lakshadweep', 'Growth_2022_23'])
+    assert metrics.loc['Ladakh', 'Recovery_Rate'] == 0
+    assert metrics.loc['Ladakh', 'Pandemic_Impact'] == 0
+    assert not metrics[['Growth_2022_23', 'Recovery_Rate', 'Pandemic_Impact']].isin([math.inf, -math.inf]).any().any()
+    assert metrics.loc['Goa', 'YEAR_2023_M'] == pytest.approx(120.0 * 0.1 / 1_000_000)
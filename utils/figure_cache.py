@@ -0,0 +1,30 @@
+import streamlit as st
+import os
+import json
+from functools import wraps
+
+# Serialized figures kept per process, across builders, data versions and chart parameters
+FIGURE_CACHE_ENTRIES = int(os.environ.get("TOURISM_FIGURE_CACHE_ENTRIES", "128"))
+
+def cached_figure(builder):
+    """Cache a Plotly figure builder on its data version and chart parameters
+
+    The built figure is stored as JSON with st.cache_data, keyed on the
+    builder (its module, name and source) and its arguments: DataFrames are
+    hashed by content, so a new data load is a new version, while a rerun
+    over the same data skips the builder and its trace computations. Every
+    call returns a new figure dict parsed from the JSON, which st.plotly_chart
+    accepts as is, so no Figure is rebuilt on the way in. Arguments must be
+    hashable by Streamlit (frames, scalars, tuples, lists).
+    """
+    # wraps() gives the cache the builder's name and source, so each builder keeps its own entries
+    @st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+    @wraps(builder)
+    def build_figure_json(*args, **kwargs):
+        return builder(*args, **kwargs).to_json()
+
+    @wraps(builder)
+    def get_figure(*args, **kwargs):
+        return json.loads(build_figure_json(*args, **kwargs))
+
+    return get_figure
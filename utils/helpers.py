@@ -5,6 +5,8 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from PIL import Image
 import os
+from utils.state_dimension import join_state_dimension
+from utils.figure_cache import cached_figure
 
 def display_image_safely(image_path, caption="", width=None):
     """Safely display image with error handling"""
@@ -17,190 +19,115 @@ def display_image_safely(image_path, caption="", width=None):
     except Exception as e:
         st.error(f"Error loading image: {e}")
 
+MAP_YEAR_COLUMNS = ['YEAR_2017', 'YEAR_2018', 'YEAR_2019', 'YEAR_2020', 'YEAR_2021', 'YEAR_2022', 'YEAR_2023']
+
+@st.cache_data(show_spinner=False)
+def build_state_map_frame(state_tourism_df):
+    """Build the per-state map frame with column-wise totals, averages and growth
+
+    Computed in one vectorized pass and cached on the content hash of the input,
+    so reruns and larger (e.g. district-level) inputs do not loop row by row.
+    """
+    year_columns = [col for col in MAP_YEAR_COLUMNS if col in state_tourism_df.columns]
+    states = state_tourism_df['STATE'].astype(str)
+
+    # Calculate total across all years (missing years count as zero) and average per year
+    total_all_years = state_tourism_df[year_columns].sum(axis=1, skipna=True)
+    avg_per_year = total_all_years / len(MAP_YEAR_COLUMNS)
+
+    # Calculate recent growth (2022 to 2023), zero where 2022 has no arrivals
+    tourism_2023 = state_tourism_df['YEAR_2023']
+    tourism_2022 = state_tourism_df['YEAR_2022']
+    growth = ((tourism_2023 - tourism_2022) / tourism_2022 * 100).where(tourism_2022 > 0, 0)
+
+    # GeoJSON names and coordinates from the state dimension table (NaN coordinates for unknown states)
+    dimension = join_state_dimension(state_tourism_df, ['GEOJSON_NAME', 'LAT', 'LON'])
+
+    map_df = pd.DataFrame({
+        'State': states,
+        'State_Mapped': dimension['GEOJSON_NAME'].fillna(states),
+        'Tourism_2023': tourism_2023,
+        'Tourism_2022': tourism_2022,
+        'Total_All_Years': total_all_years,
+        'Avg_Per_Year': avg_per_year,
+        'Growth_2022_23': growth,
+        'Region': state_tourism_df['REGION'],
+        'lat': dimension['LAT'],
+        'lon': dimension['LON']
+    }).reset_index(drop=True)
+    return map_df
+
 def create_india_map(state_tourism_df):
     """Create an interactive choropleth map of India with tourism data"""
+    if state_tourism_df.empty:
+        st.warning("Unable to create map - tourism data not available")
+        return
+
+    # Use scatter map for Snowflake compatibility
+    create_fallback_scatter_map(build_state_map_frame(state_tourism_df))
+
+@cached_figure
+def build_state_scatter_map(map_df):
+    """Build the scatter map of total arrivals per state"""
+    fig = px.scatter_map(
+        map_df,
+        lat='lat',
+        lon='lon',
+        size='Total_All_Years',
+        color='Total_All_Years',
+        hover_name='State',
+        hover_data={
+            'Total_All_Years': ':,.1f',
+            'Region': True,
+            'lat': False,
+            'lon': False,
+            'Tourism_2023': False,
+            'Tourism_2022': False,
+            'Avg_Per_Year': False,
+            'Growth_2022_23': False
+        },
+        color_continuous_scale=[[0, '#E8F5E8'], [0.2, '#B8E6B8'], [0.4, '#7DD87D'], [0.6, '#4CAF50'], [0.8, '#2E7D32'], [1, '#1B5E20']],
+        size_max=30,
+        zoom=4,
+        center={'lat': 20.5937, 'lon': 78.9629},
+        title='🗺️ India Tourism Map - Total Tourist Arrivals (2017-2023)',
+        labels={
+            'Total_All_Years': 'Total Tourists (M)'
+        }
+    )
 
-    # State name mapping for GeoJSON compatibility
-    state_name_mapping = {
-        'Andhra Pradesh': 'Andhra Pradesh',
-        'Arunachal Pradesh': 'Arunachal Pradesh',
-        'Assam': 'Assam',
-        'Bihar': 'Bihar',
-        'Chhattisgarh': 'Chhattisgarh',
-        'Goa': 'Goa',
-        'Gujarat': 'Gujarat',
-        'Haryana': 'Haryana',
-        'Himachal Pradesh': 'Himachal Pradesh',
-        'Jharkhand': 'Jharkhand',
-        'Karnataka': 'Karnataka',
-        'Kerala': 'Kerala',
-        'Madhya Pradesh': 'Madhya Pradesh',
-        'Maharashtra': 'Maharashtra',
-        'Manipur': 'Manipur',
-        'Meghalaya': 'Meghalaya',
-        'Mizoram': 'Mizoram',
-        'Nagaland': 'Nagaland',
-        'Odisha': 'Odisha',
-        'Punjab': 'Punjab',
-        'Rajasthan': 'Rajasthan',
-        'Sikkim': 'Sikkim',
-        'Tamil Nadu': 'Tamil Nadu',
-        'Telangana': 'Telangana',
-        'Tripura': 'Tripura',
-        'Uttar Pradesh': 'Uttar Pradesh',
-        'Uttarakhand': 'Uttarakhand',
-        'West Bengal': 'West Bengal',
-        'Andaman & Nicobar Island': 'Andaman & Nicobar',
-        'Chandigarh': 'Chandigarh',
-        'Dadra & Nagar Haveli': 'Dadra and Nagar Haveli and Daman and Diu',
-        'Delhi': 'Delhi',
-        'Jammu & Kashmir': 'Jammu & Kashmir',
-        'Ladakh': 'Ladakh',
-        'Lakshadweep': 'Lakshadweep',
-        'Puducherry': 'Puducherry'
-    }
-
-    # Prepare map data with total tourism across all years (2017-2023)
-    map_data = []
-    year_columns = ['YEAR_2017', 'YEAR_2018', 'YEAR_2019', 'YEAR_2020', 'YEAR_2021', 'YEAR_2022', 'YEAR_2023']
-
-    for idx, row in state_tourism_df.iterrows():
-        state_name = row['STATE']
-
-        # Calculate total across all years
-        total_all_years = sum([row[col] for col in year_columns if col in row and pd.notna(row[col])])
-
-        # Calculate recent growth (2022 to 2023)
-        growth = ((row['YEAR_2023'] - row['YEAR_2022']) / row['YEAR_2022']) * 100 if row['YEAR_2022'] > 0 else 0
-
-        # Calculate average per year
-        avg_per_year = total_all_years / len(year_columns)
-
-        map_data.append({
-            'State': state_name,
-            'State_Mapped': state_name_mapping.get(state_name, state_name),
-            'Tourism_2023': row['YEAR_2023'],
-            'Tourism_2022': row['YEAR_2022'],
-            'Total_All_Years': total_all_years,
-            'Avg_Per_Year': avg_per_year,
-            'Growth_2022_23': growth,
-            'Region': row['REGION']
-        })
-
-    if map_data:
-        map_df = pd.DataFrame(map_data)
-
-        # Use scatter map for Snowflake compatibility
-        create_fallback_scatter_map(map_df)
-
+    fig.update_layout(
+        height=600,
+        font=dict(size=12),
+        title=dict(
+            text='🗺️ India Tourism Map - Total Tourist Arrivals (2017-2023)',
+            font=dict(size=18, color='#008080', family="Arial Black"),
+            x=0.5,
+            y=0.95
+        ),
+        margin={"r":0,"t":60,"l":0,"b":0},
+        coloraxis_colorbar=dict(
+            title=dict(
+                text="Total Tourists<br>2017-2023 (Million)",
+                font=dict(size=14, color='#008080', family="Arial Black")
+            ),
+            tickfont=dict(size=11, color='#008080', family="Arial"),
+            thickness=15,
+            len=0.7,
+            x=1.02
+        )
+    )
 
-    else:
-        st.warning("Unable to create map - tourism data not available")
+    return fig
 
 def create_fallback_scatter_map(map_df):
     """Create interactive scatter map for tourism data"""
 
-    # State coordinates for scatter map
-    state_coordinates = {
-        'Andhra Pradesh': [15.9129, 79.7400],
-        'Arunachal Pradesh': [28.2180, 94.7278],
-        'Assam': [26.2006, 92.9376],
-        'Bihar': [25.0961, 85.3131],
-        'Chhattisgarh': [21.2787, 81.8661],
-        'Goa': [15.2993, 74.1240],
-        'Gujarat': [23.0225, 72.5714],
-        'Haryana': [29.0588, 76.0856],
-        'Himachal Pradesh': [31.1048, 77.1734],
-        'Jharkhand': [23.6102, 85.2799],
-        'Karnataka': [15.3173, 75.7139],
-        'Kerala': [10.8505, 76.2711],
-        'Madhya Pradesh': [22.9734, 78.6569],
-        'Maharashtra': [19.7515, 75.7139],
-        'Manipur': [24.6637, 93.9063],
-        'Meghalaya': [25.4670, 91.3662],
-        'Mizoram': [23.1645, 92.9376],
-        'Nagaland': [26.1584, 94.5624],
-        'Odisha': [20.9517, 85.0985],
-        'Punjab': [31.1471, 75.3412],
-        'Rajasthan': [27.0238, 74.2179],
-        'Sikkim': [27.5330, 88.5122],
-        'Tamil Nadu': [11.1271, 78.6569],
-        'Telangana': [18.1124, 79.0193],
-        'Tripura': [23.9408, 91.9882],
-        'Uttar Pradesh': [26.8467, 80.9462],
-        'Uttarakhand': [30.0668, 79.0193],
-        'West Bengal': [22.9868, 87.8550],
-        'Andaman and Nicobar Islands': [11.7401, 92.6586],
-        'Chandigarh': [30.7333, 76.7794],
-        'Dadra and Nagar Haveli and Daman and Diu': [20.1809, 73.0169],
-        'Delhi': [28.7041, 77.1025],
-        'Jammu and Kashmir': [34.0837, 74.7973],
-        'Ladakh': [34.1526, 77.5771],
-        'Lakshadweep': [10.5667, 72.6417],
-        'Puducherry': [11.9416, 79.8083]
-    }
-
-    # Add coordinates to map data
-    for idx, row in map_df.iterrows():
-        state_name = row['State']
-        if state_name in state_coordinates:
-            map_df.at[idx, 'lat'] = state_coordinates[state_name][0]
-            map_df.at[idx, 'lon'] = state_coordinates[state_name][1]
-
     # Filter out states without coordinates
     map_df = map_df.dropna(subset=['lat', 'lon'])
 
     if not map_df.empty:
-        fig = px.scatter_map(
-            map_df,
-            lat='lat',
-            lon='lon',
-            size='Total_All_Years',
-            color='Total_All_Years',
-            hover_name='State',
-            hover_data={
-                'Total_All_Years': ':,.1f',
-                'Region': True,
-                'lat': False,
-                'lon': False,
-                'Tourism_2023': False,
-                'Tourism_2022': False,
-                'Avg_Per_Year': False,
-                'Growth_2022_23': False
-            },
-            color_continuous_scale=[[0, '#E8F5E8'], [0.2, '#B8E6B8'], [0.4, '#7DD87D'], [0.6, '#4CAF50'], [0.8, '#2E7D32'], [1, '#1B5E20']],
-            size_max=30,
-            zoom=4,
-            center={'lat': 20.5937, 'lon': 78.9629},
-            title='🗺️ India Tourism Map - Total Tourist Arrivals (2017-2023)',
-            labels={
-                'Total_All_Years': 'Total Tourists (M)'
-            }
-        )
-
-        fig.update_layout(
-            height=600,
-            font=dict(size=12),
-            title=dict(
-                text='🗺️ India Tourism Map - Total Tourist Arrivals (2017-2023)',
-                font=dict(size=18, color='#008080', family="Arial Black"),
-                x=0.5,
-                y=0.95
-            ),
-            margin={"r":0,"t":60,"l":0,"b":0},
-            coloraxis_colorbar=dict(
-                title=dict(
-                    text="Total Tourists<br>2017-2023 (Million)",
-                    font=dict(size=14, color='#008080', family="Arial Black")
-                ),
-                tickfont=dict(size=11, color='#008080', family="Arial"),
-                thickness=15,
-                len=0.7,
-                x=1.02
-            )
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_state_scatter_map(map_df), use_container_width=True)
 
         st.markdown("""
         <div style="background-color: #f0f0f0; padding: 6px; border-radius: 5px; margin: 8px 0;">
@@ -210,6 +137,7 @@ def create_fallback_scatter_map(map_df):
         </div>
         """, unsafe_allow_html=True)
 
+@cached_figure
 def create_enhanced_tourism_chart(ita_df):
     """Create an enhanced tourism growth chart"""
 
@@ -330,6 +258,7 @@ def create_enhanced_tourism_chart(ita_df):
 
     return fig
 
+@cached_figure
 def create_tourism_growth_trend_chart(ita_df):
     """Create enhanced tourism growth trend chart with attractive styling"""
 
@@ -434,6 +363,7 @@ def create_tourism_growth_trend_chart(ita_df):
 
     return fig
 
+@cached_figure
 def create_year_over_year_growth_chart(ita_df):
     """Create year-over-year growth chart"""
 
@@ -492,6 +422,7 @@ def create_year_over_year_growth_chart(ita_df):
 
     return fig
 
+@cached_figure
 def create_decade_comparison_chart(ita_df):
     """Create decade comparison chart"""
 
@@ -551,6 +482,7 @@ def create_decade_comparison_chart(ita_df):
 
     return fig
 
+@cached_figure
 def create_gdp_contribution_chart(tourism_gdp_df):
     """Create GDP contribution chart"""
 
@@ -618,6 +550,7 @@ def create_gdp_contribution_chart(tourism_gdp_df):
 
     return fig
 
+@cached_figure
 def create_employment_trends_chart(tourism_employment_df):
     """Create employment trends chart"""
 
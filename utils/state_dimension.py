@@ -0,0 +1,83 @@
+import streamlit as st
+import pandas as pd
+
+# One row per state/UT, keyed by the name used in the arrival tables:
+# (STATE, GEOJSON_NAME, LAT, LON). Regions come from the tables' REGION column.
+STATE_ROWS = [
+    ('Andhra Pradesh', 'Andhra Pradesh', 15.9129, 79.7400),
+    ('Arunachal Pradesh', 'Arunachal Pradesh', 28.2180, 94.7278),
+    ('Assam', 'Assam', 26.2006, 92.9376),
+    ('Bihar', 'Bihar', 25.0961, 85.3131),
+    ('Chhattisgarh', 'Chhattisgarh', 21.2787, 81.8661),
+    ('Goa', 'Goa', 15.2993, 74.1240),
+    ('Gujarat', 'Gujarat', 23.0225, 72.5714),
+    ('Haryana', 'Haryana', 29.0588, 76.0856),
+    ('Himachal Pradesh', 'Himachal Pradesh', 31.1048, 77.1734),
+    ('Jharkhand', 'Jharkhand', 23.6102, 85.2799),
+    ('Karnataka', 'Karnataka', 15.3173, 75.7139),
+    ('Kerala', 'Kerala', 10.8505, 76.2711),
+    ('Madhya Pradesh', 'Madhya Pradesh', 22.9734, 78.6569),
+    ('Maharashtra', 'Maharashtra', 19.7515, 75.7139),
+    ('Manipur', 'Manipur', 24.6637, 93.9063),
+    ('Meghalaya', 'Meghalaya', 25.4670, 91.3662),
+    ('Mizoram', 'Mizoram', 23.1645, 92.9376),
+    ('Nagaland', 'Nagaland', 26.1584, 94.5624),
+    ('Odisha', 'Odisha', 20.9517, 85.0985),
+    ('Punjab', 'Punjab', 31.1471, 75.3412),
+    ('Rajasthan', 'Rajasthan', 27.0238, 74.2179),
+    ('Sikkim', 'Sikkim', 27.5330, 88.5122),
+    ('Tamil Nadu', 'Tamil Nadu', 11.1271, 78.6569),
+    ('Telangana', 'Telangana', 18.1124, 79.0193),
+    ('Tripura', 'Tripura', 23.9408, 91.9882),
+    ('Uttar Pradesh', 'Uttar Pradesh', 26.8467, 80.9462),
+    ('Uttarakhand', 'Uttarakhand', 30.0668, 79.0193),
+    ('West Bengal', 'West Bengal', 22.9868, 87.8550),
+    ('Andaman & Nicobar Island', 'Andaman & Nicobar', 11.7401, 92.6586),
+    ('Chandigarh', 'Chandigarh', 30.7333, 76.7794),
+    ('Dadra & Nagar Haveli', 'Dadra and Nagar Haveli and Daman and Diu', 20.1809, 73.0169),
+    ('Delhi', 'Delhi', 28.7041, 77.1025),
+    ('Jammu & Kashmir', 'Jammu & Kashmir', 34.0837, 74.7973),
+    ('Ladakh', 'Ladakh', 34.1526, 77.5771),
+    ('Lakshadweep', 'Lakshadweep', 10.5667, 72.6417),
+    ('Puducherry', 'Puducherry', 11.9416, 79.8083)
+]
+
+# Source region that the six-region taxonomy splits into WEST and CENTRAL
+WEST_AND_CENTRAL = 'WEST & CENTRAL'
+
+# The only regional override: where each WEST & CENTRAL state falls in the split
+WEST_CENTRAL_SPLIT = {
+    'Goa': 'WEST',
+    'Gujarat': 'WEST',
+    'Maharashtra': 'WEST',
+    'Dadra & Nagar Haveli': 'WEST',
+    'Chhattisgarh': 'CENTRAL',
+    'Madhya Pradesh': 'CENTRAL'
+}
+
+# Six regions folded into the five display regions: North East joins East, Central becomes Center
+REGION_5_BY_REGION_6 = {
+    'NORTH': 'NORTH',
+    'NORTH EAST': 'EAST',
+    'EAST': 'EAST',
+    'SOUTH': 'SOUTH',
+    'WEST': 'WEST',
+    'CENTRAL': 'CENTER'
+}
+
+@st.cache_data(show_spinner=False)
+def get_state_dimension():
+    """Get the state dimension table indexed by STATE, with GEOJSON_NAME, LAT and LON"""
+    dimension = pd.DataFrame(STATE_ROWS, columns=['STATE', 'GEOJSON_NAME', 'LAT', 'LON'])
+    return dimension.set_index('STATE')
+
+def join_state_dimension(df, columns, state_column='STATE'):
+    """Return the frame with state dimension columns joined on by state name (NaN for unknown states)"""
+    attributes = get_state_dimension()[columns].reindex(df[state_column].astype(str))
+    return df.assign(**{column: attributes[column].to_numpy() for column in columns})
+
+def derive_region_6(df, state_column='STATE', region_column='REGION'):
+    """Return the six-region series for a frame: its source REGION, with WEST & CENTRAL split (NaN for unsplit states)"""
+    source_region = df[region_column].astype(str)
+    split_region = df[state_column].astype(str).map(WEST_CENTRAL_SPLIT)
+    return source_region.where(source_region != WEST_AND_CENTRAL, split_region)